@@ -0,0 +1,91 @@
+import statistics
+import sys
+import tempfile
+
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+
+ROOT = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(ROOT))
+
+import httpx  # noqa: E402
+
+from loguru import logger  # noqa: E402
+
+from api import api_router  # noqa: E402
+from core.app import create_app  # noqa: E402
+from database.model import CoreModel  # noqa: E402
+from database.session import SessionManager, session_manager  # noqa: E402
+
+logger.remove()
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(values: list[float]) -> dict[str, float]:
+    return {
+        "count": len(values),
+        "mean_ms": statistics.fmean(values) * 1000 if values else 0.0,
+        "p50_ms": percentile(values, 50) * 1000,
+        "p95_ms": percentile(values, 95) * 1000,
+        "p99_ms": percentile(values, 99) * 1000,
+    }
+
+
+@asynccontextmanager
+async def app_client(
+    database_url: str | None = None,
+    seed: Optional[Callable[[SessionManager], Awaitable[None]]] = None,
+):
+    with tempfile.TemporaryDirectory() as tmp:
+        url = database_url or f"sqlite+aiosqlite:///{tmp}/bench.db"
+        manager = SessionManager(url)
+        async with manager.engine.begin() as conn:
+            await conn.run_sync(CoreModel.metadata.create_all)
+        if seed is not None:
+            await seed(manager)
+
+        app = create_app()
+        app.include_router(api_router)
+        app.dependency_overrides[session_manager.session_scope] = manager.session_scope
+        app.dependency_overrides[session_manager.read_session_scope] = (
+            manager.read_session_scope
+        )
+        app.dependency_overrides[session_manager.primary_read_session_scope] = (
+            manager.primary_read_session_scope
+        )
+        app.dependency_overrides[session_manager.read_session_factory] = lambda: (
+            manager.read_session
+        )
+
+        transport = httpx.ASGITransport(app=app)
+        try:
+            async with httpx.AsyncClient(
+                transport=transport, base_url="https://bench"
+            ) as client:
+                yield client
+        finally:
+            await manager.dispose()
+
+
+async def register(client: httpx.AsyncClient, name: str, password: str) -> None:
+    response = await client.post(
+        "/api/v1/auth/register",
+        json={"name": name, "email": f"{name}@example.com", "password": password},
+    )
+    response.raise_for_status()
+
+
+async def login(client: httpx.AsyncClient, name: str, password: str) -> dict:
+    response = await client.post(
+        "/api/v1/auth/token", data={"username": name, "password": password}
+    )
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
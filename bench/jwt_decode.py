@@ -0,0 +1,49 @@
+"""Single-core throughput of decode_jwt: full RS256 verification vs cache hits.
+
+python bench/jwt_decode.py --tokens 1000 --rounds 5
+"""
+
+import argparse
+import time
+
+from datetime import timedelta
+
+import common  # noqa: F401
+
+from api.v1.auth.utils import decode_jwt, encode_jwt, token_cache
+
+
+def throughput(tokens: list[str], rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for token in tokens:
+            decode_jwt(token)
+    return rounds * len(tokens) / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tokens", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    tokens = [
+        encode_jwt({"sub": str(index), "type": "access"}, timedelta(minutes=15))
+        for index in range(args.tokens)
+    ]
+
+    maxsize = token_cache.maxsize
+    token_cache.maxsize = 0
+    cold = throughput(tokens, args.rounds)
+    token_cache.maxsize = maxsize
+
+    throughput(tokens, 1)
+    cached = throughput(tokens, args.rounds)
+
+    print(f"  cold: {cold:>12,.0f} decodes/s")
+    print(f"cached: {cached:>12,.0f} decodes/s ({cached / cold:.1f}x)")
+    print(f" cache: {token_cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Per-request cost of logging: disabled vs development vs production sinks.
+
+Half of the requests hit a missing board, so every mode also handles a
+404 storm from a single call site.
+
+python bench/logging_overhead.py --requests 2000
+"""
+
+import argparse
+import asyncio
+import contextlib
+import os
+import sys
+import tempfile
+import time
+
+from uuid import uuid4
+
+from common import app_client, login, register, summarize
+from loguru import logger
+
+from core.logger import logger_init, production_logger_init
+
+PASSWORD = "correct horse battery staple"
+
+
+@contextlib.contextmanager
+def logging_mode(mode: str):
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as devnull:
+        stderr, sys.stderr = sys.stderr, devnull
+        try:
+            if mode == "development":
+                logger_init(log_dir=tmp)
+            elif mode == "production":
+                production_logger_init(path=os.devnull)
+            else:
+                logger.remove()
+            yield
+        finally:
+            logger.remove()
+            sys.stderr = stderr
+
+
+async def run(requests: int) -> list[float]:
+    async with app_client() as client:
+        await register(client, "reader", PASSWORD)
+        headers = await login(client, "reader", PASSWORD)
+        await client.post("/api/v1/board/", params={"title": "b"}, headers=headers)
+        missing = f"/api/v1/board/{uuid4()}"
+
+        latencies = []
+        for index in range(requests):
+            path = "/api/v1/board/" if index % 2 else missing
+            started = time.perf_counter()
+            await client.get(path, headers=headers)
+            latencies.append(time.perf_counter() - started)
+        return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    results = {}
+    for mode in ("off", "development", "production"):
+        with logging_mode(mode):
+            results[mode] = summarize(asyncio.run(run(args.requests)))
+
+    baseline = results["off"]["mean_ms"]
+    for mode, result in results.items():
+        print(
+            f"{mode:>11}: mean={result['mean_ms']:.3f}ms "
+            f"p99={result['p99_ms']:.3f}ms "
+            f"overhead={(result['mean_ms'] - baseline) * 1000:+.0f}us/request"
+        )
+
+
+if __name__ == "__main__":
+    main()
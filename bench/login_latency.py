@@ -0,0 +1,70 @@
+"""p99 latency of GET /board/ while bcrypt logins are in flight.
+
+python bench/login_latency.py --logins 8 --duration 5
+"""
+
+import argparse
+import asyncio
+import time
+
+from common import app_client, login, register, summarize
+
+from api.v1.auth.hashing import password_hasher
+
+PASSWORD = "correct horse battery staple"
+
+
+async def run(logins: int, duration: float) -> dict:
+    async with app_client() as client:
+        for index in range(logins):
+            await register(client, f"login{index}", PASSWORD)
+        await register(client, "reader", PASSWORD)
+        headers = await login(client, "reader", PASSWORD)
+        for index in range(10):
+            await client.post(
+                "/api/v1/board/", params={"title": f"b{index}"}, headers=headers
+            )
+
+        deadline = time.perf_counter() + duration
+        latencies: list[float] = []
+        completed_logins = 0
+
+        async def reader():
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                response = await client.get("/api/v1/board/", headers=headers)
+                latencies.append(time.perf_counter() - started)
+                response.raise_for_status()
+
+        async def logger_in(index: int):
+            nonlocal completed_logins
+            while time.perf_counter() < deadline:
+                await login(client, f"login{index}", PASSWORD)
+                completed_logins += 1
+
+        await asyncio.gather(reader(), *(logger_in(i) for i in range(logins)))
+        return {"logins": completed_logins, **summarize(latencies)}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logins", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=5.0)
+    args = parser.parse_args()
+
+    executor = password_hasher.executor
+    password_hasher.executor = None
+    inline = asyncio.run(run(args.logins, args.duration))
+    password_hasher.executor = executor
+    pooled = asyncio.run(run(args.logins, args.duration))
+
+    for label, result in (("inline", inline), ("pooled", pooled)):
+        print(
+            f"{label:>7}: {result['logins']:>5} logins  "
+            f"GET /board/ p50={result['p50_ms']:.1f}ms "
+            f"p99={result['p99_ms']:.1f}ms ({result['count']} requests)"
+        )
+
+
+if __name__ == "__main__":
+    main()
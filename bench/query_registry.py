@@ -0,0 +1,143 @@
+"""Per-call cost of the hot lookups: inline select() vs the query registry.
+
+python bench/query_registry.py --calls 5000
+
+"prepare" is statement construction plus cache-key generation, the part
+the registry removes; "execute" is a full round trip on in-memory SQLite.
+"""
+
+import argparse
+import asyncio
+import time
+
+from uuid import uuid4
+
+import common  # noqa: F401
+
+from sqlalchemy import lambda_stmt, select
+
+from database.model import Board, CoreModel, Role, User, UserUsingBoard
+from database.queries import BOARD_ROLE, EMAIL_TAKEN, USER_LOGIN
+from database.session import SessionManager
+
+NAME = "bench"
+EMAIL = "bench@example.com"
+
+
+def inline(user_id, board_id):
+    # The statements as the endpoints built them before the registry.
+    return {
+        "user by name": lambda: (select(User).where(User.name == NAME), None),
+        "email taken": lambda: (select(User).where(User.email == EMAIL), None),
+        "board role": lambda: (
+            select(UserUsingBoard).where(
+                UserUsingBoard.board_id == board_id,
+                UserUsingBoard.user_id == user_id,
+            ),
+            None,
+        ),
+    }
+
+
+def lambdas(user_id, board_id):
+    return {
+        "user by name": lambda: (
+            lambda_stmt(lambda: select(User).where(User.name == NAME)),
+            None,
+        ),
+        "email taken": lambda: (
+            lambda_stmt(lambda: select(User).where(User.email == EMAIL)),
+            None,
+        ),
+        "board role": lambda: (
+            lambda_stmt(
+                lambda: select(UserUsingBoard.role).where(
+                    UserUsingBoard.board_id == board_id,
+                    UserUsingBoard.user_id == user_id,
+                )
+            ),
+            None,
+        ),
+    }
+
+
+def registry(user_id, board_id):
+    return {
+        "user by name": lambda: (USER_LOGIN, {"name": NAME}),
+        "email taken": lambda: (EMAIL_TAKEN, {"email": EMAIL}),
+        "board role": lambda: (
+            BOARD_ROLE,
+            {"user_id": user_id, "board_id": board_id},
+        ),
+    }
+
+
+VARIANTS = {"inline": inline, "lambda": lambdas, "registry": registry}
+
+
+def prepare_cost(build, user_id, board_id, calls: int) -> dict[str, float]:
+    costs = {}
+    for name, statement_for in build(user_id, board_id).items():
+        started = time.perf_counter()
+        for _ in range(calls):
+            statement, _ = statement_for()
+            statement._generate_cache_key()
+        costs[name] = (time.perf_counter() - started) / calls
+    return costs
+
+
+async def execute_cost(
+    manager: SessionManager, build, user_id, board_id, calls: int
+) -> dict[str, float]:
+    costs = {}
+    async with manager.session_local() as session:
+        for name, statement_for in build(user_id, board_id).items():
+            started = time.perf_counter()
+            for _ in range(calls):
+                statement, params = statement_for()
+                (await session.execute(statement, params)).first()
+                session.expunge_all()
+            costs[name] = (time.perf_counter() - started) / calls
+    return costs
+
+
+async def run(calls: int) -> dict:
+    manager = SessionManager("sqlite+aiosqlite:///:memory:")
+    async with manager.engine.begin() as conn:
+        await conn.run_sync(CoreModel.metadata.create_all)
+    user_id, board_id = uuid4(), uuid4()
+    async with manager.session_local() as session:
+        session.add(User(id=user_id, name=NAME, email=EMAIL, password_hash="-"))
+        session.add(Board(id=board_id, title="bench"))
+        await session.flush()
+        session.add(UserUsingBoard(user_id=user_id, board_id=board_id, role=Role.ADMIN))
+        await session.commit()
+
+    results = {}
+    for label, build in VARIANTS.items():
+        await execute_cost(manager, build, user_id, board_id, 50)
+        results[label] = {
+            "prepare": prepare_cost(build, user_id, board_id, calls),
+            "execute": await execute_cost(manager, build, user_id, board_id, calls),
+        }
+    await manager.dispose()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=5000)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.calls))
+    for query in results["inline"]["prepare"]:
+        print(query)
+        for label, result in results.items():
+            print(
+                f"  {label:>8}: prepare {result['prepare'][query] * 1e6:7.1f}us  "
+                f"execute {result['execute'][query] * 1e6:7.1f}us"
+            )
+
+
+if __name__ == "__main__":
+    main()
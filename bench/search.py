@@ -0,0 +1,183 @@
+"""Task search latency: the full-text index against a LIKE scan.
+
+python bench/search.py --tasks 2000000 --boards 20000 --repeat 20
+
+Seeds a SQLite file with Faker text (zipf-distributed words, so there are
+common and rare terms) once and reuses it while --database points at it.
+Both variants are scoped to one user's boards and return the first page.
+"""
+
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+import uuid
+
+from pathlib import Path
+
+from common import summarize
+from faker import Faker
+from sqlalchemy import and_, func, insert, or_, select
+
+from api.v1.board.service import TASK_COLUMNS
+from api.v1.search.service import task_search_query
+from database.model import Board, CoreModel, Role, Task, User, UserUsingBoard
+from database.search import parse_terms
+from database.session import SessionManager
+
+BATCH = 20_000
+
+
+def vocabulary(rng: random.Random, size: int) -> list[str]:
+    fake = Faker("ru_RU")
+    fake.seed_instance(rng.random())
+    words = list(dict.fromkeys(word.lower() for word in fake.words(size * 3)))
+    return words[:size]
+
+
+def sentence(rng: random.Random, words, weights, low: int, high: int) -> str:
+    return " ".join(rng.choices(words, weights, k=rng.randint(low, high)))
+
+
+async def seed(manager: SessionManager, args) -> None:
+    rng = random.Random(args.seed)
+    words = vocabulary(rng, args.vocabulary)
+    weights = [1 / rank for rank in range(1, len(words) + 1)]
+
+    async with manager.engine.begin() as conn:
+        await conn.run_sync(CoreModel.metadata.create_all)
+        user_id = uuid.UUID(int=rng.getrandbits(128))
+        await conn.execute(
+            insert(User),
+            {
+                "id": user_id,
+                "name": "bench",
+                "email": "b@example.com",
+                "password_hash": "-",
+            },
+        )
+        board_ids = [uuid.UUID(int=rng.getrandbits(128)) for _ in range(args.boards)]
+        await conn.execute(
+            insert(Board), [{"id": id, "title": "b"} for id in board_ids]
+        )
+        await conn.execute(
+            insert(UserUsingBoard),
+            [
+                {"user_id": user_id, "board_id": board_id, "role": Role.ADMIN}
+                for board_id in rng.sample(board_ids, args.member_boards)
+            ],
+        )
+
+    for start in range(0, args.tasks, BATCH):
+        rows = [
+            {
+                "id": uuid.UUID(int=rng.getrandbits(128)),
+                "board_id": rng.choice(board_ids),
+                "title": sentence(rng, words, weights, 2, 6),
+                "description": sentence(rng, words, weights, 5, 25)
+                if rng.random() < 0.7
+                else None,
+            }
+            for _ in range(min(BATCH, args.tasks - start))
+        ]
+        async with manager.engine.begin() as conn:
+            await conn.execute(insert(Task), rows)
+        print(f"seeded {start + len(rows)}/{args.tasks}", end="\r", flush=True)
+    print()
+
+
+def like_query(terms: list[tuple[str, bool]], user_id, limit: int):
+    # The pre-index alternative: every term must appear somewhere.
+    conditions = [
+        or_(Task.title.ilike(f"%{word}%"), Task.description.ilike(f"%{word}%"))
+        for word, _ in terms
+    ]
+    return (
+        select(Task.board_id, *TASK_COLUMNS)
+        .join(
+            UserUsingBoard,
+            and_(
+                UserUsingBoard.board_id == Task.board_id,
+                UserUsingBoard.user_id == user_id,
+            ),
+        )
+        .where(*conditions)
+        .order_by(Task.id)
+        .limit(limit)
+    )
+
+
+def pick_queries(args) -> dict[str, str]:
+    rng = random.Random(args.seed)
+    words = vocabulary(rng, args.vocabulary)
+    return {
+        "common": words[0],
+        "mid": words[len(words) // 10],
+        "rare": words[-1],
+        "two terms": f"{words[1]} {words[len(words) // 20]}",
+        "prefix": words[len(words) // 10][:3] + "*",
+    }
+
+
+async def measure(manager: SessionManager, statement, repeat: int) -> tuple:
+    latencies, rows = [], 0
+    async with manager.engine.connect() as conn:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            rows = len((await conn.execute(statement)).all())
+            latencies.append(time.perf_counter() - started)
+    return summarize(latencies), rows
+
+
+async def run(database: Path, args) -> None:
+    manager = SessionManager(f"sqlite+aiosqlite:///{database}")
+    if not database.exists():
+        await seed(manager, args)
+
+    async with manager.engine.connect() as conn:
+        user_id = await conn.scalar(select(User.id))
+        total = await conn.scalar(select(func.count()).select_from(Task))
+    print(f"{total} tasks, limit {args.limit}, {args.repeat} runs per query")
+
+    for label, text in pick_queries(args).items():
+        terms = parse_terms(text)
+        fts, fts_rows = await measure(
+            manager,
+            task_search_query("sqlite", terms, user_id, args.limit),
+            args.repeat,
+        )
+        like, like_rows = await measure(
+            manager, like_query(terms, user_id, args.limit), args.repeat
+        )
+        print(
+            f"{label:>10} {text!r:<24} "
+            f"fts p50={fts['p50_ms']:8.2f}ms p95={fts['p95_ms']:8.2f}ms "
+            f"({fts_rows} rows)  "
+            f"like p50={like['p50_ms']:8.2f}ms p95={like['p95_ms']:8.2f}ms "
+            f"({like_rows} rows)"
+        )
+    await manager.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tasks", type=int, default=2_000_000)
+    parser.add_argument("--boards", type=int, default=20_000)
+    parser.add_argument("--member-boards", type=int, default=2_000)
+    parser.add_argument("--vocabulary", type=int, default=5_000)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--database", type=Path, help="seeded file to reuse")
+    args = parser.parse_args()
+
+    if args.database is not None:
+        asyncio.run(run(args.database, args))
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(run(Path(tmp) / "search.db", args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""Serialization cost per 10k tasks: per-field conversion vs raw values.
+
+python bench/serialization.py --tasks 10000 --boards 100 --repeat 20
+
+Rows come from real queries on in-memory SQLite. "before" is the
+serializers as they were (strftime/str per field), rendered the way each
+route did it: task lists through FastAPI's jsonable_encoder and
+ORJSONResponse, board payloads through orjson.dumps. "after" is the same
+payload as raw values through core.serialization.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+
+from datetime import datetime, timedelta
+
+import common  # noqa: F401
+import orjson
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import insert, select
+
+from api.v1.board.endpoint import serialize_board
+from api.v1.board.service import BOARD_COLUMNS, TASK_COLUMNS, get_board_views
+from api.v1.task.endpoint import serialize_task_detail
+from core.serialization import JSONResponse, dumps
+from database.model import (
+    Board,
+    CoreModel,
+    Priority,
+    Role,
+    Status,
+    Task,
+    User,
+    UserUsingBoard,
+)
+from database.session import SessionManager
+
+FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def legacy_task(task) -> dict:
+    return {
+        "id": str(task.id),
+        "title": task.title,
+        "description": task.description,
+        "deadline": task.deadline.strftime(FORMAT) if task.deadline else None,
+        "priority": task.priority,
+        "status": task.status,
+        "assigned_user_id": str(task.assigned_user_id)
+        if task.assigned_user_id
+        else None,
+    }
+
+
+def legacy_board(view) -> dict:
+    board = view.board
+    return {
+        "id": str(board.id),
+        "title": board.title,
+        "created_at": board.created_at.strftime(FORMAT),
+        "updated_at": board.updated_at.strftime(FORMAT),
+        "participants": [
+            {"id": str(link.user_id), "role": link.role} for link in view.memberships
+        ],
+        "tasks": [{"id": str(task.id)} for task in view.tasks],
+    }
+
+
+async def load(args):
+    rng = random.Random(args.seed)
+    manager = SessionManager("sqlite+aiosqlite:///:memory:")
+    now = datetime(2026, 1, 1)
+    async with manager.engine.begin() as conn:
+        await conn.run_sync(CoreModel.metadata.create_all)
+        users = [uuid.UUID(int=rng.getrandbits(128)) for _ in range(20)]
+        boards = [uuid.UUID(int=rng.getrandbits(128)) for _ in range(args.boards)]
+        await conn.execute(
+            insert(User),
+            [
+                {
+                    "id": id,
+                    "name": f"u{i}",
+                    "email": f"u{i}@e.com",
+                    "password_hash": "-",
+                }
+                for i, id in enumerate(users)
+            ],
+        )
+        await conn.execute(
+            insert(Board), [{"id": id, "title": f"board {id}"} for id in boards]
+        )
+        await conn.execute(
+            insert(UserUsingBoard),
+            [
+                {"user_id": user, "board_id": board, "role": rng.choice(list(Role))}
+                for board in boards
+                for user in rng.sample(users, 3)
+            ],
+        )
+        await conn.execute(
+            insert(Task),
+            [
+                {
+                    "id": uuid.UUID(int=rng.getrandbits(128)),
+                    "board_id": rng.choice(boards),
+                    "title": f"task {n}",
+                    "description": "description " * rng.randint(0, 8) or None,
+                    "deadline": now + timedelta(minutes=rng.randint(0, 10**6))
+                    if rng.random() < 0.8
+                    else None,
+                    "priority": rng.choice(list(Priority)),
+                    "status": rng.choice(list(Status)),
+                    "assigned_user_id": rng.choice(users)
+                    if rng.random() < 0.5
+                    else None,
+                }
+                for n in range(args.tasks)
+            ],
+        )
+
+    async with manager.session_local() as session:
+        tasks = (await session.execute(select(*TASK_COLUMNS))).all()
+        board_rows = (await session.execute(select(*BOARD_COLUMNS))).all()
+        views = await get_board_views(board_rows, session)
+    await manager.dispose()
+    return tasks, views
+
+
+def timed(render, repeat: int) -> tuple[float, bytes]:
+    best, body = float("inf"), b""
+    for _ in range(repeat):
+        started = time.perf_counter()
+        body = render()
+        best = min(best, time.perf_counter() - started)
+    return best, body
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tasks", type=int, default=10_000)
+    parser.add_argument("--boards", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    tasks, views = asyncio.run(load(args))
+    cases = {
+        "task list": (
+            lambda: (
+                ORJSONResponse(
+                    jsonable_encoder({"items": [legacy_task(task) for task in tasks]})
+                ).body
+            ),
+            lambda: (
+                JSONResponse(
+                    {"items": [serialize_task_detail(task) for task in tasks]}
+                ).body
+            ),
+        ),
+        "boards": (
+            lambda: orjson.dumps({"items": [legacy_board(view) for view in views]}),
+            lambda: dumps({"items": [serialize_board(view) for view in views]}),
+        ),
+    }
+
+    per = 10_000 / args.tasks
+    for label, (before, after) in cases.items():
+        before_s, before_body = timed(before, args.repeat)
+        after_s, after_body = timed(after, args.repeat)
+        assert orjson.loads(before_body) == orjson.loads(after_body), label
+        print(
+            f"{label:>10}: before {before_s * per * 1000:7.2f}ms  "
+            f"after {after_s * per * 1000:7.2f}ms per 10k tasks  "
+            f"({before_s / after_s:.1f}x, identical output)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""Concurrent writes on one SQLite file, with and without the SQLite profile.
+
+python bench/sqlite_writes.py --processes 4 --writers 8 --readers 4 --duration 5
+
+Every process stands in for a uvicorn worker with its own SessionManager.
+Writers repeat the create_board / delete_board transactions, readers list
+boards. "default" is a plain engine with the pool settings only; "profile"
+adds the pragmas, the single-connection write queue and the separate
+read pool.
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import tempfile
+import time
+
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+from common import summarize
+from sqlalchemy import select
+from sqlalchemy.exc import OperationalError
+
+from core.settings import SQLiteSettings
+from database.model import Board, CoreModel, Role, User, UserUsingBoard
+from database.session import SessionManager
+
+
+def build_manager(url: str, profile: bool) -> SessionManager:
+    return SessionManager(
+        url,
+        sqlite=SQLiteSettings() if profile else None,
+        pool_size=10,
+        max_overflow=5,
+    )
+
+
+async def prepare(url: str) -> None:
+    manager = SessionManager(url)
+    async with manager.engine.begin() as conn:
+        await conn.run_sync(CoreModel.metadata.create_all)
+    async with manager.session_local() as session:
+        session.add(User(name="bench", email="bench@example.com", password_hash="-"))
+        await session.commit()
+    await manager.dispose()
+
+
+async def worker(url: str, profile: bool, args) -> dict:
+    manager = build_manager(url, profile)
+    scope = asynccontextmanager(manager.session_scope)
+    async with manager.read_session() as session:
+        user_id = await session.scalar(select(User.id))
+
+    deadline = time.perf_counter() + args.duration
+    latencies: list[float] = []
+    counts = {"commits": 0, "locked": 0, "errors": 0, "reads": 0}
+
+    async def create_and_delete():
+        # Same statements as POST /board/ followed by DELETE /board/{id}.
+        async with scope() as session:
+            board = Board(title="bench")
+            session.add(board)
+            await session.flush()
+            session.add(
+                UserUsingBoard(board_id=board.id, user_id=user_id, role=Role.ADMIN)
+            )
+            await session.commit()
+        async with scope() as session:
+            board = await session.get(Board, board.id)
+            await session.scalar(
+                select(UserUsingBoard).where(
+                    UserUsingBoard.board_id == board.id,
+                    UserUsingBoard.user_id == user_id,
+                )
+            )
+            await session.delete(board)
+            await session.commit()
+
+    async def writer():
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                await create_and_delete()
+            except OperationalError as exc:
+                locked = "locked" in str(exc) or "busy" in str(exc)
+                counts["locked" if locked else "errors"] += 1
+                continue
+            latencies.append(time.perf_counter() - started)
+            counts["commits"] += 2
+
+    async def reader():
+        while time.perf_counter() < deadline:
+            try:
+                async with manager.read_session() as session:
+                    await session.execute(select(Board).limit(50))
+                counts["reads"] += 1
+            except OperationalError:
+                counts["errors"] += 1
+
+    await asyncio.gather(
+        *(writer() for _ in range(args.writers)),
+        *(reader() for _ in range(args.readers)),
+    )
+    await manager.dispose()
+    return {**counts, "latencies": latencies}
+
+
+def run_process(url: str, profile: bool, args, results) -> None:
+    results.put(asyncio.run(worker(url, profile, args)))
+
+
+def run_mode(profile: bool, args) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite+aiosqlite:///{Path(tmp) / 'writes.db'}"
+        asyncio.run(prepare(url))
+
+        results = multiprocessing.Queue()
+        processes = [
+            multiprocessing.Process(
+                target=run_process, args=(url, profile, args, results)
+            )
+            for _ in range(args.processes)
+        ]
+        for process in processes:
+            process.start()
+        reports = [results.get() for _ in processes]
+        for process in processes:
+            process.join()
+
+    totals = {
+        key: sum(report[key] for report in reports)
+        for key in ("commits", "locked", "errors", "reads")
+    }
+    attempts = totals["commits"] // 2 + totals["locked"] + totals["errors"]
+    latencies = [value for report in reports for value in report["latencies"]]
+    return {
+        **totals,
+        "lock_error_rate": totals["locked"] / attempts if attempts else 0.0,
+        "commits_per_s": totals["commits"] / args.duration,
+        "reads_per_s": totals["reads"] / args.duration,
+        **summarize(latencies),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--writers", type=int, default=8, help="per process")
+    parser.add_argument("--readers", type=int, default=4, help="per process")
+    parser.add_argument("--duration", type=float, default=5.0)
+    args = parser.parse_args()
+
+    for label, profile in (("default", False), ("profile", True)):
+        result = run_mode(profile, args)
+        print(
+            f"{label:>8}: {result['commits_per_s']:7.1f} commits/s  "
+            f"{result['reads_per_s']:7.1f} reads/s  "
+            f"lock errors {result['locked']} ({result['lock_error_rate']:.1%})  "
+            f"other errors {result['errors']}  "
+            f"create+delete p50={result['p50_ms']:.1f}ms p95={result['p95_ms']:.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
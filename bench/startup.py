@@ -0,0 +1,160 @@
+"""Cold start: process launch until the first authenticated request succeeds.
+
+python bench/startup.py --runs 5 --workers 1 --prewarm 0
+
+Each run starts `uvicorn main:app` in a fresh process against a database
+that was migrated beforehand, the way a deployment would, and polls
+GET /api/v1/board/ until it answers 200.
+"""
+
+import argparse
+import asyncio
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+from uuid import uuid4
+
+import common
+import httpx
+
+from sqlalchemy import insert
+
+from api.v1.auth.service import get_access_token
+from database.model import User
+from database.schema import upgrade_schema
+from database.session import SessionManager
+
+SRC = common.ROOT
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def prepare(database: Path) -> str:
+    manager = SessionManager(f"sqlite+aiosqlite:///{database}")
+    try:
+        await upgrade_schema(manager.engine)
+        user_id = uuid4()
+        async with manager.engine.begin() as conn:
+            await conn.execute(
+                insert(User),
+                {
+                    "id": user_id,
+                    "name": "startup",
+                    "email": "startup@example.com",
+                    "password_hash": "-",
+                },
+            )
+    finally:
+        await manager.dispose()
+    return get_access_token(
+        {"sub": str(user_id), "username": "startup", "email": "startup@example.com"}
+    )
+
+
+def workdir(root: Path, database: Path, workers: int, prewarm: int) -> Path:
+    # Settings and key paths are relative to the working directory, so each
+    # run gets its own tree with an .env override and links to the real keys.
+    (root / "src/api/v1").mkdir(parents=True)
+    (root / "src/api/v1/auth").symlink_to(SRC / "api/v1/auth")
+    (root / "src/example.env").write_text((SRC / "example.env").read_text())
+    (root / "src/.env").write_text(
+        "\n".join(
+            [
+                "DEVELOPMENT = False",
+                "DATABASE_ECHO = False",
+                f"DATABASE_PREWARM = {prewarm}",
+                f"DATABASE_URL_DATABASE = {database}",
+                f"UVICORN_WORKERS = {workers}",
+                "LOGGING_LEVEL = WARNING",
+            ]
+        )
+    )
+    return root
+
+
+def run_once(cwd: Path, token: str, workers: int, timeout: float) -> dict:
+    port = free_port()
+    command = [
+        sys.executable,
+        "-m",
+        "uvicorn",
+        "main:app",
+        "--app-dir",
+        str(SRC),
+        "--port",
+        str(port),
+        "--workers",
+        str(workers),
+        "--log-level",
+        "warning",
+    ]
+    headers = {"Authorization": f"Bearer {token}"}
+    url = f"http://127.0.0.1:{port}/api/v1/board/"
+
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        command, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+    )
+    listening = None
+    try:
+        with httpx.Client(timeout=1.0) as client:
+            while time.perf_counter() - started < timeout:
+                if process.poll() is not None:
+                    raise RuntimeError(process.stderr.read().decode())
+                try:
+                    response = client.get(url, headers=headers)
+                except httpx.TransportError:
+                    time.sleep(0.005)
+                    continue
+                listening = listening or time.perf_counter() - started
+                if response.status_code == 200:
+                    return {
+                        "listening_s": listening,
+                        "first_ok_s": time.perf_counter() - started,
+                    }
+                time.sleep(0.005)
+        raise TimeoutError(f"no successful request within {timeout}s")
+    finally:
+        process.terminate()
+        try:
+            process.wait(10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--prewarm", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        database = root / "startup.db"
+        token = asyncio.run(prepare(database))
+        cwd = workdir(root / "run", database, args.workers, args.prewarm)
+        runs = [
+            run_once(cwd, token, args.workers, args.timeout) for _ in range(args.runs)
+        ]
+
+    for key in ("listening_s", "first_ok_s"):
+        values = [run[key] * 1000 for run in runs]
+        print(
+            f"{key:>12}: median={statistics.median(values):.0f}ms "
+            f"min={min(values):.0f}ms max={max(values):.0f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
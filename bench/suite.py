@@ -0,0 +1,351 @@
+"""Load test of the main API flows against a seeded, reproducible dataset.
+
+python bench/suite.py --users 200 --boards 5 --tasks 20 --members 3 \\
+    --output bench-results.json
+python bench/suite.py --compare bench-results.json --output bench-new.json \\
+    --threshold 0.15
+
+Each scenario runs `--requests` times (`--auth-requests` for the bcrypt
+bound register and token flows) over `--concurrency` workers. Results are
+written as JSON; with `--compare` every scenario is checked against a
+stored baseline and the script exits with status 1 on a regression.
+"""
+
+import argparse
+import asyncio
+import platform
+import random
+import sys
+import time
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Awaitable, Callable
+from uuid import UUID
+
+import orjson
+
+from common import app_client, summarize
+from faker import Faker
+from sqlalchemy import insert
+
+from api.v1.auth.hashing import password_hasher
+from api.v1.auth.service import get_access_token, get_refresh_token
+from database.model import Board, Priority, Role, Status, Task, User, UserUsingBoard
+from database.session import SessionManager
+
+PASSWORD = "correct horse battery staple"
+SCENARIOS = (
+    "register",
+    "token",
+    "refresh",
+    "board_list",
+    "board_get",
+    "board_create",
+    "board_delete",
+)
+
+
+@dataclass
+class Dataset:
+    users: list[dict] = field(default_factory=list)
+    boards: list[dict] = field(default_factory=list)
+    tasks: list[dict] = field(default_factory=list)
+    members: list[dict] = field(default_factory=list)
+    # user id -> ids of the boards the user belongs to
+    access: dict[UUID, list[UUID]] = field(default_factory=dict)
+
+
+def generate(
+    fake: Faker, rng: random.Random, users: int, boards: int, tasks: int, members: int
+) -> Dataset:
+    def new_id() -> UUID:
+        return UUID(int=rng.getrandbits(128), version=4)
+
+    dataset = Dataset()
+    for index in range(users):
+        name = f"{fake.user_name()}{index}"
+        dataset.users.append(
+            {"id": new_id(), "name": name, "email": f"{name}@{fake.domain_name()}"}
+        )
+
+    for owner in dataset.users:
+        for _ in range(boards):
+            board_id = new_id()
+            dataset.boards.append({"id": board_id, "title": fake.catch_phrase()})
+            others = [
+                u for u in rng.sample(dataset.users, members + 1) if u is not owner
+            ]
+            participants = [owner, *others[:members]]
+            for user in participants:
+                role = Role.ADMIN if user is owner else Role.USER
+                dataset.members.append(
+                    {"user_id": user["id"], "board_id": board_id, "role": role}
+                )
+                dataset.access.setdefault(user["id"], []).append(board_id)
+            for _ in range(tasks):
+                dataset.tasks.append(
+                    {
+                        "id": new_id(),
+                        "board_id": board_id,
+                        "title": fake.sentence(nb_words=4),
+                        "description": fake.text(max_nb_chars=120),
+                        "deadline": fake.date_time_between("-30d", "+60d"),
+                        "priority": rng.choice(list(Priority)),
+                        "status": rng.choice(list(Status)),
+                        "assigned_user_id": rng.choice(participants)["id"],
+                    }
+                )
+    return dataset
+
+
+def seeder(
+    dataset: Dataset, password_hash: str
+) -> Callable[[SessionManager], Awaitable[None]]:
+    async def seed(manager: SessionManager) -> None:
+        users = [{**user, "password_hash": password_hash} for user in dataset.users]
+        async with manager.engine.begin() as conn:
+            for model, rows in (
+                (User, users),
+                (Board, dataset.boards),
+                (UserUsingBoard, dataset.members),
+                (Task, dataset.tasks),
+            ):
+                if rows:
+                    await conn.execute(insert(model.__table__), rows)
+
+    return seed
+
+
+async def measure(
+    requests: int, concurrency: int, call: Callable[[int], Awaitable[None]]
+) -> dict:
+    latencies: list[float] = []
+    errors = 0
+    queue = iter(range(requests))
+
+    async def worker():
+        nonlocal errors
+        for index in queue:
+            started = time.perf_counter()
+            try:
+                await call(index)
+            except Exception:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return {
+        **summarize(latencies),
+        "errors": errors,
+        "throughput_rps": len(latencies) / elapsed if elapsed else 0.0,
+    }
+
+
+async def run(args: argparse.Namespace) -> dict:
+    fake = Faker()
+    fake.seed_instance(args.seed)
+    rng = random.Random(args.seed)
+    dataset = generate(fake, rng, args.users, args.boards, args.tasks, args.members)
+    seed = seeder(dataset, await password_hasher.hash(PASSWORD))
+
+    # Signing a token costs a few milliseconds, so the tokens for a fixed
+    # pool of active users are issued up front, outside the measured calls.
+    readers = [user for user in dataset.users if dataset.access.get(user["id"])]
+    active = rng.sample(readers, min(len(readers), args.active))
+    headers = {}
+    cookies = {}
+    for user in active:
+        payload = {"sub": str(user["id"])}
+        token = get_access_token(
+            {**payload, "username": user["name"], "email": user["email"]}
+        )
+        headers[user["id"]] = {"Authorization": f"Bearer {token}"}
+        cookies[user["id"]] = {"Cookie": f"refresh-token={get_refresh_token(payload)}"}
+    created: list[tuple[dict, str]] = []
+    results = {}
+
+    async with app_client(seed=seed) as client:
+
+        async def check(response) -> None:
+            response.raise_for_status()
+
+        async def register(index: int):
+            name = f"new{index}{fake.user_name()}"
+            await check(
+                await client.post(
+                    "/api/v1/auth/register",
+                    json={
+                        "name": name,
+                        "email": f"{name}@example.com",
+                        "password": PASSWORD,
+                    },
+                )
+            )
+
+        async def token(index: int):
+            user = rng.choice(dataset.users)
+            await check(
+                await client.post(
+                    "/api/v1/auth/token",
+                    data={"username": user["name"], "password": PASSWORD},
+                )
+            )
+
+        async def refresh(index: int):
+            user = rng.choice(active)
+            await check(
+                await client.post("/api/v1/auth/refresh", headers=cookies[user["id"]])
+            )
+
+        async def board_list(index: int):
+            user = rng.choice(active)
+            await check(await client.get("/api/v1/board/", headers=headers[user["id"]]))
+
+        async def board_get(index: int):
+            user = rng.choice(active)
+            board_id = rng.choice(dataset.access[user["id"]])
+            await check(
+                await client.get(
+                    f"/api/v1/board/{board_id}", headers=headers[user["id"]]
+                )
+            )
+
+        async def board_create(index: int):
+            user = rng.choice(active)
+            response = await client.post(
+                "/api/v1/board/",
+                params={"title": fake.catch_phrase()},
+                headers=headers[user["id"]],
+            )
+            await check(response)
+            created.append((user, response.json()["board_id"]))
+
+        async def board_delete(index: int):
+            user, board_id = created.pop()
+            await check(
+                await client.delete(
+                    f"/api/v1/board/{board_id}", headers=headers[user["id"]]
+                )
+            )
+
+        calls = {
+            "register": register,
+            "token": token,
+            "refresh": refresh,
+            "board_list": board_list,
+            "board_get": board_get,
+            "board_create": board_create,
+            "board_delete": board_delete,
+        }
+        for name in args.scenarios:
+            requests = (
+                args.auth_requests if name in ("register", "token") else args.requests
+            )
+            if name == "board_delete":
+                requests = min(requests, len(created))
+            results[name] = await measure(requests, args.concurrency, calls[name])
+            print(format_result(name, results[name]), file=sys.stderr)
+
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "dataset": {
+                "users": args.users,
+                "boards_per_user": args.boards,
+                "tasks_per_board": args.tasks,
+                "members_per_board": args.members,
+                "seed": args.seed,
+            },
+            "requests": args.requests,
+            "auth_requests": args.auth_requests,
+            "active_users": args.active,
+            "concurrency": args.concurrency,
+        },
+        "results": results,
+    }
+
+
+def format_result(name: str, result: dict) -> str:
+    return (
+        f"{name:>13}: {result['throughput_rps']:8.1f} req/s  "
+        f"p50={result['p50_ms']:.1f}ms p95={result['p95_ms']:.1f}ms "
+        f"p99={result['p99_ms']:.1f}ms ({result['count']} ok, "
+        f"{result['errors']} errors)"
+    )
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    regressions = []
+    for name, result in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            continue
+        if result["errors"] > before["errors"]:
+            regressions.append(
+                f"{name}: {result['errors']} errors, baseline had {before['errors']}"
+            )
+        if before["p95_ms"] and result["p95_ms"] > before["p95_ms"] * (1 + threshold):
+            regressions.append(
+                f"{name}: p95 {result['p95_ms']:.1f}ms vs {before['p95_ms']:.1f}ms"
+            )
+        if result["throughput_rps"] < before["throughput_rps"] * (1 - threshold):
+            regressions.append(
+                f"{name}: {result['throughput_rps']:.1f} req/s "
+                f"vs {before['throughput_rps']:.1f} req/s"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--boards", type=int, default=3, help="boards per user")
+    parser.add_argument("--tasks", type=int, default=10, help="tasks per board")
+    parser.add_argument(
+        "--members", type=int, default=2, help="extra members per board"
+    )
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--auth-requests", type=int, default=50)
+    parser.add_argument(
+        "--active", type=int, default=50, help="users issuing authenticated calls"
+    )
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument(
+        "--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS)
+    )
+    parser.add_argument("--output", type=Path, default=Path("bench-results.json"))
+    parser.add_argument("--compare", type=Path, help="baseline results file")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="allowed relative slowdown"
+    )
+    args = parser.parse_args()
+    if args.members >= args.users:
+        parser.error("--members must be lower than --users")
+    if args.compare is not None and args.compare.resolve() == args.output.resolve():
+        parser.error("--output would overwrite the --compare baseline")
+    # Read the baseline up front so a bad path fails before the run.
+    baseline = None if args.compare is None else orjson.loads(args.compare.read_bytes())
+
+    report = asyncio.run(run(args))
+    args.output.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+
+    if baseline is None:
+        return
+    regressions = compare(report, baseline, args.threshold)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    if regressions:
+        sys.exit(1)
+    print(f"No regressions against {args.compare}")
+
+
+if __name__ == "__main__":
+    main()
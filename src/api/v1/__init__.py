@@ -1,9 +1,17 @@
 from fastapi import APIRouter
 
+from api.v1.audit.endpoint import router as audit_router
 from api.v1.auth.endpoint import router as auth_router
 from api.v1.board.endpoint import router as board_router
+from api.v1.feed.endpoint import router as feed_router
+from api.v1.search.endpoint import router as search_router
+from api.v1.task.endpoint import router as task_router
 
 v1_router = APIRouter(prefix="/v1")
 
 v1_router.include_router(board_router)
+v1_router.include_router(task_router)
+v1_router.include_router(feed_router)
+v1_router.include_router(audit_router)
+v1_router.include_router(search_router)
 v1_router.include_router(auth_router)
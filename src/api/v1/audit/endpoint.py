@@ -0,0 +1,31 @@
+from datetime import datetime, timezone
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Query, status
+
+from api.v1.board.permissions import board_role
+from core.serialization import JSONRoute
+from database.model import Role
+from services.audit import audit_log
+
+router = APIRouter(
+    prefix="/board/{board_id}/audit", tags=["Audit"], route_class=JSONRoute
+)
+
+
+def serialize_record(record: dict) -> dict:
+    timestamp = datetime.fromtimestamp(record["ts"], timezone.utc)
+    return {**record, "ts": timestamp.strftime("%Y-%m-%d %H:%M:%S")}
+
+
+@router.get("", status_code=status.HTTP_200_OK, dependencies=[board_role(Role.ADMIN)])
+async def get_audit_log(
+    board_id: UUID,
+    user_id: Optional[UUID] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    limit: int = Query(100, ge=1, le=1000),
+):
+    records = await audit_log.query(board_id, user_id, since, until, limit)
+    return {"items": [serialize_record(record) for record in records]}
@@ -9,13 +9,15 @@ from fastapi.security import (
 )
 from jwt import InvalidTokenError
 from pydantic import EmailStr, SecretStr
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.v1.auth.utils import decode_jwt, verify_password
-from api.v1.users.shemas import UserCreate, UserDTO
+from api.v1.auth.hashing import password_hasher
+from api.v1.auth.utils import decode_jwt
+from api.v1.users.cache import cache_user, get_cached_user
+from api.v1.users.shemas import UserCreate, UserDTO, UserSnapshot
 from database.model import User
-from database.session import session_manager
+from database.queries import USER_LOGIN
+from database.session import current_user_id, session_manager
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v1/auth/token")
 security = HTTPBearer()
@@ -32,15 +34,15 @@ def get_form_user(
 async def validate_auth_user(
     username: Annotated[str, Form()],
     password: Annotated[str, Form()],
-    session: AsyncSession = Depends(session_manager.session_scope),
+    session: AsyncSession = Depends(session_manager.read_session_scope),
 ) -> UserDTO:
     unauthed_exc = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Invalid username or password",
     )
 
-    user = await session.scalar(select(User).where(User.name == username))
-    if not user or not verify_password(password, user.password_hash):
+    user = (await session.execute(USER_LOGIN, {"name": username})).one_or_none()
+    if not user or not await password_hasher.verify(password, user.password_hash):
         raise unauthed_exc
 
     return UserDTO.model_validate(user)
@@ -81,6 +83,19 @@ def verification_access_jwt(
 
 async def get_verification_user(
     payload: dict = Depends(verification_access_jwt),
-    session: AsyncSession = Depends(session_manager.session_scope),
-):
-    return await session.get(User, UUID(payload.get("sub")))
+    session: AsyncSession = Depends(session_manager.read_session_scope),
+) -> UserSnapshot:
+    user_id = UUID(payload.get("sub"))
+    current_user_id.set(user_id)
+    snapshot = get_cached_user(user_id)
+    if snapshot is not None:
+        return snapshot
+
+    user = await session.get(User, user_id)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return cache_user(user)
@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -18,11 +18,12 @@ from api.v1.auth.service import (
     is_name_taken,
 )
 from api.v1.users.shemas import UserCreate, UserDTO
+from core.serialization import JSONResponse, JSONRoute
 from core.settings import config
-from database.model import User
+from database.queries import USER_CLAIMS
 from database.session import session_manager
 
-router = APIRouter(prefix="/auth", tags=["auth"])
+router = APIRouter(prefix="/auth", tags=["auth"], route_class=JSONRoute)
 
 
 class TokenInfo(BaseModel):
@@ -30,6 +31,11 @@ class TokenInfo(BaseModel):
     token_type: str = "Bearer"
 
 
+def token_response(access_token: str) -> JSONResponse:
+    # TokenInfo documents the schema; the body skips model validation.
+    return JSONResponse({"access_token": access_token, "token_type": "Bearer"})
+
+
 @router.post("/register", status_code=status.HTTP_201_CREATED)
 async def register_user(
     user: UserCreate,  # = Depends(get_form_user) <- in case it turns out you need to do it from a form.  # noqa: E501
@@ -51,7 +57,12 @@ async def register_user(
 
 
 @router.post("/token", response_model=TokenInfo)
-def login_user(response: Response, user: UserDTO = Depends(validate_auth_user)):
+def login_user(user: UserDTO = Depends(validate_auth_user)):
+    response = token_response(
+        get_access_token(
+            {"sub": str(user.id), "username": user.name, "email": user.email}
+        )
+    )
     response.set_cookie(
         "refresh-token",
         get_refresh_token({"sub": str(user.id)}),
@@ -60,21 +71,25 @@ def login_user(response: Response, user: UserDTO = Depends(validate_auth_user)):
         samesite="strict",
         max_age=config.jwt.refresh_token_lifetime,
     )
-    return TokenInfo(
-        access_token=get_access_token(
-            {"sub": str(user.id), "username": user.name, "email": user.email}
-        )
-    )
+    return response
 
 
 @router.post("/refresh", response_model=TokenInfo)
 async def refresh_access_token(
     payload: dict = Depends(verification_refresh_jwt),
-    session: AsyncSession = Depends(session_manager.session_scope),
+    session: AsyncSession = Depends(session_manager.read_session_scope),
 ):
-    user = await session.get(User, UUID(payload.get("sub")))
-    return TokenInfo(
-        access_token=get_access_token(
+    user = (
+        await session.execute(USER_CLAIMS, {"user_id": UUID(payload.get("sub"))})
+    ).one_or_none()
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return token_response(
+        get_access_token(
             {"sub": str(user.id), "username": user.name, "email": user.email}
         )
     )
@@ -0,0 +1,43 @@
+import asyncio
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Optional, TypeVar
+
+from api.v1.auth.utils import password_hash, verify_password
+from core.settings import config
+
+T = TypeVar("T")
+
+
+class PasswordHasher:
+    def __init__(self, max_workers: int, max_concurrency: int):
+        self.executor: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+            if max_workers > 0
+            else None
+        )
+        self._slots = asyncio.Semaphore(max(max_concurrency, 1))
+
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        if self.executor is None:
+            return func(*args)
+        async with self._slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, partial(func, *args))
+
+    async def hash(self, password: str) -> str:
+        return await self._run(password_hash, password)
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        return await self._run(verify_password, password, hashed)
+
+    def shutdown(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+password_hasher = PasswordHasher(
+    max_workers=config.hashing.maxWorkers,
+    max_concurrency=config.hashing.maxConcurrency,
+)
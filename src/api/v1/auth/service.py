@@ -2,12 +2,13 @@ from datetime import timedelta
 from typing import Callable
 
 from pydantic import EmailStr, SecretStr
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.v1.auth.utils import encode_jwt, password_hash
+from api.v1.auth.hashing import password_hasher
+from api.v1.auth.utils import encode_jwt
 from core.settings import config
 from database.model import User
+from database.queries import EMAIL_TAKEN, NAME_TAKEN
 
 TOKEN_TYPE_FIELD = "type"
 ACCESS_TYPE = "access"
@@ -17,22 +18,17 @@ REFRESH_TYPE = "refresh"
 async def create_user_in_the_database(
     name: str, email: EmailStr, password: SecretStr, session: AsyncSession
 ):
-    session.add(
-        User(
-            name=name,
-            email=email,
-            password_hash=password_hash(password.get_secret_value()),
-        )
-    )
+    hashed = await password_hasher.hash(password.get_secret_value())
+    session.add(User(name=name, email=email, password_hash=hashed))
     await session.commit()
 
 
 async def is_email_taken(email: str, session: AsyncSession) -> bool:
-    return await session.scalar(select(User).where(User.email == email)) is not None
+    return await session.scalar(EMAIL_TAKEN, {"email": email}) is not None
 
 
 async def is_name_taken(name: str, session: AsyncSession) -> bool:
-    return await session.scalar(select(User).where(User.name == name)) is not None
+    return await session.scalar(NAME_TAKEN, {"name": name}) is not None
 
 
 def jwt_factory(
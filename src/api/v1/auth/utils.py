@@ -1,25 +1,55 @@
+import hashlib
+import time
 import uuid
 
 from datetime import datetime, timedelta, timezone
+from functools import cache
 
 import jwt
 
 from passlib.context import CryptContext
 
+from core.cache import TTLCache
+from core.metrics import track_cache
 from core.settings import config
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-_PRIVATE_KEY = config.jwt.private_key_path.read_text()
-_PUBLIC_KEY = config.jwt.public_key_path.read_text()
 _ALGORITHM = config.jwt.algorithm
 
+token_cache = TTLCache(
+    maxsize=config.cache.tokens.maxSize,
+    ttl=config.cache.tokens.ttl,
+)
+track_cache("tokens", token_cache)
+
+
+# Keys and the bcrypt context are built on first use, not at import: a
+# worker that never signs a token never reads the PEM files, and a parsed
+# key object spares PyJWT from re-parsing the PEM on every call.
+
+
+@cache
+def pwd_context() -> CryptContext:
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+@cache
+def signing_key():
+    algorithm = jwt.get_algorithm_by_name(_ALGORITHM)
+    return algorithm.prepare_key(config.jwt.private_key_path.read_text())
+
+
+@cache
+def verifying_key():
+    algorithm = jwt.get_algorithm_by_name(_ALGORITHM)
+    return algorithm.prepare_key(config.jwt.public_key_path.read_text())
+
 
 def password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return pwd_context().hash(password)
 
 
 def verify_password(password: str, hashed: str) -> bool:
-    return pwd_context.verify(password, hashed)
+    return pwd_context().verify(password, hashed)
 
 
 def encode_jwt(payload: dict, expire_delta: timedelta) -> str:
@@ -30,12 +60,20 @@ def encode_jwt(payload: dict, expire_delta: timedelta) -> str:
         "exp": now + expire_delta,
         "jti": str(uuid.uuid4()),
     }
-    return jwt.encode(to_encode, key=_PRIVATE_KEY, algorithm=_ALGORITHM)
+    return jwt.encode(to_encode, key=signing_key(), algorithm=_ALGORITHM)
 
 
 def decode_jwt(token: str) -> dict:
-    return jwt.decode(
+    digest = hashlib.sha256(token.encode()).digest()
+    payload = token_cache.get(digest)
+    if payload is not None:
+        return payload.copy()
+
+    payload = jwt.decode(
         jwt=token,
-        key=_PUBLIC_KEY,
+        key=verifying_key(),
         algorithms=[_ALGORITHM],
     )
+    if "exp" in payload:
+        token_cache.set(digest, payload.copy(), ttl=payload["exp"] - time.time())
+    return payload
@@ -0,0 +1,66 @@
+from typing import Hashable, Optional
+from uuid import UUID
+
+from core.metrics import track_cache
+from core.response_cache import MemoryResponseCache, ResponseCacheBackend
+from core.settings import config
+from database.events import Change, on_commit
+from database.model import Board, Task, UserUsingBoard
+
+
+def build_response_cache() -> ResponseCacheBackend:
+    settings = config.cache.responses
+    return MemoryResponseCache(
+        max_bytes=settings.maxBytes,
+        max_entry_bytes=settings.maxEntryBytes,
+        ttl=settings.ttl,
+    )
+
+
+response_cache = build_response_cache()
+track_cache("responses", response_cache)
+
+
+def board_tag(board_id: UUID) -> Hashable:
+    return ("board", board_id)
+
+
+def user_tag(user_id: UUID) -> Hashable:
+    return ("user", user_id)
+
+
+def board_key(board_id: UUID) -> Hashable:
+    return ("board", board_id)
+
+
+def boards_key(user_id: UUID, limit: int, cursor: Optional[str]) -> Hashable:
+    return ("boards", user_id, limit, cursor)
+
+
+def _tags_of(change: Change) -> Optional[list[Hashable]]:
+    values = change.values
+    if change.model is Board:
+        board_id = values.get("id")
+        return None if board_id is None else [board_tag(board_id)]
+
+    board_id = values.get("board_id")
+    if board_id is None:
+        return None
+    if change.model is UserUsingBoard:
+        user_id = values.get("user_id")
+        if user_id is None:
+            return None
+        return [board_tag(board_id), user_tag(user_id)]
+    return [board_tag(board_id)]
+
+
+@on_commit(Board, Task, UserUsingBoard)
+def _invalidate_responses(changes: list[Change]) -> None:
+    tags = set()
+    for change in changes:
+        change_tags = _tags_of(change)
+        if change_tags is None:
+            response_cache.clear()
+            return
+        tags.update(change_tags)
+    response_cache.invalidate(tags)
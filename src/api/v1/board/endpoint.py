@@ -1,21 +1,46 @@
+from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from api.v1.auth.dependencies import get_verification_user
-from database.model import Board, Role, User, UserUsingBoard
+from api.v1.board.cache import (
+    board_key,
+    board_tag,
+    boards_key,
+    response_cache,
+    user_tag,
+)
+from api.v1.board.permissions import board_role
+from api.v1.board.service import (
+    BoardView,
+    get_board_row,
+    get_board_rows,
+    get_board_version,
+    get_board_views,
+    get_user_boards_version,
+    stream_user_export,
+)
+from api.v1.task.endpoint import serialize_task_detail
+from api.v1.users.shemas import UserSnapshot
+from core.conditional import is_not_modified, make_etag, not_modified, set_validators
+from core.pagination import PageParams, decode_cursor, split_page
+from core.profiler import query_budget
+from core.response_cache import CachedResponse
+from core.serialization import JSONResponse, JSONRoute, dumps
+from core.settings import config
+from database.model import Board, Role, UserUsingBoard
 from database.session import session_manager
 
-router = APIRouter(prefix="/board", tags=["Board"])
+router = APIRouter(prefix="/board", tags=["Board"], route_class=JSONRoute)
 
 
 @router.post("/", status_code=status.HTTP_201_CREATED)
 async def create_board(
     title: str,
-    user: User = Depends(get_verification_user),
+    user: UserSnapshot = Depends(get_verification_user),
     session: AsyncSession = Depends(session_manager.session_scope),
 ):
     board = Board(title=title)
@@ -26,7 +51,7 @@ async def create_board(
     session.add(link)
     await session.commit()
 
-    return {"board_id": board.id}
+    return JSONResponse({"board_id": board.id}, status.HTTP_201_CREATED)
 
 
 @router.delete(
@@ -35,9 +60,15 @@ async def create_board(
 )
 async def delete_board(
     board_id: UUID,
-    user: User = Depends(get_verification_user),
+    role: Role = board_role(),
     session: AsyncSession = Depends(session_manager.session_scope),
 ):
+    if role != Role.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only admins can delete this board",
+        )
+
     board = await session.get(Board, board_id)
     if board is None:
         raise HTTPException(
@@ -45,82 +76,161 @@ async def delete_board(
             detail=f"Board with id {board_id} not found",
         )
 
-    result = await session.execute(
-        select(UserUsingBoard).where(
-            UserUsingBoard.board_id == board_id,
-            UserUsingBoard.user_id == user.id,
-        )
-    )
-    link = result.scalar_one_or_none()
-    if link is None or link.role != Role.ADMIN:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only admins can delete this board",
-        )
-
     await session.delete(board)
     await session.commit()
 
 
-def serialize_participant(link: UserUsingBoard) -> dict:
+def serialize_participant(link) -> dict:
     return {
-        "id": str(link.user.id),
+        "id": link.user_id,
         "role": link.role,
     }
 
 
 def serialize_task(task) -> dict:
     return {
-        "id": str(task.id),
+        "id": task.id,
     }
 
 
-def serialize_board(board) -> dict:
+def serialize_board(view: BoardView) -> dict:
+    board = view.board
     return {
-        "id": str(board.id),
+        "id": board.id,
         "title": board.title,
-        "created_at": board.created_at.strftime("%Y-%m-%d %H:%M:%S"),
-        "updated_at": board.updated_at.strftime("%Y-%m-%d %H:%M:%S"),
-        "participants": [serialize_participant(link) for link in board.memberships],
-        "tasks": [serialize_task(task) for task in board.tasks],
+        "created_at": board.created_at,
+        "updated_at": board.updated_at,
+        "participants": [serialize_participant(link) for link in view.memberships],
+        "tasks": [serialize_task(task) for task in view.tasks],
     }
 
 
+def cached_response(request: Request, cached: CachedResponse) -> Response:
+    if is_not_modified(request, cached.etag, cached.last_modified):
+        return not_modified(cached.etag, cached.last_modified)
+    response = Response(cached.body, media_type="application/json")
+    set_validators(response, cached.etag, cached.last_modified)
+    return response
+
+
 @router.get(
     "/",
     status_code=status.HTTP_200_OK,
+    dependencies=[query_budget(5)],
 )
 async def get_all_boards(
-    user: User = Depends(get_verification_user),
-    session: AsyncSession = Depends(session_manager.session_scope),
+    request: Request,
+    user: UserSnapshot = Depends(get_verification_user),
+    page: PageParams = Depends(),
+    session: AsyncSession = Depends(session_manager.read_session_scope),
 ):
-    result = await session.execute(
-        select(Board)
-        .options(
-            selectinload(Board.memberships).selectinload(UserUsingBoard.user),
-            selectinload(Board.tasks),
-        )
-        .join(UserUsingBoard, UserUsingBoard.board_id == Board.id)
-        .where(UserUsingBoard.user_id == user.id)
+    key = boards_key(user.id, page.limit, page.cursor)
+    cached = response_cache.get(key)
+    if cached is not None:
+        return cached_response(request, cached)
+    generation = response_cache.generation
+
+    version = await get_user_boards_version(user.id, session)
+    etag = make_etag("boards", user.id, page.limit, page.cursor, *version)
+    if is_not_modified(request, etag, version.last_modified):
+        return not_modified(etag, version.last_modified)
+
+    after = decode_cursor(page.cursor, datetime, UUID) if page.cursor else None
+    boards, next_cursor = split_page(
+        await get_board_rows(user.id, page.limit + 1, after, session),
+        page.limit,
+        lambda board: (board.created_at, board.id),
+    )
+    views = await get_board_views(boards, session)
+    await session_manager.release(session)
+    body = dumps(
+        {
+            "items": [serialize_board(view) for view in views],
+            "next_cursor": next_cursor,
+        }
+    )
+    cached = CachedResponse(body, etag, version.last_modified)
+    tags = [user_tag(user.id), *(board_tag(board.id) for board in boards)]
+    response_cache.set(key, cached, tags, generation)
+    return cached_response(request, cached)
+
+
+def serialize_export_row(kind: str, row) -> dict:
+    if kind == "board":
+        return {
+            "type": kind,
+            "id": row.id,
+            "title": row.title,
+            "role": row.role,
+            "created_at": row.created_at,
+            "updated_at": row.updated_at,
+        }
+    if kind == "member":
+        return {
+            "type": kind,
+            "board_id": row.board_id,
+            **serialize_participant(row),
+        }
+    return {"type": kind, "board_id": row.board_id, **serialize_task_detail(row)}
+
+
+@router.get(
+    "/export",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+)
+async def export_boards(
+    user: UserSnapshot = Depends(get_verification_user),
+    read_session=Depends(session_manager.read_session_factory),
+):
+    # The export holds its own session for as long as it streams and only
+    # ever keeps one chunk of rows.
+    async def stream():
+        async with read_session() as session:
+            async for kind, rows in stream_user_export(
+                user.id, config.export.chunkSize, session
+            ):
+                yield b"".join(
+                    dumps(serialize_export_row(kind, row)) + b"\n" for row in rows
+                )
+
+    return StreamingResponse(
+        stream(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="boards.ndjson"'},
     )
-    boards = result.scalars().unique().all()
-    return {board.title: serialize_board(board) for board in boards}
 
 
 @router.get(
     "/{board_id}",
     status_code=status.HTTP_200_OK,
+    dependencies=[query_budget(5), board_role()],
 )
 async def get_boards(
     board_id: UUID,
-    user: User = Depends(get_verification_user),
-    session: AsyncSession = Depends(session_manager.session_scope),
+    request: Request,
+    session: AsyncSession = Depends(session_manager.read_session_scope),
 ):
-    result = await session.execute(select(Board).where(Board.id == board_id))
-    board = result.scalar_one_or_none()
-    if board is None:
+    key = board_key(board_id)
+    cached = response_cache.get(key)
+    if cached is not None:
+        return cached_response(request, cached)
+    generation = response_cache.generation
+
+    version = await get_board_version(board_id, session)
+    if version is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Board with id {board_id} not found",
         )
-    return serialize_board(board)
+
+    etag = make_etag("board", board_id, *version)
+    if is_not_modified(request, etag, version.last_modified):
+        return not_modified(etag, version.last_modified)
+
+    board = await get_board_row(board_id, session)
+    (view,) = await get_board_views([board], session)
+    await session_manager.release(session)
+    cached = CachedResponse(dumps(serialize_board(view)), etag, version.last_modified)
+    response_cache.set(key, cached, [board_tag(board_id)], generation)
+    return cached_response(request, cached)
@@ -0,0 +1,98 @@
+from typing import Optional
+from uuid import UUID
+
+from fastapi import Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.v1.auth.dependencies import get_verification_user
+from api.v1.board.service import get_board_role
+from api.v1.users.shemas import UserSnapshot
+from core.cache import TTLCache
+from core.metrics import track_cache
+from core.settings import config
+from database.events import Change, on_commit
+from database.model import Board, Role, UserUsingBoard
+from database.session import session_manager
+
+# (user_id, board_id) -> Role, or None for "not a member". Entries are
+# loaded from the primary, never a lagging replica, on the first check and
+# dropped when the membership row changes in this process. A role changed or
+# revoked through another worker is still honoured here for up to `ttl`
+# seconds (10 by default).
+role_index = TTLCache(
+    maxsize=config.cache.permissions.maxSize,
+    ttl=config.cache.permissions.ttl,
+)
+track_cache("permissions", role_index)
+
+_MISSING = object()
+_generation = 0
+
+
+async def lookup_role(
+    user_id: UUID, board_id: UUID, session: AsyncSession
+) -> Optional[Role]:
+    key = (user_id, board_id)
+    role = role_index.get(key, _MISSING)
+    if role is not _MISSING:
+        return role
+
+    # A commit that lands while the query is in flight bumps the generation;
+    # its result may predate that commit, so it is not cached.
+    generation = _generation
+    role = await get_board_role(user_id, board_id, session)
+    if generation == _generation:
+        ttl = None if role is not None else config.cache.permissions.negativeTtl
+        role_index.set(key, role, ttl)
+    return role
+
+
+async def require_role(
+    board_id: UUID, user_id: UUID, session: AsyncSession, *roles: Role
+) -> Role:
+    role = await lookup_role(user_id, board_id, session)
+    if role is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Board with id {board_id} not found",
+        )
+    if roles and role not in roles:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Insufficient permissions for this board",
+        )
+    return role
+
+
+def board_role(*roles: Role):
+    """Route dependency resolving the caller's role on the `board_id` path.
+
+    Non-members get 404 and members outside `roles` get 403; with no
+    `roles` any member passes. The role is answered from `role_index`, so a
+    warm check runs no query; a cold one reads the primary.
+    """
+
+    async def dependency(
+        board_id: UUID,
+        user: UserSnapshot = Depends(get_verification_user),
+        session: AsyncSession = Depends(session_manager.primary_read_session_scope),
+    ) -> Role:
+        return await require_role(board_id, user.id, session, *roles)
+
+    return Depends(dependency)
+
+
+@on_commit(Board, UserUsingBoard)
+def _invalidate_roles(changes: list[Change]) -> None:
+    global _generation
+    _generation += 1
+    for change in changes:
+        user_id = change.values.get("user_id")
+        board_id = change.values.get("board_id")
+        if change.model is UserUsingBoard and user_id and board_id:
+            role_index.pop((user_id, board_id))
+        elif change.op == "delete" or change.model is UserUsingBoard:
+            # Deleting a board cascades its memberships in the database,
+            # which emits no UserUsingBoard changes here.
+            role_index.clear()
+            return
@@ -0,0 +1,173 @@
+from collections import defaultdict
+from datetime import datetime
+from typing import AsyncIterator, NamedTuple, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import Row, Select, and_, func, or_, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.model import Board, Role, Task, UserUsingBoard
+from database.queries import BOARD_ROLE
+
+BOARD_COLUMNS = (Board.id, Board.title, Board.created_at, Board.updated_at)
+MEMBERSHIP_COLUMNS = (
+    UserUsingBoard.board_id,
+    UserUsingBoard.user_id,
+    UserUsingBoard.role,
+)
+TASK_COLUMNS = (
+    Task.id,
+    Task.title,
+    Task.description,
+    Task.deadline,
+    Task.priority,
+    Task.status,
+    Task.assigned_user_id,
+)
+
+
+class BoardVersion(NamedTuple):
+    boards: int
+    updated_at: Optional[datetime]
+    tasks: int
+    tasks_updated_at: Optional[datetime]
+    memberships: int
+    memberships_updated_at: Optional[datetime]
+
+    @property
+    def last_modified(self) -> Optional[datetime]:
+        stamps = (self.updated_at, self.tasks_updated_at, self.memberships_updated_at)
+        return max((stamp for stamp in stamps if stamp is not None), default=None)
+
+
+class BoardView(NamedTuple):
+    board: Row
+    memberships: list[Row]
+    tasks: list[Row]
+
+
+async def get_board_rows(
+    user_id: UUID,
+    limit: int,
+    after: Optional[tuple[datetime, UUID]],
+    session: AsyncSession,
+) -> Sequence[Row]:
+    query = (
+        select(*BOARD_COLUMNS)
+        .join(UserUsingBoard, UserUsingBoard.board_id == Board.id)
+        .where(UserUsingBoard.user_id == user_id)
+        .order_by(Board.created_at, Board.id)
+        .limit(limit)
+    )
+    if after is not None:
+        created_at, board_id = after
+        query = query.where(
+            or_(
+                Board.created_at > created_at,
+                and_(Board.created_at == created_at, Board.id > board_id),
+            )
+        )
+    return (await session.execute(query)).all()
+
+
+async def get_board_row(board_id: UUID, session: AsyncSession) -> Optional[Row]:
+    result = await session.execute(select(*BOARD_COLUMNS).where(Board.id == board_id))
+    return result.one_or_none()
+
+
+async def get_board_views(
+    boards: Sequence[Row], session: AsyncSession
+) -> list[BoardView]:
+    if not boards:
+        return []
+
+    board_ids = [board.id for board in boards]
+    memberships = defaultdict(list)
+    tasks = defaultdict(list)
+
+    result = await session.execute(
+        select(*MEMBERSHIP_COLUMNS).where(UserUsingBoard.board_id.in_(board_ids))
+    )
+    for row in result:
+        memberships[row.board_id].append(row)
+
+    result = await session.execute(
+        select(Task.board_id, Task.id)
+        .where(Task.board_id.in_(board_ids))
+        .order_by(Task.board_id, Task.deadline, Task.id)
+    )
+    for row in result:
+        tasks[row.board_id].append(row)
+
+    return [
+        BoardView(board, memberships[board.id], tasks[board.id]) for board in boards
+    ]
+
+
+async def stream_user_export(
+    user_id: UUID, chunk_size: int, session: AsyncSession
+) -> AsyncIterator[tuple[str, Sequence[Row]]]:
+    board_ids = select(UserUsingBoard.board_id).where(UserUsingBoard.user_id == user_id)
+    queries = (
+        (
+            "board",
+            select(*BOARD_COLUMNS, UserUsingBoard.role)
+            .join(UserUsingBoard, UserUsingBoard.board_id == Board.id)
+            .where(UserUsingBoard.user_id == user_id)
+            .order_by(Board.created_at, Board.id),
+        ),
+        (
+            "member",
+            select(*MEMBERSHIP_COLUMNS)
+            .where(UserUsingBoard.board_id.in_(board_ids))
+            .order_by(UserUsingBoard.board_id, UserUsingBoard.user_id),
+        ),
+        (
+            "task",
+            select(*TASK_COLUMNS, Task.board_id)
+            .where(Task.board_id.in_(board_ids))
+            .order_by(Task.board_id, Task.deadline, Task.id),
+        ),
+    )
+    for kind, query in queries:
+        result = await session.stream(query.execution_options(yield_per=chunk_size))
+        async for rows in result.partitions():
+            yield kind, rows
+
+
+async def get_board_role(
+    user_id: UUID, board_id: UUID, session: AsyncSession
+) -> Optional[Role]:
+    return await session.scalar(BOARD_ROLE, {"user_id": user_id, "board_id": board_id})
+
+
+def _version_query(board_ids) -> Select:
+    # One row of counts and max(updated_at) per table; counts catch deletions,
+    # which leave no updated_at behind.
+    def aggregate(board_id, updated_at):
+        return (
+            select(func.count(), func.max(updated_at))
+            .where(board_id.in_(board_ids))
+            .subquery()
+        )
+
+    boards = aggregate(Board.id, Board.updated_at)
+    tasks = aggregate(Task.board_id, Task.updated_at)
+    memberships = aggregate(UserUsingBoard.board_id, UserUsingBoard.updated_at)
+    return select(*boards.c, *tasks.c, *memberships.c).select_from(
+        boards.join(tasks, true()).join(memberships, true())
+    )
+
+
+async def get_board_version(
+    board_id: UUID, session: AsyncSession
+) -> Optional[BoardVersion]:
+    row = (await session.execute(_version_query([board_id]))).one()
+    version = BoardVersion(*row)
+    return version if version.boards else None
+
+
+async def get_user_boards_version(user_id: UUID, session: AsyncSession) -> BoardVersion:
+    board_ids = select(UserUsingBoard.board_id).where(UserUsingBoard.user_id == user_id)
+    row = (await session.execute(_version_query(board_ids))).one()
+    return BoardVersion(*row)
@@ -0,0 +1,126 @@
+import asyncio
+
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    WebSocket,
+    WebSocketDisconnect,
+    WebSocketException,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from jwt import InvalidTokenError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.v1.auth.dependencies import get_verification_user
+from api.v1.auth.utils import decode_jwt
+from api.v1.users.shemas import UserSnapshot
+from core.serialization import JSONRoute
+from core.settings import config
+from database.model import UserUsingBoard
+from database.session import session_manager
+from services.feed import board_events, subscribe
+
+router = APIRouter(prefix="/feed", tags=["Feed"], route_class=JSONRoute)
+
+
+async def get_member_boards(
+    user_id: UUID, board_ids: list[UUID], session: AsyncSession
+) -> list[UUID]:
+    query = (
+        select(UserUsingBoard.board_id)
+        .where(UserUsingBoard.user_id == user_id)
+        .limit(config.feed.maxBoards)
+    )
+    if board_ids:
+        query = query.where(UserUsingBoard.board_id.in_(board_ids))
+    boards = list(await session.scalars(query))
+
+    if board_ids and len(boards) != len(set(board_ids)):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Some boards were not found",
+        )
+    return boards
+
+
+@router.get("", status_code=status.HTTP_200_OK)
+async def stream_events(
+    request: Request,
+    board_id: Annotated[list[UUID], Query()] = [],
+    user: UserSnapshot = Depends(get_verification_user),
+    session: AsyncSession = Depends(session_manager.read_session_scope),
+):
+    boards = await get_member_boards(user.id, board_id, session)
+    subscription = subscribe(boards)
+
+    async def stream():
+        with subscription:
+            yield b"retry: 3000\n\n"
+            async for message in board_events(subscription, user.id):
+                if await request.is_disconnected():
+                    break
+                if message is None:
+                    yield b": keep-alive\n\n"
+                else:
+                    yield b"data: " + message + b"\n\n"
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def authenticate_websocket(token: str, session: AsyncSession) -> UserSnapshot:
+    try:
+        payload = decode_jwt(token)
+        return await get_verification_user(payload, session)
+    except (InvalidTokenError, HTTPException, ValueError, TypeError):
+        raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION)
+
+
+@router.websocket("/ws")
+async def websocket_events(
+    websocket: WebSocket,
+    token: Annotated[str, Query()],
+    board_id: Annotated[list[UUID], Query()] = [],
+):
+    async with session_manager.read_session() as session:
+        user = await authenticate_websocket(token, session)
+        try:
+            boards = await get_member_boards(user.id, board_id, session)
+        except HTTPException:
+            raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION)
+
+    await websocket.accept()
+    with subscribe(boards) as subscription:
+
+        async def send_events():
+            async for message in board_events(subscription, user.id):
+                if message is not None:
+                    await websocket.send_text(message.decode())
+
+        async def wait_disconnect():
+            try:
+                while True:
+                    await websocket.receive_text()
+            except WebSocketDisconnect:
+                pass
+
+        sender = asyncio.create_task(send_events())
+        receiver = asyncio.create_task(wait_disconnect())
+        done, pending = await asyncio.wait(
+            {sender, receiver}, return_when=asyncio.FIRST_COMPLETED
+        )
+        for task in pending:
+            task.cancel()
+        if sender in done and receiver not in done:
+            await websocket.close()
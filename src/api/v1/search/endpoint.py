@@ -0,0 +1,57 @@
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.v1.auth.dependencies import get_verification_user
+from api.v1.search.service import task_search_query
+from api.v1.task.endpoint import serialize_task_detail
+from api.v1.users.shemas import UserSnapshot
+from core.pagination import PageParams, decode_cursor, split_page
+from core.profiler import query_budget
+from core.serialization import JSONResponse, JSONRoute
+from database.search import parse_terms, supports_search
+from database.session import session_manager
+
+router = APIRouter(prefix="/search", tags=["Search"], route_class=JSONRoute)
+
+
+@router.get("/tasks", status_code=status.HTTP_200_OK, dependencies=[query_budget(2)])
+async def search_tasks(
+    q: str = Query(..., min_length=1, max_length=200),
+    board_id: Optional[UUID] = None,
+    user: UserSnapshot = Depends(get_verification_user),
+    page: PageParams = Depends(),
+    session: AsyncSession = Depends(session_manager.read_session_scope),
+):
+    terms = parse_terms(q)
+    if not terms:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Search query has no searchable words",
+        )
+
+    dialect = session.get_bind().dialect.name
+    if not supports_search(dialect):
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Search is not available on this database",
+        )
+
+    after = decode_cursor(page.cursor, float, UUID) if page.cursor else None
+    result = await session.execute(
+        task_search_query(dialect, terms, user.id, page.limit + 1, board_id, after)
+    )
+    await session_manager.release(session)
+    rows, next_cursor = split_page(
+        result.all(), page.limit, lambda row: (row.rank, row.id)
+    )
+    return JSONResponse(
+        {
+            "items": [
+                {**serialize_task_detail(row), "board_id": row.board_id} for row in rows
+            ],
+            "next_cursor": next_cursor,
+        }
+    )
@@ -0,0 +1,39 @@
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import Select, and_, or_, select
+
+from api.v1.board.service import TASK_COLUMNS
+from database.model import Task, UserUsingBoard
+from database.search import search_clause
+
+
+def task_search_query(
+    dialect: str,
+    terms: list[tuple[str, bool]],
+    user_id: UUID,
+    limit: int,
+    board_id: Optional[UUID] = None,
+    after: Optional[tuple[float, UUID]] = None,
+) -> Select:
+    source, condition, rank = search_clause(dialect, terms)
+    query = (
+        select(*TASK_COLUMNS, Task.board_id, rank.label("rank"))
+        .select_from(source)
+        .join(
+            UserUsingBoard,
+            and_(
+                UserUsingBoard.board_id == Task.board_id,
+                UserUsingBoard.user_id == user_id,
+            ),
+        )
+        .where(condition)
+    )
+    if board_id is not None:
+        query = query.where(Task.board_id == board_id)
+    if after is not None:
+        after_rank, after_id = after
+        query = query.where(
+            or_(rank > after_rank, and_(rank == after_rank, Task.id > after_id))
+        )
+    return query.order_by(rank, Task.id).limit(limit)
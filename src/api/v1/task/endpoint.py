@@ -0,0 +1,264 @@
+from datetime import datetime
+from operator import itemgetter
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.v1.board.permissions import board_role, lookup_role
+from api.v1.board.service import TASK_COLUMNS
+from api.v1.task.service import (
+    TaskFilters,
+    bulk_delete_tasks,
+    bulk_insert_tasks,
+    bulk_update_tasks,
+    get_board_member_ids,
+    get_board_task_ids,
+    task_list_query,
+)
+from api.v1.task.shemas import (
+    TaskBulkCreate,
+    TaskBulkDelete,
+    TaskBulkUpdate,
+    TaskCreate,
+    TaskUpdate,
+)
+from core.pagination import PageParams, decode_cursor, split_page
+from core.profiler import query_budget
+from core.serialization import JSONResponse, JSONRoute
+from database.model import Role, Task
+from database.session import session_manager
+
+router = APIRouter(
+    prefix="/board/{board_id}/tasks", tags=["Task"], route_class=JSONRoute
+)
+
+
+TASK_FIELDS = tuple(column.key for column in TASK_COLUMNS)
+
+
+_task_values = itemgetter(*TASK_FIELDS)
+
+
+def serialize_task_detail(task) -> dict:
+    # Raw values: UUIDs, enums and datetimes are encoded by core.serialization.
+    # Rows are read by column name, so they may carry TASK_COLUMNS in any
+    # order; one itemgetter call over the mapping is several times cheaper
+    # than a Row attribute lookup per field.
+    if isinstance(task, Row):
+        return dict(zip(TASK_FIELDS, _task_values(task._mapping)))
+    return {field: getattr(task, field) for field in TASK_FIELDS}
+
+
+NOT_NULL_FIELDS = {
+    "title": "Task title cannot be empty",
+    "priority": "Task priority cannot be null",
+    "status": "Task status cannot be null",
+}
+
+
+def null_violation(changes: dict) -> Optional[str]:
+    for field, detail in NOT_NULL_FIELDS.items():
+        if field in changes and changes[field] is None:
+            return detail
+    return None
+
+
+async def ensure_assignable(
+    board_id: UUID, user_id: UUID | None, session: AsyncSession
+) -> None:
+    if user_id is not None and await lookup_role(user_id, board_id, session) is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Tasks can only be assigned to board members",
+        )
+
+
+async def get_board_task(board_id: UUID, task_id: UUID, session: AsyncSession) -> Task:
+    task = await session.get(Task, task_id)
+    if task is None or task.board_id != board_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Task with id {task_id} not found",
+        )
+    return task
+
+
+@router.get(
+    "",
+    status_code=status.HTTP_200_OK,
+    dependencies=[query_budget(3), board_role()],
+)
+async def get_tasks(
+    board_id: UUID,
+    filters: TaskFilters = Depends(),
+    page: PageParams = Depends(),
+    session: AsyncSession = Depends(session_manager.read_session_scope),
+):
+    after = decode_cursor(page.cursor, datetime, UUID) if page.cursor else None
+    result = await session.execute(
+        task_list_query(board_id, filters, page.limit + 1, after)
+    )
+    await session_manager.release(session)
+    tasks, next_cursor = split_page(
+        result.all(), page.limit, lambda task: (task.deadline, task.id)
+    )
+    return JSONResponse(
+        {
+            "items": [serialize_task_detail(task) for task in tasks],
+            "next_cursor": next_cursor,
+        }
+    )
+
+
+@router.post("", status_code=status.HTTP_201_CREATED, dependencies=[board_role()])
+async def create_task(
+    board_id: UUID,
+    data: TaskCreate,
+    session: AsyncSession = Depends(session_manager.session_scope),
+):
+    await ensure_assignable(board_id, data.assigned_user_id, session)
+
+    task = Task(board_id=board_id, **data.model_dump())
+    session.add(task)
+    await session.commit()
+
+    return JSONResponse(serialize_task_detail(task), status.HTTP_201_CREATED)
+
+
+@router.post("/bulk", status_code=status.HTTP_200_OK, dependencies=[board_role()])
+async def bulk_create_tasks(
+    board_id: UUID,
+    data: TaskBulkCreate,
+    session: AsyncSession = Depends(session_manager.session_scope),
+):
+    members = await get_board_member_ids(
+        board_id, (item.assigned_user_id for item in data.items), session
+    )
+
+    results: list[dict] = [{"index": index} for index in range(len(data.items))]
+    accepted = []
+    for result, item in zip(results, data.items):
+        if item.assigned_user_id is not None and item.assigned_user_id not in members:
+            result.update(status="invalid", detail="Assignee is not a board member")
+        else:
+            accepted.append((result, item.model_dump()))
+
+    task_ids = await bulk_insert_tasks(
+        board_id, [values for _, values in accepted], session
+    )
+    for (result, _), task_id in zip(accepted, task_ids):
+        result.update(status="created", id=task_id)
+    await session.commit()
+
+    return JSONResponse({"results": results})
+
+
+@router.patch("/bulk", status_code=status.HTTP_200_OK, dependencies=[board_role()])
+async def bulk_patch_tasks(
+    board_id: UUID,
+    data: TaskBulkUpdate,
+    session: AsyncSession = Depends(session_manager.session_scope),
+):
+    patches = [item.model_dump(exclude_unset=True) for item in data.items]
+    existing = await get_board_task_ids(board_id, (p["id"] for p in patches), session)
+    members = await get_board_member_ids(
+        board_id,
+        (p["assigned_user_id"] for p in patches if p.get("assigned_user_id")),
+        session,
+    )
+
+    results: list[dict] = []
+    accepted, seen = [], set()
+    for index, patch in enumerate(patches):
+        result = {"index": index, "id": patch["id"]}
+        results.append(result)
+        assignee = patch.get("assigned_user_id")
+        if patch["id"] not in existing:
+            result.update(status="not_found")
+        elif patch["id"] in seen:
+            result.update(status="invalid", detail="Duplicate task id")
+        elif detail := null_violation(patch):
+            result.update(status="invalid", detail=detail)
+        elif assignee is not None and assignee not in members:
+            result.update(status="invalid", detail="Assignee is not a board member")
+        elif len(patch) == 1:
+            seen.add(patch["id"])
+            result.update(status="unchanged")
+        else:
+            seen.add(patch["id"])
+            accepted.append(patch)
+            result.update(status="updated")
+
+    await bulk_update_tasks(board_id, accepted, session)
+    await session.commit()
+
+    return JSONResponse({"results": results})
+
+
+@router.post(
+    "/bulk/delete",
+    status_code=status.HTTP_200_OK,
+    dependencies=[board_role(Role.ADMIN)],
+)
+async def bulk_remove_tasks(
+    board_id: UUID,
+    data: TaskBulkDelete,
+    session: AsyncSession = Depends(session_manager.session_scope),
+):
+    deleted = await bulk_delete_tasks(board_id, data.ids, session)
+    await session.commit()
+
+    results: list[dict] = []
+    seen = set()
+    for index, task_id in enumerate(data.ids):
+        result = {"index": index, "id": task_id}
+        results.append(result)
+        if task_id in seen:
+            result.update(status="invalid", detail="Duplicate task id")
+        else:
+            seen.add(task_id)
+            result.update(status="deleted" if task_id in deleted else "not_found")
+
+    return JSONResponse({"results": results})
+
+
+@router.patch("/{task_id}", status_code=status.HTTP_200_OK, dependencies=[board_role()])
+async def update_task(
+    board_id: UUID,
+    task_id: UUID,
+    data: TaskUpdate,
+    session: AsyncSession = Depends(session_manager.session_scope),
+):
+    task = await get_board_task(board_id, task_id, session)
+
+    changes = data.model_dump(exclude_unset=True)
+    detail = null_violation(changes)
+    if detail is not None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+    if "assigned_user_id" in changes:
+        await ensure_assignable(board_id, changes["assigned_user_id"], session)
+
+    for field, value in changes.items():
+        setattr(task, field, value)
+    await session.commit()
+
+    return JSONResponse(serialize_task_detail(task))
+
+
+@router.delete(
+    "/{task_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[board_role(Role.ADMIN)],
+)
+async def delete_task(
+    board_id: UUID,
+    task_id: UUID,
+    session: AsyncSession = Depends(session_manager.session_scope),
+):
+    task = await get_board_task(board_id, task_id, session)
+
+    await session.delete(task)
+    await session.commit()
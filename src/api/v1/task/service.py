@@ -0,0 +1,171 @@
+from datetime import datetime
+from typing import Iterable, Literal, Optional
+from uuid import UUID, uuid4
+
+from fastapi import Query
+from sqlalchemy import (
+    Select,
+    and_,
+    bindparam,
+    delete,
+    insert,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.v1.board.service import TASK_COLUMNS
+from api.v1.task.shemas import as_naive_utc
+from database.events import track
+from database.model import Priority, Status, Task, UserUsingBoard
+
+SortOrder = Literal["asc", "desc"]
+
+
+class TaskFilters:
+    def __init__(
+        self,
+        status: Optional[Status] = Query(None),
+        priority: Optional[Priority] = Query(None),
+        deadline_from: Optional[datetime] = Query(None),
+        deadline_to: Optional[datetime] = Query(None),
+        order: SortOrder = Query("asc"),
+    ):
+        self.status = status
+        self.priority = priority
+        self.deadline_from = as_naive_utc(deadline_from)
+        self.deadline_to = as_naive_utc(deadline_to)
+        self.order = order
+
+
+def _after_asc(deadline: Optional[datetime], task_id: UUID):
+    if deadline is None:
+        return and_(Task.deadline.is_(None), Task.id > task_id)
+    return or_(
+        Task.deadline > deadline,
+        and_(Task.deadline == deadline, Task.id > task_id),
+        Task.deadline.is_(None),
+    )
+
+
+def _after_desc(deadline: Optional[datetime], task_id: UUID):
+    if deadline is None:
+        return or_(
+            and_(Task.deadline.is_(None), Task.id < task_id),
+            Task.deadline.is_not(None),
+        )
+    return or_(
+        Task.deadline < deadline,
+        and_(Task.deadline == deadline, Task.id < task_id),
+    )
+
+
+def task_list_query(
+    board_id: UUID,
+    filters: TaskFilters,
+    limit: int,
+    after: Optional[tuple[Optional[datetime], UUID]] = None,
+) -> Select:
+    query = select(*TASK_COLUMNS).where(Task.board_id == board_id)
+    if filters.status is not None:
+        query = query.where(Task.status == filters.status)
+    if filters.priority is not None:
+        query = query.where(Task.priority == filters.priority)
+    if filters.deadline_from is not None:
+        query = query.where(Task.deadline >= filters.deadline_from)
+    if filters.deadline_to is not None:
+        query = query.where(Task.deadline < filters.deadline_to)
+
+    if after is not None:
+        after = (as_naive_utc(after[0]), after[1])
+    if filters.order == "desc":
+        query = query.order_by(Task.deadline.desc().nulls_first(), Task.id.desc())
+        if after is not None:
+            query = query.where(_after_desc(*after))
+    else:
+        query = query.order_by(Task.deadline.asc().nulls_last(), Task.id)
+        if after is not None:
+            query = query.where(_after_asc(*after))
+
+    return query.limit(limit)
+
+
+async def get_board_member_ids(
+    board_id: UUID, user_ids: Iterable[UUID], session: AsyncSession
+) -> set[UUID]:
+    user_ids = set(user_ids)
+    if not user_ids:
+        return set()
+    result = await session.scalars(
+        select(UserUsingBoard.user_id).where(
+            UserUsingBoard.board_id == board_id,
+            UserUsingBoard.user_id.in_(user_ids),
+        )
+    )
+    return set(result)
+
+
+async def get_board_task_ids(
+    board_id: UUID, task_ids: Iterable[UUID], session: AsyncSession
+) -> set[UUID]:
+    result = await session.scalars(
+        select(Task.id).where(Task.board_id == board_id, Task.id.in_(set(task_ids)))
+    )
+    return set(result)
+
+
+async def bulk_insert_tasks(
+    board_id: UUID, items: list[dict], session: AsyncSession
+) -> list[UUID]:
+    rows = [{**item, "id": uuid4(), "board_id": board_id} for item in items]
+    if rows:
+        await session.execute(insert(Task).values(rows))
+        for row in rows:
+            track(session, "insert", Task, row)
+    return [row["id"] for row in rows]
+
+
+async def bulk_update_tasks(
+    board_id: UUID, patches: list[dict], session: AsyncSession
+) -> None:
+    by_columns: dict[frozenset, list[dict]] = {}
+    for patch in patches:
+        if len(patch) > 1:
+            by_columns.setdefault(frozenset(patch), []).append(patch)
+
+    table = Task.__table__
+    for columns, group in by_columns.items():
+        statement = (
+            update(table)
+            .where(table.c.id == bindparam("_id"), table.c.board_id == board_id)
+            .values({column: bindparam(f"_{column}") for column in columns - {"id"}})
+        )
+        await session.execute(
+            statement,
+            [{f"_{key}": value for key, value in patch.items()} for patch in group],
+        )
+
+    for patch in patches:
+        track(
+            session,
+            "update",
+            Task,
+            {**patch, "board_id": board_id},
+            frozenset(patch) - {"id"},
+        )
+
+
+async def bulk_delete_tasks(
+    board_id: UUID, task_ids: Iterable[UUID], session: AsyncSession
+) -> set[UUID]:
+    result = await session.scalars(
+        delete(Task)
+        .where(Task.board_id == board_id, Task.id.in_(set(task_ids)))
+        .returning(Task.id)
+        .execution_options(synchronize_session=False)
+    )
+    deleted = set(result)
+    for task_id in deleted:
+        track(session, "delete", Task, {"id": task_id, "board_id": board_id})
+    return deleted
@@ -0,0 +1,54 @@
+from datetime import datetime, timezone
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field, field_validator
+
+from database.model import Priority, Status
+
+
+def as_naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+class TaskCreate(BaseModel):
+    title: str = Field(min_length=1)
+    description: Optional[str] = None
+    deadline: Optional[datetime] = None
+    priority: Priority = Priority.MEDIUM
+    status: Status = Status.TODO
+    assigned_user_id: Optional[UUID] = None
+
+    _naive_deadline = field_validator("deadline")(as_naive_utc)
+
+
+class TaskUpdate(BaseModel):
+    title: Optional[str] = Field(None, min_length=1)
+    description: Optional[str] = None
+    deadline: Optional[datetime] = None
+    priority: Optional[Priority] = None
+    status: Optional[Status] = None
+    assigned_user_id: Optional[UUID] = None
+
+    _naive_deadline = field_validator("deadline")(as_naive_utc)
+
+
+MAX_BULK_ITEMS = 1000
+
+
+class TaskPatch(TaskUpdate):
+    id: UUID
+
+
+class TaskBulkCreate(BaseModel):
+    items: list[TaskCreate] = Field(min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class TaskBulkUpdate(BaseModel):
+    items: list[TaskPatch] = Field(min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class TaskBulkDelete(BaseModel):
+    ids: list[UUID] = Field(min_length=1, max_length=MAX_BULK_ITEMS)
@@ -0,0 +1,31 @@
+from typing import Optional
+from uuid import UUID
+
+from api.v1.users.shemas import UserSnapshot
+from core.cache import TTLCache
+from core.metrics import track_cache
+from core.settings import config
+from database.events import Change, on_commit
+from database.model import User
+
+user_cache = TTLCache(
+    maxsize=config.cache.users.maxSize,
+    ttl=config.cache.users.ttl,
+)
+track_cache("users", user_cache)
+
+
+def get_cached_user(user_id: UUID) -> Optional[UserSnapshot]:
+    return user_cache.get(user_id)
+
+
+def cache_user(user: User) -> UserSnapshot:
+    snapshot = UserSnapshot.model_validate(user)
+    user_cache.set(snapshot.id, snapshot)
+    return snapshot
+
+
+@on_commit(User)
+def _invalidate_users(changes: list[Change]) -> None:
+    for change in changes:
+        user_cache.pop(change.values.get("id"))
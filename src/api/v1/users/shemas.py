@@ -30,3 +30,7 @@ class UserRead(UserBase):
 
 class UserDTO(UserRead):
     password_hash: SecretStr
+
+
+class UserSnapshot(UserRead):
+    model_config = ConfigDict(from_attributes=True, frozen=True)
@@ -1,39 +1,103 @@
+import asyncio
+
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import ORJSONResponse
+from fastapi.responses import PlainTextResponse
 from loguru import logger
 
+from core.metrics import (
+    MetricsMiddleware,
+    SnapshotStore,
+    merge_snapshots,
+    registry,
+    render,
+)
+from core.profiler import QueryProfilerMiddleware, query_profiler
+from core.serialization import JSONResponse
 from core.settings import config
-from database.model import CoreModel
+from database.schema import SchemaOutOfDate, check_schema
 from database.session import session_manager
+from services.audit import audit_log
+from services.feed import broker
+from services.notifications import create_deadline_scheduler
+
+deadline_scheduler = create_deadline_scheduler(session_manager.read_session)
+metrics_store = SnapshotStore(config.metrics.directory)
+
+
+def shares_metrics() -> bool:
+    return config.metrics.enabled and config.uvicorn.workers > 1
+
+
+async def publish_metrics():
+    while True:
+        await asyncio.to_thread(metrics_store.write, registry.snapshot())
+        await asyncio.sleep(config.metrics.flushInterval)
+
+
+async def metrics_endpoint():
+    if shares_metrics():
+        await asyncio.to_thread(metrics_store.write, registry.snapshot())
+        snapshot = merge_snapshots(await asyncio.to_thread(metrics_store.read_all))
+    else:
+        snapshot = registry.snapshot()
+    return PlainTextResponse(render(snapshot), media_type="text/plain; version=0.0.4")
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    async with session_manager.engine.begin() as conn:
-        await conn.run_sync(CoreModel.metadata.create_all)
+    # Migrations run out-of-band, or from main.py in development; workers
+    # only confirm the revision.
+    if config.database.checkSchema:
+        try:
+            await check_schema(session_manager.engine)
+        except SchemaOutOfDate:
+            # Pooled aiosqlite connections run on threads that would keep
+            # the failed process alive.
+            await session_manager.dispose()
+            raise
+    if config.database.prewarm:
+        await session_manager.prewarm(config.database.prewarm)
     logger.info("Starting up application...")
+    await broker.start()
+    if config.notifications.enabled:
+        deadline_scheduler.start()
+    if config.audit.enabled:
+        audit_log.start()
+    if shares_metrics():
+        publisher = asyncio.create_task(publish_metrics())
     yield
     logger.info("Shutting down application...")
+    if shares_metrics():
+        publisher.cancel()
+        metrics_store.remove()
+    await deadline_scheduler.stop()
+    await audit_log.stop()
+    await broker.stop()
     await session_manager.dispose()
+    if query_profiler.enabled:
+        query_profiler.report()
 
 
 def setup_global_exception_handlers(app: FastAPI):
     @app.exception_handler(HTTPException)
     async def http_exception_handler(request: Request, exc: HTTPException):
-        logger.error(f"HTTP Exception: {exc.detail}")
-        return ORJSONResponse(
+        level = "ERROR" if exc.status_code >= 500 else "WARNING"
+        logger.log(
+            level, "HTTP {} {}: {}", exc.status_code, request.url.path, exc.detail
+        )
+        return JSONResponse(
             status_code=exc.status_code,
             content={"detail": exc.detail},
         )
 
     @app.exception_handler(Exception)
     async def general_exception_handler(request: Request, exc: Exception):
-        logger.error(f"Unhandled error occurred: {exc}")
-        return ORJSONResponse(
+        logger.opt(exception=exc).error("Unhandled error occurred: {}", exc)
+        return JSONResponse(
             status_code=500,
             content={"detail": "Internal Server Error"},
         )
@@ -44,7 +108,7 @@ def create_app():
         title=config.project.name,
         version=config.project.version,
         description=config.project.description,
-        default_response_class=ORJSONResponse,
+        default_response_class=JSONResponse,
         lifespan=lifespan,
     )
 
@@ -57,9 +121,15 @@ def create_app():
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    app.add_middleware(QueryProfilerMiddleware, profiler=query_profiler)
+    if config.metrics.enabled:
+        app.add_middleware(MetricsMiddleware, stage="raw")
     app.add_middleware(
         GZipMiddleware,
         minimum_size=400,
     )
+    if config.metrics.enabled:
+        app.add_middleware(MetricsMiddleware, stage="sent")
+        app.add_api_route("/metrics", metrics_endpoint, include_in_schema=False)
 
     return app
@@ -1,10 +1,169 @@
+import random
 import sys
+import threading
+import time
+import traceback
 
+from collections import deque
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
+
+import orjson
 
 from loguru import logger
 
+CRITICAL_LEVEL = 50
+
+
+class RateLimitFilter:
+    """Token bucket per call site; over budget, only a sample gets through.
+
+    The next record let through from a throttled call site carries the
+    number of records dropped in the meantime as `extra["suppressed"]`.
+    """
+
+    def __init__(self, rate: float, burst: int, sample_rate: float):
+        self.rate = rate
+        self.burst = burst
+        self.sample_rate = sample_rate
+        self._buckets: dict[tuple, tuple[float, float]] = {}
+        self._suppressed: dict[tuple, int] = {}
+
+    def __call__(self, record: dict) -> bool:
+        if record["level"].no >= CRITICAL_LEVEL:
+            return True
+
+        key = (record["name"], record["function"], record["line"])
+        now = time.monotonic()
+        tokens, updated_at = self._buckets.get(key, (self.burst, now))
+        tokens = min(self.burst, tokens + (now - updated_at) * self.rate)
+
+        if tokens >= 1:
+            self._buckets[key] = (tokens - 1, now)
+        else:
+            self._buckets[key] = (tokens, now)
+            if random.random() >= self.sample_rate:
+                self._suppressed[key] = self._suppressed.get(key, 0) + 1
+                return False
+            record["extra"]["sampled"] = self.sample_rate
+
+        suppressed = self._suppressed.pop(key, 0)
+        if suppressed:
+            record["extra"]["suppressed"] = suppressed
+        return True
+
+
+def _compact(record: dict) -> dict:
+    entry = {
+        "ts": record["time"],
+        "level": record["level"].name,
+        "logger": record["name"],
+        "fn": record["function"],
+        "line": record["line"],
+        "msg": record["message"],
+    }
+    if record["extra"]:
+        entry.update(record["extra"])
+    if record["exception"] is not None:
+        entry["exc"] = record["exception"]
+    return entry
+
+
+class BatchedJSONSink:
+    """Loguru sink writing one compact JSON object per line.
+
+    `write` only appends to a bounded buffer, so logging never waits on
+    I/O; a background thread serializes and writes the buffer in batches.
+    When the buffer is full new records are dropped and counted, and the
+    count is reported in the next batch.
+    """
+
+    def __init__(
+        self,
+        stream: BinaryIO,
+        batch_size: int,
+        flush_interval: float,
+        buffer_size: int,
+    ):
+        self.stream = stream
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.buffer_size = buffer_size
+        self.dropped = 0
+        self._buffer: deque[dict] = deque()
+        self._wakeup = threading.Event()
+        self._stopped = False
+        self._thread = threading.Thread(
+            target=self._run, name="log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def write(self, message) -> None:
+        if len(self._buffer) >= self.buffer_size:
+            self.dropped += 1
+            return
+        self._buffer.append(_compact(message.record))
+        if len(self._buffer) >= self.batch_size:
+            self._wakeup.set()
+
+    def stop(self) -> None:
+        self._stopped = True
+        self._wakeup.set()
+        self._thread.join()
+        self._drain()
+
+    def _run(self) -> None:
+        while not self._stopped:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self._drain()
+
+    def _drain(self) -> None:
+        lines = []
+        while self._buffer:
+            entry = self._buffer.popleft()
+            exception = entry.get("exc")
+            if exception is not None:
+                entry["exc"] = "".join(traceback.format_exception(*exception))
+            lines.append(orjson.dumps(entry, default=str))
+        if self.dropped:
+            dropped, self.dropped = self.dropped, 0
+            lines.append(
+                orjson.dumps(
+                    {
+                        "level": "WARNING",
+                        "logger": __name__,
+                        "msg": f"Dropped {dropped} log records",
+                    }
+                )
+            )
+        if lines:
+            self.stream.write(b"\n".join(lines) + b"\n")
+            self.stream.flush()
+
+
+def production_logger_init(
+    level: str = "INFO",
+    path: Optional[str] = None,
+    batch_size: int = 512,
+    flush_interval: float = 0.5,
+    buffer_size: int = 10_000,
+    rate: float = 10.0,
+    burst: int = 50,
+    sample_rate: float = 0.01,
+) -> None:
+    logger.remove()
+    stream = open(path, "ab") if path else sys.stderr.buffer
+    logger.add(
+        BatchedJSONSink(stream, batch_size, flush_interval, buffer_size),
+        level=level,
+        format="{message}",
+        filter=RateLimitFilter(rate, burst, sample_rate),
+        backtrace=False,
+        diagnose=False,
+        catch=False,
+    )
+
 
 def logger_init(
     level: str = "DEBUG",
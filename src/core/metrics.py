@@ -0,0 +1,323 @@
+import os
+import time
+
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+import orjson
+
+# Everything below is mutated from the event loop thread only, so plain
+# dicts are enough: no locks on the request path.
+
+DEFAULT_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+COUNT_BUCKETS = (1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+
+
+class Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self.values: dict[tuple, object] = {}
+
+    def snapshot(self) -> dict:
+        return {
+            "kind": self.kind,
+            "help": self.help,
+            "labelnames": list(self.labelnames),
+            "values": [[list(labels), value] for labels, value in self.values.items()],
+        }
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self.values[labels] = self.values.get(labels, 0.0) + amount
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def set(self, value: float, *labels: str) -> None:
+        self.values[labels] = value
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self.values[labels] = self.values.get(labels, 0.0) + amount
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float, *labels: str) -> None:
+        # [per-bucket counts..., +Inf count, sum]
+        state = self.values.get(labels)
+        if state is None:
+            state = self.values[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        state[bisect_left(self.buckets, value)] += 1
+        state[-1] += value
+
+    def snapshot(self) -> dict:
+        return {**super().snapshot(), "buckets": list(self.buckets)}
+
+
+class Registry:
+    def __init__(self):
+        self.metrics: dict[str, Metric] = {}
+        self.collectors: list[Callable[[], None]] = []
+
+    def register(self, metric: Metric) -> Metric:
+        self.metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str, labelnames=()) -> Counter:
+        return self.register(Counter(name, help, tuple(labelnames)))
+
+    def gauge(self, name: str, help: str, labelnames=()) -> Gauge:
+        return self.register(Gauge(name, help, tuple(labelnames)))
+
+    def histogram(
+        self, name: str, help: str, labelnames=(), buckets=DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, help, tuple(labelnames), buckets))
+
+    def collector(self, collect: Callable[[], None]) -> Callable[[], None]:
+        """Registers a callback that refreshes gauges right before a scrape."""
+        self.collectors.append(collect)
+        return collect
+
+    def snapshot(self) -> dict:
+        for collect in self.collectors:
+            collect()
+        return {name: metric.snapshot() for name, metric in self.metrics.items()}
+
+
+def merge_snapshots(snapshots: Iterable[dict]) -> dict:
+    # Counters, gauges and histogram buckets all add up across workers:
+    # gauges here are totals such as in-flight requests or open connections.
+    merged: dict[str, dict] = {}
+    for snapshot in snapshots:
+        for name, metric in snapshot.items():
+            target = merged.setdefault(name, {**metric, "values": {}})
+            for labels, value in metric["values"]:
+                key = tuple(labels)
+                current = target["values"].get(key)
+                if current is None:
+                    target["values"][key] = value
+                elif isinstance(value, list):
+                    target["values"][key] = [a + b for a, b in zip(current, value)]
+                else:
+                    target["values"][key] = current + value
+    for metric in merged.values():
+        metric["values"] = [[list(k), v] for k, v in metric["values"].items()]
+    return merged
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: Iterable[str], values: Iterable[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def render(snapshot: dict) -> str:
+    lines = []
+    for name, metric in sorted(snapshot.items()):
+        lines.append(f"# HELP {name} {metric['help']}")
+        lines.append(f"# TYPE {name} {metric['kind']}")
+        names = metric["labelnames"]
+        for labels, value in metric["values"]:
+            if metric["kind"] != "histogram":
+                lines.append(f"{name}{_labels(names, labels)} {value}")
+                continue
+            cumulative = 0
+            for bound, count in zip(metric["buckets"] + ["+Inf"], value[:-1]):
+                cumulative += count
+                le = f'le="{bound}"'
+                lines.append(f"{name}_bucket{_labels(names, labels, le)} {cumulative}")
+            lines.append(f"{name}_sum{_labels(names, labels)} {value[-1]}")
+            lines.append(f"{name}_count{_labels(names, labels)} {cumulative}")
+    return "\n".join(lines) + "\n"
+
+
+class SnapshotStore:
+    """Shares metrics between worker processes through per-pid files.
+
+    Each worker rewrites its own file; whichever worker serves the scrape
+    merges every file whose process is still alive.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.path = self.directory / f"{os.getpid()}.json"
+
+    def write(self, snapshot: dict) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_suffix(".tmp")
+        temporary.write_bytes(orjson.dumps(snapshot))
+        temporary.replace(self.path)
+
+    def read_all(self) -> list[dict]:
+        snapshots = []
+        for path in self.directory.glob("*.json"):
+            try:
+                os.kill(int(path.stem), 0)
+            except (ValueError, ProcessLookupError):
+                path.unlink(missing_ok=True)
+                continue
+            except PermissionError:
+                pass
+            try:
+                snapshots.append(orjson.loads(path.read_bytes()))
+            except (OSError, orjson.JSONDecodeError):
+                continue
+        return snapshots
+
+    def remove(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+
+@dataclass(slots=True)
+class RequestStats:
+    statements: int = 0
+    db_time: float = 0.0
+
+
+request_stats: ContextVar[Optional[RequestStats]] = ContextVar(
+    "request_stats", default=None
+)
+
+registry = Registry()
+
+http_requests = registry.counter(
+    "http_requests_total", "HTTP requests", ("method", "route", "status")
+)
+http_latency = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency", ("method", "route")
+)
+http_in_flight = registry.gauge("http_requests_in_flight", "HTTP requests in flight")
+http_response_size = registry.histogram(
+    "http_response_size_bytes",
+    "Response body size before and after compression",
+    ("route", "stage"),
+    SIZE_BUCKETS,
+)
+http_statements = registry.histogram(
+    "http_request_db_statements",
+    "SQL statements executed per request",
+    ("route",),
+    COUNT_BUCKETS,
+)
+http_db_time = registry.histogram(
+    "http_request_db_seconds", "Time spent in SQL per request", ("route",)
+)
+
+
+def route_label(scope: dict) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", "unmatched")
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware; `stage` tells the body size measured.
+
+    create_app installs one instance inside GZipMiddleware ("raw") and one
+    around it ("sent"). The outer one also owns latency and DB counters.
+    """
+
+    def __init__(self, app, stage: str):
+        self.app = app
+        self.stage = stage
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        size = 0
+        status = 500
+
+        async def counting_send(message):
+            nonlocal size, status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        if self.stage != "sent":
+            try:
+                await self.app(scope, receive, counting_send)
+            finally:
+                http_response_size.observe(size, route_label(scope), self.stage)
+            return
+
+        stats = RequestStats()
+        token = request_stats.set(stats)
+        http_in_flight.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, counting_send)
+        finally:
+            elapsed = time.perf_counter() - started
+            http_in_flight.dec()
+            request_stats.reset(token)
+
+            route = route_label(scope)
+            method = scope["method"]
+            http_requests.inc(method, route, str(status))
+            http_latency.observe(elapsed, method, route)
+            http_response_size.observe(size, route, self.stage)
+            http_statements.observe(stats.statements, route)
+            http_db_time.observe(stats.db_time, route)
+
+
+cache_entries = registry.gauge("cache_entries", "Entries held by a cache", ("cache",))
+cache_hits = registry.counter("cache_hits_total", "Cache hits", ("cache",))
+cache_misses = registry.counter("cache_misses_total", "Cache misses", ("cache",))
+
+
+def track_cache(name: str, cache) -> None:
+    @registry.collector
+    def collect() -> None:
+        stats = cache.stats()
+        cache_entries.set(stats["size"], name)
+        cache_hits.values[(name,)] = stats["hits"]
+        cache_misses.values[(name,)] = stats["misses"]
@@ -0,0 +1,61 @@
+import base64
+import binascii
+
+from datetime import datetime
+from typing import Any, Callable, Optional
+from uuid import UUID
+
+import orjson
+
+from fastapi import HTTPException, Query, status
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+class PageParams:
+    def __init__(
+        self,
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        cursor: Optional[str] = Query(None),
+    ):
+        self.limit = limit
+        self.cursor = cursor
+
+
+def encode_cursor(*values: Any) -> str:
+    return base64.urlsafe_b64encode(orjson.dumps(values)).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, *types: type) -> tuple:
+    invalid_cursor = HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Invalid pagination cursor",
+    )
+    try:
+        raw = orjson.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(raw, list) or len(raw) != len(types):
+            raise invalid_cursor
+        return tuple(
+            None if value is None else _parse(value, kind)
+            for value, kind in zip(raw, types)
+        )
+    except (binascii.Error, orjson.JSONDecodeError, TypeError, ValueError):
+        raise invalid_cursor
+
+
+def _parse(value: Any, kind: type) -> Any:
+    if kind is datetime:
+        return datetime.fromisoformat(value)
+    if kind is UUID:
+        return UUID(value)
+    return kind(value)
+
+
+def split_page(
+    rows: list, limit: int, cursor_of: Callable[[Any], tuple]
+) -> tuple[list, Optional[str]]:
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(*cursor_of(rows[-1]))
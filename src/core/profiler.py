@@ -0,0 +1,172 @@
+import re
+
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Optional
+
+from fastapi import Depends, Request
+from loguru import logger
+
+from core.metrics import route_label
+from core.settings import config
+
+_IN_LIST = re.compile(
+    r"\(\s*\?(?:\s*,\s*\?)+\s*\)|\(\s*%\(\w+\)s(?:\s*,\s*%\(\w+\)s)+\s*\)"
+)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    # Expanded IN lists differ only by their length; fold them together.
+    return _IN_LIST.sub("(?...)", _WHITESPACE.sub(" ", statement).strip())
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+@dataclass(slots=True)
+class QueryProfile:
+    route: str = "unmatched"
+    statements: int = 0
+    db_time: float = 0.0
+    budget: Optional[int] = None
+    shapes: dict[str, list] = field(default_factory=dict)
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.statements += 1
+        self.db_time += elapsed
+        shape = self.shapes.setdefault(statement_shape(statement), [0, 0.0])
+        shape[0] += 1
+        shape[1] += elapsed
+
+    def repeated(self, threshold: int) -> list[tuple[str, int, float]]:
+        return [
+            (shape, count, elapsed)
+            for shape, (count, elapsed) in self.shapes.items()
+            if count >= threshold
+        ]
+
+
+@dataclass(slots=True)
+class RouteSummary:
+    requests: int = 0
+    statements: int = 0
+    max_statements: int = 0
+    db_time: float = 0.0
+    over_budget: int = 0
+    repeated: dict[str, int] = field(default_factory=dict)
+
+
+current_profile: ContextVar[Optional[QueryProfile]] = ContextVar(
+    "current_profile", default=None
+)
+
+
+class QueryProfiler:
+    """Counts statements per request and flags N+1 shapes.
+
+    Meant for development and tests. With `strict` set, a route that goes
+    over its declared `query_budget` fails with QueryBudgetExceeded instead
+    of only being logged.
+    """
+
+    def __init__(self, enabled: bool, strict: bool, repeat_threshold: int):
+        self.enabled = enabled
+        self.strict = strict
+        self.repeat_threshold = repeat_threshold
+        self.routes: dict[str, RouteSummary] = {}
+
+    def check(self, profile: QueryProfile) -> None:
+        if profile.budget is None or profile.statements <= profile.budget:
+            return
+        message = (
+            f"{profile.route} ran {profile.statements} statements, "
+            f"budget is {profile.budget}"
+        )
+        if self.strict:
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
+
+    def finish(self, profile: QueryProfile) -> None:
+        summary = self.routes.setdefault(profile.route, RouteSummary())
+        summary.requests += 1
+        summary.statements += profile.statements
+        summary.max_statements = max(summary.max_statements, profile.statements)
+        summary.db_time += profile.db_time
+        if profile.budget is not None and profile.statements > profile.budget:
+            summary.over_budget += 1
+        for shape, count, elapsed in profile.repeated(self.repeat_threshold):
+            summary.repeated[shape] = max(summary.repeated.get(shape, 0), count)
+            logger.warning(
+                "Possible N+1 on {}: {} runs ({:.1f}ms) of {}",
+                profile.route,
+                count,
+                elapsed * 1000,
+                shape,
+            )
+
+    def report(self, top: int = 10) -> None:
+        if not self.routes:
+            return
+        worst = sorted(
+            self.routes.items(),
+            key=lambda item: (item[1].max_statements, item[1].db_time),
+            reverse=True,
+        )[:top]
+        lines = [
+            f"{route}: max {s.max_statements} statements, "
+            f"avg {s.statements / s.requests:.1f}, "
+            f"avg DB {s.db_time / s.requests * 1000:.1f}ms over {s.requests} requests"
+            + (f", {s.over_budget} over budget" if s.over_budget else "")
+            + (f", {len(s.repeated)} repeated shapes" if s.repeated else "")
+            for route, s in worst
+        ]
+        logger.info("Query profile by route:\n{}", "\n".join(lines))
+
+
+class QueryProfilerMiddleware:
+    def __init__(self, app, profiler: QueryProfiler):
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.profiler.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        profile = QueryProfile()
+        token = current_profile.set(profile)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_profile.reset(token)
+            profile.route = f"{scope['method']} {route_label(scope)}"
+            self.profiler.finish(profile)
+
+
+def query_budget(limit: int):
+    """Route dependency declaring the most statements a request may run.
+
+    The check runs when the dependency exits, after the handler and its
+    serialization, so the whole request is counted.
+    """
+
+    async def dependency(request: Request):
+        profile = current_profile.get()
+        if profile is None:
+            yield
+            return
+        profile.budget = limit
+        yield
+        profile.route = f"{request.method} {route_label(request.scope)}"
+        query_profiler.check(profile)
+
+    return Depends(dependency)
+
+
+query_profiler = QueryProfiler(
+    enabled=config.development or config.profiler.enabled,
+    strict=config.profiler.strict,
+    repeat_threshold=config.profiler.repeatThreshold,
+)
@@ -0,0 +1,102 @@
+import asyncio
+
+from collections import defaultdict
+from typing import Hashable, Iterable, Optional, Protocol
+
+
+class Subscription:
+    def __init__(self, hub: "Hub", maxsize: int):
+        self.hub = hub
+        self.topics: set[Hashable] = set()
+        self.dropped = 0
+        self._queue: asyncio.Queue[Optional[bytes]] = asyncio.Queue(maxsize)
+
+    def put(self, message: Optional[bytes]) -> None:
+        # Slow consumers lose their oldest events instead of stalling publishers.
+        while True:
+            try:
+                self._queue.put_nowait(message)
+                return
+            except asyncio.QueueFull:
+                self._queue.get_nowait()
+                self.dropped += 1
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[bytes]:
+        if timeout is None:
+            return await self._queue.get()
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def unsubscribe(self, *topics: Hashable) -> None:
+        self.hub.unsubscribe(self, topics)
+
+    def close(self) -> None:
+        self.hub.unsubscribe(self, list(self.topics))
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class Hub:
+    def __init__(self):
+        self._topics: dict[Hashable, set[Subscription]] = defaultdict(set)
+
+    def subscribe(self, topics: Iterable[Hashable], maxsize: int) -> Subscription:
+        subscription = Subscription(self, maxsize)
+        for topic in topics:
+            subscription.topics.add(topic)
+            self._topics[topic].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription, topics: Iterable[Hashable]):
+        for topic in topics:
+            subscription.topics.discard(topic)
+            subscribers = self._topics.get(topic)
+            if subscribers is None:
+                continue
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._topics[topic]
+
+    def has_subscribers(self, topic: Hashable) -> bool:
+        return topic in self._topics
+
+    def deliver(self, topic: Hashable, message: bytes) -> None:
+        for subscription in tuple(self._topics.get(topic, ())):
+            subscription.put(message)
+
+
+class Broker(Protocol):
+    """Carries published events to the hubs of every worker process.
+
+    `publish` is called from synchronous commit hooks and must not block;
+    implementations backed by a shared store should queue the message and
+    hand it to `hub.deliver` once it comes back from the store.
+    """
+
+    hub: Hub
+
+    async def start(self) -> None: ...
+
+    def publish(self, topic: Hashable, message: bytes) -> None: ...
+
+    async def stop(self) -> None: ...
+
+
+class LocalBroker:
+    def __init__(self, hub: Hub):
+        self.hub = hub
+
+    async def start(self) -> None:
+        pass
+
+    def publish(self, topic: Hashable, message: bytes) -> None:
+        self.hub.deliver(topic, message)
+
+    async def stop(self) -> None:
+        pass
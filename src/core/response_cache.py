@@ -0,0 +1,141 @@
+import time
+
+from collections import OrderedDict, defaultdict
+from datetime import datetime
+from typing import Hashable, Iterable, NamedTuple, Optional, Protocol
+
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    etag: Optional[str] = None
+    last_modified: Optional[datetime] = None
+
+
+class ResponseCacheBackend(Protocol):
+    """Stores serialized responses under a key, grouped by invalidation tags.
+
+    `generation` moves on every invalidation. Readers take it before they
+    start building a response and hand it back to `set`, which drops the
+    entry if an invalidation happened in between.
+
+    Invalidations only see commits made by this process, so entries also
+    expire after a TTL. That bounds how long writes from other workers,
+    database cascades or a lagging replica can be served stale.
+    """
+
+    @property
+    def generation(self) -> int: ...
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]: ...
+
+    def set(
+        self,
+        key: Hashable,
+        value: CachedResponse,
+        tags: Iterable[Hashable],
+        generation: int,
+    ) -> None: ...
+
+    def invalidate(self, tags: Iterable[Hashable]) -> None: ...
+
+    def clear(self) -> None: ...
+
+    def stats(self) -> dict[str, int | float]: ...
+
+
+class MemoryResponseCache:
+    def __init__(self, max_bytes: int, max_entry_bytes: int, ttl: float):
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._generation = 0
+        self._size = 0
+        self._data: OrderedDict[Hashable, tuple[CachedResponse, frozenset, float]] = (
+            OrderedDict()
+        )
+        self._tags: dict[Hashable, set[Hashable]] = defaultdict(set)
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry[2] <= time.monotonic():
+            self._discard(key)
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def set(
+        self,
+        key: Hashable,
+        value: CachedResponse,
+        tags: Iterable[Hashable],
+        generation: int,
+    ) -> None:
+        if generation != self._generation or self.ttl <= 0:
+            return
+        if len(value.body) > min(self.max_entry_bytes, self.max_bytes):
+            return
+
+        self._discard(key)
+        tags = frozenset(tags)
+        self._data[key] = (value, tags, time.monotonic() + self.ttl)
+        self._size += len(value.body)
+        for tag in tags:
+            self._tags[tag].add(key)
+
+        while self._size > self.max_bytes:
+            oldest = next(iter(self._data))
+            self._discard(oldest)
+            self.evictions += 1
+
+    def invalidate(self, tags: Iterable[Hashable]) -> None:
+        self._generation += 1
+        for tag in tags:
+            for key in self._tags.pop(tag, ()):
+                self._discard(key)
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._data.clear()
+        self._tags.clear()
+        self._size = 0
+
+    def _discard(self, key: Hashable) -> None:
+        entry = self._data.pop(key, None)
+        if entry is None:
+            return
+        value, tags, _ = entry
+        self._size -= len(value.body)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                del self._tags[tag]
+
+    def stats(self) -> dict[str, int | float]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "bytes": self._size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -1,6 +1,6 @@
 from datetime import timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel, ConfigDict
 from pydantic_settings import (
@@ -49,13 +49,114 @@ class URLSettings(Settings):
         )
 
 
+class SQLiteSettings(Settings):
+    enabled: bool = True
+    journalMode: str = "WAL"
+    synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"
+    busyTimeout: int = 5_000
+    mmapSize: int = 256 * 1024 * 1024
+    cacheSize: int = -64_000
+    foreignKeys: bool = True
+    serializeWrites: bool = True
+
+
 class DatabaseSettings(Settings):
     echo: bool = False
     poolSize: int = 10
     maxOverflow: int = 5
     poolTimeout: int = 30
+    readerStrategy: Literal["round_robin", "least_busy"] = "round_robin"
+    stickySeconds: float = 5.0
+    checkSchema: bool = True
+    prewarm: int = 0
 
     URL: URLSettings = URLSettings()
+    readers: list[URLSettings] = []
+    sqlite: SQLiteSettings = SQLiteSettings()
+
+
+class HashingSettings(Settings):
+    maxWorkers: int = 4
+    maxConcurrency: int = 16
+
+
+class TTLCacheSettings(Settings):
+    maxSize: int = 10_000
+    ttl: float = 60.0
+
+
+class PermissionCacheSettings(TTLCacheSettings):
+    maxSize: int = 100_000
+    ttl: float = 10.0
+    negativeTtl: float = 5.0
+
+
+class ResponseCacheSettings(Settings):
+    backend: Literal["memory"] = "memory"
+    maxBytes: int = 64 * 1024 * 1024
+    maxEntryBytes: int = 1024 * 1024
+    ttl: float = 5.0
+
+
+class CacheSettings(Settings):
+    users: TTLCacheSettings = TTLCacheSettings()
+    tokens: TTLCacheSettings = TTLCacheSettings(maxSize=50_000, ttl=900.0)
+    responses: ResponseCacheSettings = ResponseCacheSettings()
+    permissions: PermissionCacheSettings = PermissionCacheSettings()
+
+
+class NotificationSettings(Settings):
+    enabled: bool = True
+    lead: timedelta = timedelta(minutes=30)
+    window: timedelta = timedelta(hours=1)
+    batchSize: int = 500
+    maxPending: int = 10_000
+    pollInterval: float = 30.0
+    webhookUrl: Optional[str] = None
+    lockFile: Path = Path("notifications.lock")
+
+
+class FeedSettings(Settings):
+    queueSize: int = 256
+    keepAlive: float = 15.0
+    maxBoards: int = 200
+
+
+class ExportSettings(Settings):
+    chunkSize: int = 1000
+
+
+class AuditSettings(Settings):
+    enabled: bool = True
+    directory: Path = Path("audit")
+    capacity: int = 100_000
+    flushInterval: float = 5.0
+    segmentSpan: timedelta = timedelta(hours=1)
+    compressLevel: int = 6
+
+
+class MetricsSettings(Settings):
+    enabled: bool = True
+    directory: Path = Path("metrics")
+    flushInterval: float = 5.0
+
+
+class ProfilerSettings(Settings):
+    enabled: bool = False
+    strict: bool = False
+    repeatThreshold: int = 5
+
+
+class LoggingSettings(Settings):
+    mode: Literal["development", "production"] = "development"
+    level: str = "DEBUG"
+    path: Optional[str] = None
+    batchSize: int = 512
+    flushInterval: float = 0.5
+    bufferSize: int = 10_000
+    rateLimit: float = 10.0
+    burst: int = 50
+    sampleRate: float = 0.01
 
 
 class AuthJWTSettings(BaseSettings):
@@ -73,6 +174,15 @@ class AppSettings(BaseSettings):
     uvicorn: UvicornSettings = UvicornSettings()
     database: DatabaseSettings = DatabaseSettings()
     jwt: AuthJWTSettings = AuthJWTSettings()
+    cache: CacheSettings = CacheSettings()
+    hashing: HashingSettings = HashingSettings()
+    notifications: NotificationSettings = NotificationSettings()
+    feed: FeedSettings = FeedSettings()
+    export: ExportSettings = ExportSettings()
+    logging: LoggingSettings = LoggingSettings()
+    audit: AuditSettings = AuditSettings()
+    metrics: MetricsSettings = MetricsSettings()
+    profiler: ProfilerSettings = ProfilerSettings()
 
     model_config = SettingsConfigDict(
         extra="ignore",
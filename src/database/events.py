@@ -0,0 +1,112 @@
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Literal
+
+from loguru import logger
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+Operation = Literal["insert", "update", "delete"]
+
+
+@dataclass(frozen=True, slots=True)
+class Change:
+    op: Operation
+    model: type
+    values: dict[str, Any] = field(default_factory=dict)
+    changed: frozenset[str] = frozenset()
+
+
+ChangeListener = Callable[[list[Change]], None]
+
+_PENDING_KEY = "pending_changes"
+_listeners: dict[type, list[ChangeListener]] = defaultdict(list)
+
+
+def on_commit(*models: type) -> Callable[[ChangeListener], ChangeListener]:
+    def decorator(listener: ChangeListener) -> ChangeListener:
+        for model in models:
+            _listeners[model].append(listener)
+        return listener
+
+    return decorator
+
+
+def track(
+    session: Session,
+    op: Operation,
+    model: type,
+    values: dict,
+    changed: frozenset[str] = frozenset(),
+) -> None:
+    if model in _listeners:
+        session.info.setdefault(_PENDING_KEY, []).append(
+            Change(op, model, values, changed)
+        )
+
+
+def _changed_columns(instance) -> frozenset[str]:
+    state = inspect(instance)
+    return frozenset(
+        attr.key
+        for attr in state.mapper.column_attrs
+        if state.attrs[attr.key].history.has_changes()
+    )
+
+
+def _snapshot(instance) -> dict[str, Any]:
+    state = inspect(instance)
+    values = {
+        attr.key: state.dict[attr.key]
+        for attr in state.mapper.column_attrs
+        if attr.key in state.dict
+    }
+    if state.identity is not None:
+        for column, value in zip(state.mapper.primary_key, state.identity):
+            values.setdefault(column.key, value)
+    return values
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changes(session: Session, flush_context) -> None:
+    if not _listeners:
+        return
+
+    for op, instances in (
+        ("insert", session.new),
+        ("update", session.dirty),
+        ("delete", session.deleted),
+    ):
+        for instance in instances:
+            model = type(instance)
+            if model not in _listeners:
+                continue
+            if op == "update":
+                changed = _changed_columns(instance)
+                if not changed:
+                    continue
+                track(session, op, model, _snapshot(instance), changed)
+            else:
+                track(session, op, model, _snapshot(instance))
+
+
+@event.listens_for(Session, "after_commit")
+def _dispatch_changes(session: Session) -> None:
+    changes: list[Change] = session.info.pop(_PENDING_KEY, None)
+    if not changes:
+        return
+
+    by_listener: dict[ChangeListener, list[Change]] = {}
+    for change in changes:
+        for listener in _listeners[change.model]:
+            by_listener.setdefault(listener, []).append(change)
+    for listener, batch in by_listener.items():
+        try:
+            listener(batch)
+        except Exception:
+            logger.exception("Change listener {} failed", listener)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changes(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
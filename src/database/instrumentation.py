@@ -0,0 +1,154 @@
+import asyncio
+import time
+
+from typing import Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.util import await_only
+
+from core.metrics import registry, request_stats
+from core.profiler import current_profile
+
+pool_checkout_wait = registry.histogram(
+    "db_pool_checkout_seconds",
+    "Time spent waiting for a pooled connection",
+    ("engine",),
+)
+pool_checked_out = registry.gauge(
+    "db_pool_checked_out", "Connections currently checked out", ("engine",)
+)
+pool_capacity = registry.gauge(
+    "db_pool_capacity", "pool_size + max_overflow of the engine pool", ("engine",)
+)
+db_statements = registry.counter(
+    "db_statements_total", "SQL statements executed", ("engine",)
+)
+db_statement_time = registry.histogram(
+    "db_statement_seconds", "SQL statement execution time", ("engine",)
+)
+
+_STARTED_KEY = "statement_started"
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that reports how long each checkout waited."""
+
+    engine_name = "default"
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            pool_checkout_wait.observe(time.perf_counter() - started, self.engine_name)
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.engine_name = self.engine_name
+        return pool
+
+
+class WriteQueuePool(InstrumentedQueuePool):
+    """Single-connection pool whose checkouts are served in arrival order.
+
+    A bare one-slot queue lets the task that just returned the connection
+    take it straight back; asyncio.Lock hands it to the longest waiter.
+    Waiting is bounded by `pool_timeout`, like any other pool checkout.
+
+    The lock is not reentrant: a task that already holds the connection
+    and opens a second writer session would wait for itself, so that
+    checkout fails right away instead.
+    """
+
+    def __init__(self, creator, **kw):
+        kw.update(pool_size=1, max_overflow=0)
+        super().__init__(creator, **kw)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._turn: Optional[asyncio.Lock] = None
+        self._held: Optional[asyncio.Lock] = None
+        self._owner: Optional[asyncio.Task] = None
+
+    def _lock(self) -> asyncio.Lock:
+        # An asyncio.Lock belongs to the loop it first waits on; an engine
+        # used from a new loop (asyncio.run, tests) gets a new one.
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop, self._turn = loop, asyncio.Lock()
+        return self._turn
+
+    def connect(self):
+        started = time.perf_counter()
+        task = asyncio.current_task()
+        if task is not None and task is self._owner:
+            raise exc.InvalidRequestError(
+                "This task already holds the write connection; "
+                "a second writer session would wait for itself"
+            )
+        turn = self._lock()
+        try:
+            try:
+                await_only(asyncio.wait_for(turn.acquire(), self._timeout))
+            except asyncio.TimeoutError:
+                raise exc.TimeoutError(
+                    f"Write queue wait timed out after {self._timeout}s"
+                ) from None
+            self._held, self._owner = turn, task
+            try:
+                return AsyncAdaptedQueuePool.connect(self)
+            except BaseException:
+                self._release()
+                raise
+        finally:
+            pool_checkout_wait.observe(time.perf_counter() - started, self.engine_name)
+
+    def _return_conn(self, record):
+        try:
+            super()._return_conn(record)
+        finally:
+            self._release()
+
+    def _release(self) -> None:
+        held, self._held, self._owner = self._held, None, None
+        if held is not None:
+            held.release()
+
+
+def instrument_engine(engine: AsyncEngine, name: str) -> None:
+    sync_engine = engine.sync_engine
+    if isinstance(sync_engine.pool, InstrumentedQueuePool):
+        sync_engine.pool.engine_name = name
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        conn.info.setdefault(_STARTED_KEY, []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, many):
+        elapsed = time.perf_counter() - conn.info[_STARTED_KEY].pop()
+        db_statements.inc(name)
+        db_statement_time.observe(elapsed, name)
+        stats = request_stats.get()
+        if stats is not None:
+            stats.statements += 1
+            stats.db_time += elapsed
+        profile = current_profile.get()
+        if profile is not None:
+            profile.record(statement, elapsed)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def handle_error(context):
+        # A failed statement never reaches after_cursor_execute.
+        if context.connection is None:
+            return
+        started = context.connection.info.get(_STARTED_KEY)
+        if started:
+            started.pop()
+
+    @registry.collector
+    def collect_pool() -> None:
+        pool = sync_engine.pool
+        if isinstance(pool, InstrumentedQueuePool):
+            pool_checked_out.set(pool.checkedout(), name)
+            pool_capacity.set(pool.size() + max(pool._max_overflow, 0), name)
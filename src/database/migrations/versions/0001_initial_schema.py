@@ -0,0 +1,232 @@
+"""initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 03:32:54.989110
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Frozen copy of database.mixin.utcnow as of this revision, so later edits
+# to the models cannot change what this migration creates.
+class utcnow(FunctionElement):
+    type = sa.DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _default_utcnow(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "sqlite")
+def _sqlite_utcnow(element, compiler, **kw):
+    return "STRFTIME('%Y-%m-%d %H:%M:%f000', 'now')"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "board",
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=utcnow(),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(),
+            server_default=utcnow(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_board")),
+    )
+    with op.batch_alter_table("board", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_board_created_at_id", ["created_at", "id"], unique=False
+        )
+        batch_op.create_index(batch_op.f("ix_board_id"), ["id"], unique=False)
+
+    op.create_table(
+        "user",
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("password_hash", sa.String(), nullable=False),
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=utcnow(),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(),
+            server_default=utcnow(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_user")),
+        sa.UniqueConstraint("email", name=op.f("uq_user_email")),
+        sa.UniqueConstraint("name", name=op.f("uq_user_name")),
+    )
+    with op.batch_alter_table("user", schema=None) as batch_op:
+        batch_op.create_index(batch_op.f("ix_user_id"), ["id"], unique=False)
+
+    op.create_table(
+        "task",
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("description", sa.String(), nullable=True),
+        sa.Column("deadline", sa.DateTime(), nullable=True),
+        sa.Column(
+            "priority",
+            sa.Enum("LOW", "MEDIUM", "HIGH", name="priority_enum"),
+            nullable=False,
+        ),
+        sa.Column(
+            "status",
+            sa.Enum("TODO", "IN_PROGRESS", "DONE", name="status_enum"),
+            nullable=False,
+        ),
+        sa.Column("board_id", sa.Uuid(), nullable=False),
+        sa.Column("assigned_user_id", sa.Uuid(), nullable=True),
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=utcnow(),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(),
+            server_default=utcnow(),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["assigned_user_id"],
+            ["user.id"],
+            name=op.f("fk_task_assigned_user_id_user"),
+            ondelete="SET NULL",
+        ),
+        sa.ForeignKeyConstraint(
+            ["board_id"],
+            ["board.id"],
+            name=op.f("fk_task_board_id_board"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_task")),
+    )
+    with op.batch_alter_table("task", schema=None) as batch_op:
+        batch_op.create_index(
+            batch_op.f("ix_task_assigned_user_id"), ["assigned_user_id"], unique=False
+        )
+        batch_op.create_index(
+            batch_op.f("ix_task_board_id"), ["board_id"], unique=False
+        )
+        batch_op.create_index(
+            "ix_task_board_id_deadline", ["board_id", "deadline", "id"], unique=False
+        )
+        batch_op.create_index(
+            "ix_task_board_id_priority_deadline",
+            ["board_id", "priority", "deadline", "id"],
+            unique=False,
+        )
+        batch_op.create_index(
+            "ix_task_board_id_status_deadline",
+            ["board_id", "status", "deadline", "id"],
+            unique=False,
+        )
+        batch_op.create_index(
+            "ix_task_board_id_updated_at", ["board_id", "updated_at"], unique=False
+        )
+        batch_op.create_index(
+            batch_op.f("ix_task_deadline"), ["deadline"], unique=False
+        )
+        batch_op.create_index(batch_op.f("ix_task_id"), ["id"], unique=False)
+        batch_op.create_index(batch_op.f("ix_task_status"), ["status"], unique=False)
+
+    op.create_table(
+        "user_using_board",
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("board_id", sa.Uuid(), nullable=False),
+        sa.Column("role", sa.Enum("ADMIN", "USER", name="role_enum"), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=utcnow(),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(),
+            server_default=utcnow(),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["board_id"],
+            ["board.id"],
+            name=op.f("fk_user_using_board_board_id_board"),
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["user.id"],
+            name=op.f("fk_user_using_board_user_id_user"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint(
+            "user_id", "board_id", name=op.f("pk_user_using_board")
+        ),
+    )
+    with op.batch_alter_table("user_using_board", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_user_using_board_board_id_updated_at",
+            ["board_id", "updated_at"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("user_using_board", schema=None) as batch_op:
+        batch_op.drop_index("ix_user_using_board_board_id_updated_at")
+
+    op.drop_table("user_using_board")
+    with op.batch_alter_table("task", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_task_status"))
+        batch_op.drop_index(batch_op.f("ix_task_id"))
+        batch_op.drop_index(batch_op.f("ix_task_deadline"))
+        batch_op.drop_index("ix_task_board_id_updated_at")
+        batch_op.drop_index("ix_task_board_id_status_deadline")
+        batch_op.drop_index("ix_task_board_id_priority_deadline")
+        batch_op.drop_index("ix_task_board_id_deadline")
+        batch_op.drop_index(batch_op.f("ix_task_board_id"))
+        batch_op.drop_index(batch_op.f("ix_task_assigned_user_id"))
+
+    op.drop_table("task")
+    with op.batch_alter_table("user", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_user_id"))
+
+    op.drop_table("user")
+    with op.batch_alter_table("board", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_board_id"))
+        batch_op.drop_index("ix_board_created_at_id")
+
+    op.drop_table("board")
@@ -0,0 +1,87 @@
+"""task full-text search
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 03:48:17.706134
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The statements are copied, not imported from database.search: a revision
+# must keep creating the schema it did when it was written.
+SEARCH_DDL = {
+    "sqlite": (
+        """
+        CREATE VIRTUAL TABLE task_fts USING fts5(
+            title, description,
+            content='task', content_rowid='rowid',
+            tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+        )
+        """,
+        """
+        CREATE TRIGGER task_fts_insert AFTER INSERT ON task BEGIN
+            INSERT INTO task_fts (rowid, title, description)
+            VALUES (new.rowid, new.title, new.description);
+        END
+        """,
+        """
+        CREATE TRIGGER task_fts_delete AFTER DELETE ON task BEGIN
+            INSERT INTO task_fts (task_fts, rowid, title, description)
+            VALUES ('delete', old.rowid, old.title, old.description);
+        END
+        """,
+        """
+        CREATE TRIGGER task_fts_update AFTER UPDATE OF title, description ON task
+        BEGIN
+            INSERT INTO task_fts (task_fts, rowid, title, description)
+            VALUES ('delete', old.rowid, old.title, old.description);
+            INSERT INTO task_fts (rowid, title, description)
+            VALUES (new.rowid, new.title, new.description);
+        END
+        """,
+        "INSERT INTO task_fts (task_fts) VALUES ('rebuild')",
+    ),
+    "postgresql": (
+        """
+        ALTER TABLE task ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+            setweight(to_tsvector('simple', coalesce(title, '')), 'A')
+            || setweight(to_tsvector('simple', coalesce(description, '')), 'B')
+        ) STORED
+        """,
+        "CREATE INDEX ix_task_search_vector ON task USING gin (search_vector)",
+    ),
+}
+
+SEARCH_DROP = {
+    "sqlite": (
+        "DROP TRIGGER IF EXISTS task_fts_update",
+        "DROP TRIGGER IF EXISTS task_fts_delete",
+        "DROP TRIGGER IF EXISTS task_fts_insert",
+        "DROP TABLE IF EXISTS task_fts",
+    ),
+    "postgresql": (
+        "DROP INDEX IF EXISTS ix_task_search_vector",
+        "ALTER TABLE task DROP COLUMN IF EXISTS search_vector",
+    ),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for statement in SEARCH_DDL.get(op.get_bind().dialect.name, ()):
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for statement in SEARCH_DROP.get(op.get_bind().dialect.name, ()):
+        op.execute(statement)
@@ -0,0 +1,113 @@
+"""stable task search key
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 05:02:41.318904
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, Sequence[str], None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# SQLite only: the FTS5 index moves from task.rowid, which batch migrations
+# renumber, to a fts_key column of its own. PostgreSQL needs no change.
+DROP_INDEX = (
+    "DROP TRIGGER IF EXISTS task_fts_update",
+    "DROP TRIGGER IF EXISTS task_fts_delete",
+    "DROP TRIGGER IF EXISTS task_fts_insert",
+    "DROP TABLE IF EXISTS task_fts",
+)
+
+UPGRADE = (
+    "ALTER TABLE task ADD COLUMN fts_key INTEGER",
+    "UPDATE task SET fts_key = rowid",
+    "CREATE UNIQUE INDEX ix_task_fts_key ON task (fts_key)",
+    """
+    CREATE VIRTUAL TABLE task_fts USING fts5(
+        title, description,
+        content='task', content_rowid='fts_key',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER task_fts_insert AFTER INSERT ON task BEGIN
+        UPDATE task SET fts_key = (SELECT coalesce(max(fts_key), 0) + 1 FROM task)
+        WHERE rowid = new.rowid;
+        INSERT INTO task_fts (rowid, title, description)
+        SELECT fts_key, title, description FROM task WHERE rowid = new.rowid;
+    END
+    """,
+    """
+    CREATE TRIGGER task_fts_delete AFTER DELETE ON task BEGIN
+        INSERT INTO task_fts (task_fts, rowid, title, description)
+        VALUES ('delete', old.fts_key, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER task_fts_update AFTER UPDATE OF title, description ON task
+    BEGIN
+        INSERT INTO task_fts (task_fts, rowid, title, description)
+        VALUES ('delete', old.fts_key, old.title, old.description);
+        INSERT INTO task_fts (rowid, title, description)
+        VALUES (new.fts_key, new.title, new.description);
+    END
+    """,
+    "INSERT INTO task_fts (task_fts) VALUES ('rebuild')",
+)
+
+DOWNGRADE = (
+    "DROP INDEX IF EXISTS ix_task_fts_key",
+    "ALTER TABLE task DROP COLUMN fts_key",
+    """
+    CREATE VIRTUAL TABLE task_fts USING fts5(
+        title, description,
+        content='task', content_rowid='rowid',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER task_fts_insert AFTER INSERT ON task BEGIN
+        INSERT INTO task_fts (rowid, title, description)
+        VALUES (new.rowid, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER task_fts_delete AFTER DELETE ON task BEGIN
+        INSERT INTO task_fts (task_fts, rowid, title, description)
+        VALUES ('delete', old.rowid, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER task_fts_update AFTER UPDATE OF title, description ON task
+    BEGIN
+        INSERT INTO task_fts (task_fts, rowid, title, description)
+        VALUES ('delete', old.rowid, old.title, old.description);
+        INSERT INTO task_fts (rowid, title, description)
+        VALUES (new.rowid, new.title, new.description);
+    END
+    """,
+    "INSERT INTO task_fts (task_fts) VALUES ('rebuild')",
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    for statement in (*DROP_INDEX, *UPGRADE):
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    for statement in (*DROP_INDEX, *DOWNGRADE):
+        op.execute(statement)
@@ -3,7 +3,26 @@ import uuid
 
 import sqlalchemy as sa
 
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql.functions import FunctionElement
+
+
+class utcnow(FunctionElement):
+    type = sa.DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _default_utcnow(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "sqlite")
+def _sqlite_utcnow(element, compiler, **kw):
+    # Same layout SQLAlchemy uses for bound datetimes, so server-generated
+    # timestamps compare and sort correctly against parameters.
+    return "STRFTIME('%Y-%m-%d %H:%M:%f000', 'now')"
 
 
 class UUIDMixin:
@@ -14,8 +33,8 @@ class UUIDMixin:
 
 class TimestampMixin:
     created_at: Mapped[datetime.datetime] = mapped_column(
-        server_default=sa.func.now(), nullable=False
+        server_default=utcnow(), nullable=False
     )
     updated_at: Mapped[datetime.datetime] = mapped_column(
-        server_default=sa.func.now(), onupdate=sa.func.now(), nullable=False
+        server_default=utcnow(), onupdate=utcnow(), nullable=False
     )
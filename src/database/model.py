@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import Enum as SAEnum, ForeignKey, MetaData
+from sqlalchemy import Enum as SAEnum, ForeignKey, Index, MetaData
 from sqlalchemy.ext.asyncio import AsyncAttrs
 from sqlalchemy.orm import (
     DeclarativeBase,
@@ -56,6 +56,8 @@ class Status(enum.Enum):
 
 # -------------------- MODELS --------------------
 class Board(CoreModel, UUIDMixin, TimestampMixin):
+    __table_args__ = (Index("ix_board_created_at_id", "created_at", "id"),)
+
     title: Mapped[str]
 
     memberships: Mapped[list["UserUsingBoard"]] = relationship(
@@ -77,6 +79,22 @@ class Board(CoreModel, UUIDMixin, TimestampMixin):
 
 
 class Task(CoreModel, UUIDMixin, TimestampMixin):
+    __table_args__ = (
+        Index("ix_task_board_id_deadline", "board_id", "deadline", "id"),
+        Index("ix_task_board_id_updated_at", "board_id", "updated_at"),
+        Index("ix_task_updated_at", "updated_at", "id"),
+        Index(
+            "ix_task_board_id_status_deadline", "board_id", "status", "deadline", "id"
+        ),
+        Index(
+            "ix_task_board_id_priority_deadline",
+            "board_id",
+            "priority",
+            "deadline",
+            "id",
+        ),
+    )
+
     title: Mapped[str]
     description: Mapped[Optional[str]]
 
@@ -105,7 +123,11 @@ class Task(CoreModel, UUIDMixin, TimestampMixin):
     )
 
 
-class UserUsingBoard(CoreModel):
+class UserUsingBoard(CoreModel, TimestampMixin):
+    __table_args__ = (
+        Index("ix_user_using_board_board_id_updated_at", "board_id", "updated_at"),
+    )
+
     user_id: Mapped[UUID] = mapped_column(
         ForeignKey("user.id", ondelete="CASCADE"), primary_key=True
     )
@@ -0,0 +1,34 @@
+from sqlalchemy import bindparam, literal_column, select
+
+from database.model import User, UserUsingBoard
+
+# Hot statements, built once per process and executed with parameters:
+#   await session.execute(USER_LOGIN, {"name": name})
+# A module-level statement memoizes its cache key, so after the first
+# compile a call skips construction, cache-key generation and compilation.
+# Lambda statements cache the compile too but still rebuild and analyse
+# the lambda on every call.
+
+USER_LOGIN = select(
+    User.id,
+    User.name,
+    User.email,
+    User.password_hash,
+    User.created_at,
+    User.updated_at,
+).where(User.name == bindparam("name"))
+
+USER_CLAIMS = select(User.id, User.name, User.email).where(
+    User.id == bindparam("user_id")
+)
+
+EMAIL_TAKEN = (
+    select(literal_column("1")).where(User.email == bindparam("email")).limit(1)
+)
+
+NAME_TAKEN = select(literal_column("1")).where(User.name == bindparam("name")).limit(1)
+
+BOARD_ROLE = select(UserUsingBoard.role).where(
+    UserUsingBoard.user_id == bindparam("user_id"),
+    UserUsingBoard.board_id == bindparam("board_id"),
+)
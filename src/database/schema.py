@@ -0,0 +1,78 @@
+import asyncio
+
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+# Head of migrations/versions. Bump it with every new revision;
+# test_migrations checks that the two agree.
+SCHEMA_REVISION = "0004"
+MIGRATIONS = Path(__file__).resolve().parent / "migrations"
+
+
+class SchemaOutOfDate(RuntimeError):
+    pass
+
+
+async def current_revision(engine: AsyncEngine) -> Optional[str]:
+    async with engine.connect() as conn:
+        try:
+            return await conn.scalar(text("SELECT version_num FROM alembic_version"))
+        except DBAPIError:
+            return None
+
+
+async def check_schema(engine: AsyncEngine) -> None:
+    """Fails fast when the database is not at the revision this code expects.
+
+    A single query, no Alembic import: migrations are run out-of-band with
+    `alembic upgrade head`. Databases created by `create_all` before
+    migrations existed only need `alembic stamp 0001`.
+    """
+    revision = await current_revision(engine)
+    if revision != SCHEMA_REVISION:
+        raise SchemaOutOfDate(
+            f"Database schema is at revision {revision}, "
+            f"the application expects {SCHEMA_REVISION}: run `alembic upgrade head`"
+        )
+
+
+def alembic_config():
+    from alembic.config import Config
+
+    config = Config()
+    config.set_main_option("script_location", str(MIGRATIONS))
+    return config
+
+
+async def upgrade_schema(engine: AsyncEngine, revision: str = "head") -> None:
+    from alembic import command
+
+    def upgrade(connection) -> None:
+        config = alembic_config()
+        config.attributes["connection"] = connection
+        command.upgrade(config, revision)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(upgrade)
+
+
+def upgrade_database(database_url: str, revision: str = "head") -> None:
+    """Upgrades from the launching process, before any worker starts.
+
+    Workers each run their own lifespan, so upgrading there has them race
+    each other. The engine is a throwaway one bound to this short-lived
+    event loop, not the application's.
+    """
+
+    async def upgrade() -> None:
+        engine = create_async_engine(database_url)
+        try:
+            await upgrade_schema(engine, revision)
+        finally:
+            await engine.dispose()
+
+    asyncio.run(upgrade())
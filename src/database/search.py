@@ -0,0 +1,199 @@
+import re
+
+from typing import NamedTuple
+
+from sqlalchemy import (
+    DDL,
+    ColumnElement,
+    FromClause,
+    Numeric,
+    cast,
+    column,
+    event,
+    func,
+    literal_column,
+    table,
+    text,
+)
+from sqlalchemy.engine import Connection
+
+from database.model import Task
+
+# Full-text index over task titles and descriptions. It lives outside the
+# ORM models: SQLite keeps an FTS5 external-content table in sync with
+# triggers, PostgreSQL a generated tsvector column with a GIN index. These
+# statements run after create_all; the migrations carry their own copy.
+
+SQLITE_TRIGGERS = (
+    # New rows get the next key; the index entry is written from the row so
+    # it carries that key.
+    """
+    CREATE TRIGGER IF NOT EXISTS task_fts_insert AFTER INSERT ON task BEGIN
+        UPDATE task SET fts_key = (SELECT coalesce(max(fts_key), 0) + 1 FROM task)
+        WHERE rowid = new.rowid;
+        INSERT INTO task_fts (rowid, title, description)
+        SELECT fts_key, title, description FROM task WHERE rowid = new.rowid;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS task_fts_delete AFTER DELETE ON task BEGIN
+        INSERT INTO task_fts (task_fts, rowid, title, description)
+        VALUES ('delete', old.fts_key, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS task_fts_update
+    AFTER UPDATE OF title, description ON task BEGIN
+        INSERT INTO task_fts (task_fts, rowid, title, description)
+        VALUES ('delete', old.fts_key, old.title, old.description);
+        INSERT INTO task_fts (rowid, title, description)
+        VALUES (new.fts_key, new.title, new.description);
+    END
+    """,
+)
+
+SQLITE_DDL = (
+    # `task` has a UUID primary key, so its rowid is not stable: a batch
+    # migration that copies the table renumbers it. The index is keyed on
+    # a column of its own instead, which copies carry over unchanged.
+    "ALTER TABLE task ADD COLUMN fts_key INTEGER",
+    "CREATE UNIQUE INDEX ix_task_fts_key ON task (fts_key)",
+    # External content: the index keeps no copy of the text and reads it
+    # back from `task` by fts_key. Prefixes of 2 and 3 characters
+    # get their own index so prefix queries avoid a term scan.
+    """
+    CREATE VIRTUAL TABLE task_fts USING fts5(
+        title, description,
+        content='task', content_rowid='fts_key',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )
+    """,
+    *SQLITE_TRIGGERS,
+)
+
+SQLITE_DROP = (
+    "DROP TRIGGER IF EXISTS task_fts_update",
+    "DROP TRIGGER IF EXISTS task_fts_delete",
+    "DROP TRIGGER IF EXISTS task_fts_insert",
+    "DROP TABLE IF EXISTS task_fts",
+)
+
+POSTGRESQL_DDL = (
+    # 'simple' only lowercases: no stemming or stop words, so it behaves
+    # the same for every language the tasks are written in.
+    """
+    ALTER TABLE task ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(title, '')), 'A')
+        || setweight(to_tsvector('simple', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX ix_task_search_vector ON task USING gin (search_vector)",
+)
+
+POSTGRESQL_DROP = (
+    "DROP INDEX IF EXISTS ix_task_search_vector",
+    "ALTER TABLE task DROP COLUMN IF EXISTS search_vector",
+)
+
+SEARCH_DDL = {"sqlite": SQLITE_DDL, "postgresql": POSTGRESQL_DDL}
+SEARCH_DROP = {"sqlite": SQLITE_DROP, "postgresql": POSTGRESQL_DROP}
+
+# bm25() column weights: a hit in the title outranks one in the description.
+TITLE_WEIGHT = 10.0
+DESCRIPTION_WEIGHT = 1.0
+# Ranks are rounded before they are ordered on and put into page cursors:
+# a float that has to compare equal after a JSON round trip and a second
+# evaluation is a poor keyset key. Ties are broken by task id.
+RANK_DIGITS = 6
+
+_TERM = re.compile(r"(\w+)(\*?)")
+
+for _dialect, _statements in SEARCH_DDL.items():
+    for _statement in _statements:
+        event.listen(
+            Task.__table__, "after_create", DDL(_statement).execute_if(dialect=_dialect)
+        )
+for _dialect, _statements in SEARCH_DROP.items():
+    for _statement in _statements:
+        event.listen(
+            Task.__table__, "before_drop", DDL(_statement).execute_if(dialect=_dialect)
+        )
+
+
+def include_object(object, name, type_, reflected, compare_to) -> bool:
+    """Alembic hook keeping the index out of autogenerate comparisons."""
+    if type_ == "table":
+        return not (name == "task_fts" or name.startswith("task_fts_"))
+    if type_ in ("column", "index"):
+        return name not in (
+            "search_vector",
+            "ix_task_search_vector",
+            "fts_key",
+            "ix_task_fts_key",
+        )
+    return True
+
+
+def restore_search_triggers(connection: Connection) -> None:
+    """Recreates the SQLite index triggers that a batch migration dropped.
+
+    Batch operations rebuild `task` as a copy, and its triggers go with
+    the old table. Rows keep their fts_key, so the index itself stays valid.
+    """
+    if connection.dialect.name != "sqlite":
+        return
+    for statement in SQLITE_TRIGGERS:
+        connection.execute(text(statement))
+
+
+def supports_search(dialect: str) -> bool:
+    return dialect in SEARCH_DDL
+
+
+def parse_terms(text: str) -> list[tuple[str, bool]]:
+    """Splits user input into (word, is_prefix) pairs.
+
+    Only word characters survive, so nothing the user types reaches either
+    query syntax; a trailing `*` marks a prefix term.
+    """
+    return [(word, bool(star)) for word, star in _TERM.findall(text)]
+
+
+class SearchClause(NamedTuple):
+    source: FromClause
+    condition: ColumnElement
+    rank: ColumnElement
+
+
+def search_clause(dialect: str, terms: list[tuple[str, bool]]) -> SearchClause:
+    """FROM clause, match condition and rank of a task search on `dialect`.
+
+    Lower ranks are better on both backends. Check `supports_search` first.
+
+    Ranks depend on the whole index, so tasks written between two pages
+    can move others across the cursor: paging is stable for an unchanged
+    index and best-effort otherwise.
+    """
+    if dialect == "sqlite":
+        query = " ".join(
+            f'"{word}"' + ("*" if prefix else "") for word, prefix in terms
+        )
+        fts = table("task_fts", column("rowid"))
+        source = fts.join(Task.__table__, literal_column("task.fts_key") == fts.c.rowid)
+        index = literal_column("task_fts")
+        rank = func.round(
+            func.bm25(index, TITLE_WEIGHT, DESCRIPTION_WEIGHT), RANK_DIGITS
+        )
+        return SearchClause(source, index.match(query), rank)
+
+    if dialect == "postgresql":
+        query = " & ".join(word + (":*" if prefix else "") for word, prefix in terms)
+        vector = literal_column("task.search_vector")
+        tsquery = func.to_tsquery(literal_column("'simple'::regconfig"), query)
+        rank = -func.round(
+            cast(func.ts_rank_cd(vector, tsquery), Numeric(asdecimal=False)),
+            RANK_DIGITS,
+        )
+        return SearchClause(Task.__table__, vector.op("@@")(tsquery), rank)
+
+    raise NotImplementedError(f"Full-text search is not supported on {dialect}")
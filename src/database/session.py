@@ -1,51 +1,260 @@
 import asyncio
 
+from contextlib import AsyncExitStack, asynccontextmanager
+from contextvars import ContextVar
+from itertools import count
+from typing import Literal, Optional, Sequence
+from uuid import UUID
+
 from loguru import logger
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
     async_scoped_session,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.orm import Session
+
+from core.cache import TTLCache
+from core.settings import SQLiteSettings, config
+from database.instrumentation import (
+    InstrumentedQueuePool,
+    WriteQueuePool,
+    instrument_engine,
+)
+from database.sqlite import apply_pragmas, is_file_database, pragmas
+
+ReaderStrategy = Literal["round_robin", "least_busy"]
+
+current_user_id: ContextVar[Optional[UUID]] = ContextVar(
+    "current_user_id", default=None
+)
+
+_WRITES_KEY = "has_writes"
+_READER_KEY = "reader"
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flush(session: Session, flush_context) -> None:
+    session.info[_WRITES_KEY] = True
+
 
-from core.settings import config
+@event.listens_for(Session, "do_orm_execute")
+def _mark_bulk_write(orm_execute_state) -> None:
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        orm_execute_state.session.info[_WRITES_KEY] = True
+
+
+def _read_only(engine: AsyncEngine) -> AsyncEngine:
+    # SQLite never takes a write lock for plain SELECTs; PostgreSQL is told
+    # outright so it can skip write bookkeeping for the transaction.
+    if engine.dialect.name == "postgresql":
+        return engine.execution_options(postgresql_readonly=True)
+    return engine
+
+
+class ReadSession(Session):
+    """Binds to a reader chosen on the first query, not on creation.
+
+    By then the request's dependencies, including the authenticated user,
+    have been resolved, so read-your-writes routing can see who is asking.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        reader = self.info.get(_READER_KEY)
+        if reader is None:
+            reader = self.info["manager"].acquire_reader()
+            self.info[_READER_KEY] = reader
+        return self.info["manager"].read_binds[reader]
 
 
 class SessionManager:
-    def __init__(self, database_url: str, **engine_kwargs: dict):
+    def __init__(
+        self,
+        database_url: str,
+        reader_urls: Sequence[str] = (),
+        reader_strategy: ReaderStrategy = "round_robin",
+        sticky_for: float = 5.0,
+        sqlite: Optional[SQLiteSettings] = None,
+        **engine_kwargs: dict,
+    ):
+        if "pool_size" in engine_kwargs:
+            engine_kwargs.setdefault("poolclass", InstrumentedQueuePool)
+        if sqlite is not None and not (
+            sqlite.enabled and is_file_database(database_url)
+        ):
+            sqlite = None
+
+        writer_kwargs = engine_kwargs
+        if sqlite is not None and sqlite.serializeWrites:
+            # One connection, handed out in arrival order: the pool is the
+            # write queue and write sessions take turns.
+            writer_kwargs = {**engine_kwargs, "poolclass": WriteQueuePool}
         self.engine = create_async_engine(
             database_url,
             future=True,
-            **engine_kwargs,
+            **writer_kwargs,
         )
+        self.readers = [
+            create_async_engine(url, future=True, **engine_kwargs)
+            for url in reader_urls
+        ]
+        instrument_engine(self.engine, "writer")
+        for index, reader in enumerate(self.readers):
+            instrument_engine(reader, f"reader{index}")
+        self.read_binds = {
+            engine: _read_only(engine).sync_engine
+            for engine in (self.engine, *self.readers)
+        }
+
+        # Reads that would land on the SQLite writer get a pool of their own
+        # on the same file; under WAL they never wait for the writer.
+        self.local_reader: Optional[AsyncEngine] = None
+        if sqlite is not None:
+            values = pragmas(sqlite)
+            apply_pragmas(self.engine, values)
+            self.local_reader = create_async_engine(
+                database_url, future=True, **engine_kwargs
+            )
+            apply_pragmas(self.local_reader, values, query_only=True)
+            instrument_engine(self.local_reader, "local_reader")
+            self.read_binds[self.engine] = self.local_reader.sync_engine
+
+        self.reader_strategy = reader_strategy
+        self._reader_load = {reader: 0 for reader in self.readers}
+        self._next_reader = count()
+        self._recent_writers = TTLCache(maxsize=100_000, ttl=sticky_for)
+
         self.session_local = async_sessionmaker(
             bind=self.engine, expire_on_commit=False
         )
         self.scoped_session = async_scoped_session(
             self.session_local, scopefunc=asyncio.current_task
         )
+        self.read_session_local = async_sessionmaker(
+            sync_session_class=ReadSession,
+            expire_on_commit=False,
+            info={"manager": self},
+        )
+
+    @property
+    def engines(self) -> list[AsyncEngine]:
+        local = [self.local_reader] if self.local_reader is not None else []
+        return [self.engine, *self.readers, *local]
+
+    def acquire_reader(self) -> AsyncEngine:
+        user_id = current_user_id.get()
+        if not self.readers or (
+            user_id is not None and user_id in self._recent_writers
+        ):
+            reader = self.engine
+        elif self.reader_strategy == "least_busy":
+            reader = min(self.readers, key=self._reader_load.__getitem__)
+        else:
+            reader = self.readers[next(self._next_reader) % len(self.readers)]
+
+        if reader in self._reader_load:
+            self._reader_load[reader] += 1
+        return reader
+
+    def release_reader(self, reader: Optional[AsyncEngine]) -> None:
+        if reader in self._reader_load:
+            self._reader_load[reader] -= 1
+
+    def mark_written(self, user_id: Optional[UUID]) -> None:
+        if user_id is not None and self.readers:
+            self._recent_writers.set(user_id, True)
 
     async def session_scope(self):
         session = self.scoped_session()
-        logger.debug(f"Session started: {session}")
+        logger.debug("Session started: {}", session)
         try:
             yield session
-            await session.commit()
+            pending = session.new or session.dirty or session.deleted
+            if pending or (session.in_transaction() and session.info.get(_WRITES_KEY)):
+                await session.commit()
+            if session.info.pop(_WRITES_KEY, False):
+                self.mark_written(current_user_id.get())
         except Exception as exc:
-            logger.exception(f"Session erorre: {exc}")
+            logger.exception("Session error: {}", exc)
             await session.rollback()
             raise
         finally:
             await session.close()
             await self.scoped_session.remove()
-            logger.debug(f"Session closed: {session}")
+            logger.debug("Session closed: {}", session)
+
+    async def read_session_scope(self):
+        # Read sessions never commit; closing rolls back the read transaction.
+        # The connection is only checked out on the first query.
+        session = self.read_session_local()
+        try:
+            yield session
+        finally:
+            await self.release(session)
+
+    async def primary_read_session_scope(self):
+        # For reads whose answer is cached and must not lag behind commits:
+        # served by the writer's read bind, never by a replica.
+        session = self.read_session_local(info={_READER_KEY: self.engine})
+        try:
+            yield session
+        finally:
+            await self.release(session)
+
+    async def release(self, session: AsyncSession) -> None:
+        """Hands the session's connection back to the pool.
+
+        Handlers call this once their rows are loaded so serialization and
+        compression run without holding a pooled connection. The session
+        stays usable and checks out a new connection if queried again.
+        """
+        await session.close()
+        self.release_reader(session.info.pop(_READER_KEY, None))
+
+    def read_session(self):
+        return asynccontextmanager(self.read_session_scope)()
+
+    def read_session_factory(self):
+        # For handlers that read after returning, like streaming responses:
+        # yield dependencies close their session before the body is sent.
+        return self.read_session
+
+    async def prewarm(self, connections: int) -> None:
+        """Opens up to `connections` pooled connections per engine at startup.
+
+        They are returned to the pool right away, so the first requests
+        skip the connect handshake instead of paying it under load.
+        """
+        for engine in self.engines:
+            size = getattr(engine.pool, "size", lambda: connections)()
+            async with AsyncExitStack() as stack:
+                await asyncio.gather(
+                    *(
+                        stack.enter_async_context(engine.connect())
+                        for _ in range(min(connections, size))
+                    )
+                )
+        logger.info("Pool prewarmed with {} connections per engine", connections)
 
     async def dispose(self):
-        await self.engine.dispose()
+        for engine in self.engines:
+            await engine.dispose()
         logger.info("Engine disposed")
 
 
 session_manager = SessionManager(
     database_url=config.database.URL.url,
+    reader_urls=[reader.url for reader in config.database.readers],
+    reader_strategy=config.database.readerStrategy,
+    sticky_for=config.database.stickySeconds,
+    sqlite=config.database.sqlite,
     pool_size=config.database.poolSize,
     max_overflow=config.database.maxOverflow,
     pool_timeout=config.database.poolTimeout,
@@ -0,0 +1,40 @@
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from core.settings import SQLiteSettings
+
+
+def is_file_database(url) -> bool:
+    url = make_url(url)
+    return url.get_backend_name() == "sqlite" and url.database not in (
+        None,
+        "",
+        ":memory:",
+    )
+
+
+def pragmas(settings: SQLiteSettings) -> dict[str, object]:
+    return {
+        "journal_mode": settings.journalMode,
+        "synchronous": settings.synchronous,
+        "busy_timeout": settings.busyTimeout,
+        "mmap_size": settings.mmapSize,
+        "cache_size": settings.cacheSize,
+        "foreign_keys": "ON" if settings.foreignKeys else "OFF",
+    }
+
+
+def apply_pragmas(
+    engine: AsyncEngine, values: dict[str, object], query_only: bool = False
+) -> None:
+    statements = [f"PRAGMA {name} = {value}" for name, value in values.items()]
+    if query_only:
+        statements.append("PRAGMA query_only = ON")
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for statement in statements:
+            cursor.execute(statement)
+        cursor.close()
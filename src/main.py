@@ -2,14 +2,30 @@ import uvicorn
 
 from api import api_router
 from core.app import create_app
-from core.logger import logger_init
+from core.logger import logger_init, production_logger_init
 from core.settings import config
+from database.schema import upgrade_database
 
-logger_init()
+if config.logging.mode == "production":
+    production_logger_init(
+        level=config.logging.level,
+        path=config.logging.path,
+        batch_size=config.logging.batchSize,
+        flush_interval=config.logging.flushInterval,
+        buffer_size=config.logging.bufferSize,
+        rate=config.logging.rateLimit,
+        burst=config.logging.burst,
+        sample_rate=config.logging.sampleRate,
+    )
+else:
+    logger_init(level=config.logging.level)
 app = create_app()
 app.include_router(api_router)
 
 if __name__ == "__main__":
+    if config.development:
+        # Once, before uvicorn starts the workers.
+        upgrade_database(config.database.URL.url)
     uvicorn.run(
         "main:app",
         host=config.uvicorn.host,
@@ -0,0 +1,276 @@
+import asyncio
+import gzip
+import os
+import time
+
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from operator import itemgetter
+from pathlib import Path
+from typing import Optional
+from uuid import UUID
+
+import orjson
+
+from loguru import logger
+
+from core.settings import config
+from database.events import Change, on_commit
+from database.model import Board, Task, UserUsingBoard
+from database.session import current_user_id
+
+_ENTITIES = {Board: "board", Task: "task", UserUsingBoard: "member"}
+_SEGMENT_FORMAT = "%Y%m%dT%H%M%S"
+_SEGMENT_SUFFIX = ".jsonl.gz"
+
+
+def build_record(change: Change, actor: Optional[UUID], ts: float) -> dict:
+    values = change.values
+    if change.model is Board:
+        board_id = values.get("id")
+        entity_id = board_id
+    elif change.model is UserUsingBoard:
+        board_id = values.get("board_id")
+        entity_id = values.get("user_id")
+    else:
+        board_id = values.get("board_id")
+        entity_id = values.get("id")
+
+    if change.op == "update":
+        data = {key: values[key] for key in change.changed if key in values}
+    elif change.op == "insert":
+        data = values
+    else:
+        data = None
+
+    return {
+        "ts": ts,
+        "actor": actor,
+        "op": change.op,
+        "entity": _ENTITIES[change.model],
+        "id": entity_id,
+        "board_id": board_id,
+        "data": data,
+    }
+
+
+def _timestamp(value: Optional[datetime], default: float) -> float:
+    if value is None:
+        return default
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _matches(
+    record: dict,
+    board_id: Optional[str],
+    user_id: Optional[str],
+    since: float,
+    until: float,
+) -> bool:
+    return (
+        since <= record["ts"] < until
+        and (board_id is None or record["board_id"] == board_id)
+        and (user_id is None or record["actor"] == user_id)
+    )
+
+
+class AuditLog:
+    """Write-behind audit trail of board, task and membership changes.
+
+    Committed changes are appended to an in-memory ring and the request
+    moves on; a background task drains the ring every `flush_interval`
+    seconds, or early once it is half full, into gzip members appended to
+    one segment file per `segment_span` of time and worker process. Readers
+    merge the files of a span back into time order.
+
+    Durability: records live only in memory until their flush, so a crash
+    loses at most `flush_interval` seconds of history. `stop()` drains the
+    ring before returning.
+
+    Backpressure: the ring never blocks writers. If the flusher falls
+    behind and the ring fills up, the oldest records are overwritten; the
+    loss is counted in `dropped` and logged on the next flush.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        capacity: int,
+        flush_interval: float,
+        segment_span: timedelta,
+        compress_level: int,
+    ):
+        self.directory = Path(directory)
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.segment_span = segment_span.total_seconds()
+        self.compress_level = compress_level
+        self.dropped = 0
+
+        self._ring: deque[dict] = deque(maxlen=capacity)
+        self._wakeup = asyncio.Event()
+        self._write_lock = asyncio.Lock()
+        self._runner: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._runner is not None and not self._runner.done()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._runner = asyncio.create_task(self._run(), name="audit-flusher")
+
+    async def stop(self) -> None:
+        if self._runner is None:
+            return
+        self._runner.cancel()
+        try:
+            await self._runner
+        except asyncio.CancelledError:
+            pass
+        self._runner = None
+        await self.flush()
+
+    def handle_changes(self, changes: list[Change]) -> None:
+        if not self.running:
+            return
+        actor = current_user_id.get()
+        ts = time.time()
+        for change in changes:
+            if len(self._ring) == self.capacity:
+                self.dropped += 1
+            self._ring.append(build_record(change, actor, ts))
+        if len(self._ring) * 2 >= self.capacity:
+            self._wakeup.set()
+
+    def segment_start(self, ts: float) -> float:
+        return ts - ts % self.segment_span
+
+    def segment_path(self, start: float) -> Path:
+        # Each process appends to a file of its own: buffered writes from
+        # several workers to one file could interleave inside a gzip member.
+        name = datetime.fromtimestamp(start, timezone.utc).strftime(_SEGMENT_FORMAT)
+        return self.directory / f"{name}-{os.getpid()}{_SEGMENT_SUFFIX}"
+
+    def _write(self, segments: dict[float, list[bytes]]) -> None:
+        # Every flush appends a complete gzip member; concatenated members
+        # read back as one stream, so a segment is never rewritten.
+        for start, lines in segments.items():
+            body = gzip.compress(b"".join(lines), self.compress_level)
+            with open(self.segment_path(start), "ab") as segment:
+                segment.write(body)
+
+    async def flush(self) -> None:
+        async with self._write_lock:
+            segments: dict[float, list[bytes]] = {}
+            count = len(self._ring)
+            for _ in range(count):
+                record = self._ring.popleft()
+                line = orjson.dumps(record, default=str) + b"\n"
+                segments.setdefault(self.segment_start(record["ts"]), []).append(line)
+            if segments:
+                await asyncio.to_thread(self._write, segments)
+            if self.dropped:
+                logger.warning(
+                    "Audit ring overflowed, {} records were lost", self.dropped
+                )
+                self.dropped = 0
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception as exc:
+                logger.error("Audit flush failed: {}", exc)
+
+    def _segments_between(self, since: float, until: float) -> list[list[Path]]:
+        spans: dict[float, list[Path]] = {}
+        for path in self.directory.glob(f"*{_SEGMENT_SUFFIX}"):
+            name, _, _ = path.name.removesuffix(_SEGMENT_SUFFIX).partition("-")
+            try:
+                started = datetime.strptime(name, _SEGMENT_FORMAT)
+            except ValueError:
+                continue
+            start = started.replace(tzinfo=timezone.utc).timestamp()
+            if start < until and start + self.segment_span > since:
+                spans.setdefault(start, []).append(path)
+        return [sorted(spans[start]) for start in sorted(spans)]
+
+    def _scan(
+        self,
+        board_id: Optional[str],
+        user_id: Optional[str],
+        since: float,
+        until: float,
+        limit: int,
+    ) -> list[dict]:
+        found = []
+        for paths in self._segments_between(since, until):
+            records = []
+            for path in paths:
+                try:
+                    with gzip.open(path, "rb") as segment:
+                        for line in segment:
+                            record = orjson.loads(line)
+                            if _matches(record, board_id, user_id, since, until):
+                                records.append(record)
+                except EOFError:
+                    # Another worker is still appending its last member.
+                    pass
+            records.sort(key=itemgetter("ts"))
+            found.extend(records[: limit - len(found)])
+            if len(found) >= limit:
+                break
+        return found
+
+    async def query(
+        self,
+        board_id: Optional[UUID] = None,
+        user_id: Optional[UUID] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: int = 100,
+    ) -> list[dict]:
+        board_key = None if board_id is None else str(board_id)
+        user_key = None if user_id is None else str(user_id)
+        start = _timestamp(since, 0.0)
+        end = _timestamp(until, float("inf"))
+
+        # Segments first, then whatever is still waiting in the ring, keeps
+        # the result in commit order.
+        async with self._write_lock:
+            records = await asyncio.to_thread(
+                self._scan, board_key, user_key, start, end, limit
+            )
+            for record in list(self._ring):
+                if len(records) >= limit:
+                    break
+                record = orjson.loads(orjson.dumps(record, default=str))
+                if _matches(record, board_key, user_key, start, end):
+                    records.append(record)
+        return records
+
+
+def create_audit_log() -> AuditLog:
+    settings = config.audit
+    audit_log = AuditLog(
+        directory=settings.directory,
+        capacity=settings.capacity,
+        flush_interval=settings.flushInterval,
+        segment_span=settings.segmentSpan,
+        compress_level=settings.compressLevel,
+    )
+    on_commit(Board, Task, UserUsingBoard)(audit_log.handle_changes)
+    return audit_log
+
+
+audit_log = create_audit_log()
@@ -0,0 +1,91 @@
+from typing import AsyncIterator, Optional
+from uuid import UUID
+
+import orjson
+
+from core.pubsub import Broker, Hub, LocalBroker, Subscription
+from core.settings import config
+from database.events import Change, on_commit
+from database.model import Board, Task, UserUsingBoard
+
+hub = Hub()
+broker: Broker = LocalBroker(hub)
+
+_EVENT_TYPES = {
+    (Task, "insert"): "task.created",
+    (Task, "update"): "task.updated",
+    (Task, "delete"): "task.deleted",
+    (UserUsingBoard, "insert"): "member.added",
+    (UserUsingBoard, "update"): "member.updated",
+    (UserUsingBoard, "delete"): "member.removed",
+    (Board, "update"): "board.updated",
+    (Board, "delete"): "board.deleted",
+}
+
+
+def build_event(change: Change) -> Optional[tuple[UUID, dict]]:
+    event_type = _EVENT_TYPES.get((change.model, change.op))
+    if event_type is None:
+        return None
+
+    values = change.values
+    if change.model is Board:
+        board_id = values.get("id")
+        event = {"type": event_type, "board_id": board_id}
+    elif change.model is UserUsingBoard:
+        board_id = values.get("board_id")
+        event = {
+            "type": event_type,
+            "board_id": board_id,
+            "user_id": values.get("user_id"),
+        }
+        if change.op != "delete":
+            event["role"] = values.get("role")
+        return board_id, event
+    else:
+        board_id = values.get("board_id")
+        event = {"type": event_type, "board_id": board_id, "id": values.get("id")}
+
+    if change.op == "insert":
+        fields = values.keys() - {"id", "board_id"}
+    elif change.op == "update":
+        fields = change.changed
+    else:
+        fields = ()
+    if fields:
+        event["data"] = {key: values[key] for key in fields if key in values}
+    return board_id, event
+
+
+@on_commit(Board, Task, UserUsingBoard)
+def publish_changes(changes: list[Change]) -> None:
+    for change in changes:
+        built = build_event(change)
+        if built is not None and built[0] is not None:
+            board_id, event = built
+            broker.publish(board_id, orjson.dumps(event))
+
+
+def subscribe(board_ids: list[UUID]) -> Subscription:
+    return hub.subscribe(board_ids, maxsize=config.feed.queueSize)
+
+
+async def board_events(
+    subscription: Subscription, user_id: UUID
+) -> AsyncIterator[Optional[bytes]]:
+    """Yields raw events, or None after `feed.keepAlive` seconds of silence.
+
+    Boards the user is removed from, or that are deleted, are unsubscribed
+    after their final event; the iterator ends when no boards are left.
+    """
+    while subscription.topics:
+        message = await subscription.get(timeout=config.feed.keepAlive)
+        yield message
+        if message is None:
+            continue
+
+        event = orjson.loads(message)
+        if event["type"] == "board.deleted" or (
+            event["type"] == "member.removed" and event["user_id"] == str(user_id)
+        ):
+            subscription.unsubscribe(UUID(event["board_id"]))
@@ -0,0 +1,475 @@
+import asyncio
+import fcntl
+import heapq
+import urllib.request
+
+from contextlib import AbstractAsyncContextManager
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Optional, Protocol
+from uuid import UUID
+
+import orjson
+
+from loguru import logger
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.settings import config
+from database.events import Change, on_commit
+from database.model import Status, Task
+
+_TASK_COLUMNS = (
+    Task.id,
+    Task.board_id,
+    Task.title,
+    Task.deadline,
+    Task.assigned_user_id,
+)
+
+# A task stamped just before a sync pass can commit just after it, so each
+# pass re-reads a little of the previous one. Applying a row twice is a no-op.
+_SYNC_OVERLAP = timedelta(seconds=5)
+
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+@dataclass(frozen=True, slots=True)
+class DeadlineNotification:
+    task_id: UUID
+    board_id: UUID
+    title: str
+    deadline: datetime
+    assigned_user_id: Optional[UUID] = None
+
+
+class NotificationSink(Protocol):
+    async def send(self, batch: list[DeadlineNotification]) -> None: ...
+
+
+class LogSink:
+    async def send(self, batch: list[DeadlineNotification]) -> None:
+        for notification in batch:
+            logger.info(
+                "Deadline approaching for task {} on board {} at {}",
+                notification.task_id,
+                notification.board_id,
+                notification.deadline,
+            )
+
+
+class WebhookSink:
+    def __init__(self, url: str, timeout: float = 5.0):
+        self.url = url
+        self.timeout = timeout
+
+    def _post(self, body: bytes) -> None:
+        request = urllib.request.Request(
+            self.url,
+            data=body,
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout):
+            pass
+
+    async def send(self, batch: list[DeadlineNotification]) -> None:
+        body = orjson.dumps({"notifications": [asdict(n) for n in batch]})
+        await asyncio.to_thread(self._post, body)
+
+
+class LeaderLock:
+    """Exclusive, non-blocking lock on a file shared by the worker processes.
+
+    The lock belongs to the open file, so it is released when the holder
+    closes it or its process exits, and another worker can take over.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._file = None
+
+    @property
+    def held(self) -> bool:
+        return self._file is not None
+
+    def acquire(self) -> bool:
+        if self._file is not None:
+            return True
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        file = open(self.path, "ab")
+        try:
+            fcntl.flock(file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            file.close()
+            return False
+        self._file = file
+        return True
+
+    def release(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class DeadlineScheduler:
+    """Fires notifications `lead` before each task deadline.
+
+    Only tasks whose deadline falls inside the loaded window live in memory,
+    at most `max_pending` of them. The window is filled by keyset range
+    queries over the Task.deadline index and extended as time moves on;
+    committed task changes adjust the in-memory state directly.
+
+    With a `lock`, only the worker holding it schedules anything. Commits
+    made by the other workers never reach `handle_changes`, so on every pass
+    the leader also reads the tasks updated since the previous one, and
+    checks that a due batch still exists before sending it: deleted rows
+    leave nothing behind to read.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AbstractAsyncContextManager[AsyncSession]],
+        sink: NotificationSink,
+        lead: timedelta,
+        window: timedelta,
+        batch_size: int,
+        max_pending: int,
+        poll_interval: float,
+        lock: Optional[LeaderLock] = None,
+    ):
+        self.session_factory = session_factory
+        self.sink = sink
+        self.lead = lead
+        self.window = window
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self.poll_interval = poll_interval
+        self.lock = lock
+
+        self._heap: list[tuple[datetime, UUID]] = []
+        self._pending: dict[UUID, DeadlineNotification] = {}
+        self._fired: dict[UUID, datetime] = {}
+        self._loaded: Optional[tuple[datetime, UUID]] = None
+        self._loaded_until: Optional[datetime] = None
+        self._synced_at: Optional[datetime] = None
+        self._stale: set[UUID] = set()
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._runner: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._runner is not None and not self._runner.done()
+
+    @property
+    def leading(self) -> bool:
+        return self.running and (self.lock is None or self.lock.held)
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._fired.clear()
+        self._reset()
+        self._stopping = False
+        self._runner = asyncio.create_task(self._run(), name="deadline-scheduler")
+
+    async def stop(self) -> None:
+        if self._runner is None:
+            return
+        # A pass under way is allowed to finish: cancelled mid-query it would
+        # drop its connection, mid-send it would lose or repeat a batch.
+        self._stopping = True
+        self._wakeup.set()
+        await self._runner
+        self._runner = None
+        if self.lock is not None:
+            self.lock.release()
+
+    def _reset(self) -> None:
+        self._heap.clear()
+        self._pending.clear()
+        self._stale.clear()
+        self._loaded = None
+        self._loaded_until = self._synced_at = utcnow()
+
+    def _schedule(self, notification: DeadlineNotification) -> None:
+        current = self._pending.get(notification.task_id)
+        self._pending[notification.task_id] = notification
+        if current is None or current.deadline != notification.deadline:
+            heapq.heappush(self._heap, (notification.deadline, notification.task_id))
+
+    def _unschedule(self, task_id: UUID) -> None:
+        # The heap entry stays behind until it surfaces or `_compact` runs.
+        self._pending.pop(task_id, None)
+
+    def _trim(self) -> None:
+        # Over the cap, the latest deadlines are dropped and the window is
+        # pulled back to the last one kept so `_refill` loads them again.
+        excess = len(self._pending) - self.max_pending
+        if excess <= 0:
+            return
+        latest = heapq.nlargest(
+            excess + 1, ((n.deadline, n.task_id) for n in self._pending.values())
+        )
+        for _, task_id in latest[:-1]:
+            del self._pending[task_id]
+        self._loaded = latest[-1]
+        self._loaded_until = latest[-1][0]
+
+    def _compact(self) -> None:
+        if len(self._heap) > 2 * len(self._pending) + self.batch_size:
+            self._heap = [(n.deadline, n.task_id) for n in self._pending.values()]
+            heapq.heapify(self._heap)
+
+    def _apply(self, task_id: UUID, values: dict) -> None:
+        current = self._pending.get(task_id)
+        if values.get("status") == Status.DONE:
+            self._unschedule(task_id)
+            return
+
+        if "deadline" not in values:
+            if current is not None:
+                fields = {
+                    key: values[key]
+                    for key in ("board_id", "title", "assigned_user_id")
+                    if key in values
+                }
+                self._pending[task_id] = replace(current, **fields)
+            elif "status" in values:
+                # Reopened, but the change does not say when it is due.
+                self._stale.add(task_id)
+            return
+
+        deadline = values["deadline"]
+        if deadline is None or not utcnow() <= deadline <= self._loaded_until:
+            self._unschedule(task_id)
+            return
+        if self._fired.get(task_id) == deadline:
+            return
+
+        self._schedule(
+            DeadlineNotification(
+                task_id=task_id,
+                board_id=values.get("board_id", current and current.board_id),
+                title=values.get("title", current and current.title),
+                deadline=deadline,
+                assigned_user_id=values.get(
+                    "assigned_user_id", current and current.assigned_user_id
+                ),
+            )
+        )
+
+    def handle_changes(self, changes: list[Change]) -> None:
+        if not self.leading:
+            return
+
+        earliest = self._heap[0][0] if self._heap else None
+        for change in changes:
+            if change.op == "delete":
+                self._unschedule(change.values.get("id"))
+            else:
+                self._apply(change.values.get("id"), change.values)
+
+        self._trim()
+        self._compact()
+        if self._stale or (
+            self._heap and (earliest is None or self._heap[0][0] < earliest)
+        ):
+            self._wakeup.set()
+
+    async def _reload(self) -> None:
+        stale, self._stale = self._stale, set()
+        if not stale:
+            return
+        query = select(*_TASK_COLUMNS, Task.status).where(Task.id.in_(stale))
+        async with self.session_factory() as session:
+            rows = (await session.execute(query)).all()
+        for row in rows:
+            self._apply(row.id, row._asdict())
+        self._trim()
+        self._compact()
+
+    async def _sync(self) -> None:
+        # Keyset pages over ix_task_updated_at, starting a little before the
+        # newest updated_at the previous pass saw.
+        after = None
+        while True:
+            query = (
+                select(*_TASK_COLUMNS, Task.status, Task.updated_at)
+                .order_by(Task.updated_at, Task.id)
+                .limit(self.batch_size)
+            )
+            if after is None:
+                query = query.where(Task.updated_at > self._synced_at - _SYNC_OVERLAP)
+            else:
+                updated_at, task_id = after
+                query = query.where(
+                    or_(
+                        Task.updated_at > updated_at,
+                        and_(Task.updated_at == updated_at, Task.id > task_id),
+                    )
+                )
+
+            async with self.session_factory() as session:
+                rows = (await session.execute(query)).all()
+            for row in rows:
+                self._apply(row.id, row._asdict())
+
+            if rows:
+                after = (rows[-1].updated_at, rows[-1].id)
+                self._synced_at = max(self._synced_at, rows[-1].updated_at)
+            if len(rows) < self.batch_size:
+                break
+        self._trim()
+        self._compact()
+
+    async def _confirm(
+        self, batch: list[DeadlineNotification]
+    ) -> list[DeadlineNotification]:
+        query = select(Task.id, Task.deadline).where(
+            Task.id.in_([notification.task_id for notification in batch]),
+            Task.status != Status.DONE,
+        )
+        async with self.session_factory() as session:
+            deadlines = dict((await session.execute(query)).all())
+        return [n for n in batch if deadlines.get(n.task_id) == n.deadline]
+
+    async def _refill(self) -> None:
+        horizon = utcnow() + self.lead + self.window
+        while self._loaded_until < horizon and len(self._pending) < self.max_pending:
+            limit = min(self.batch_size, self.max_pending - len(self._pending))
+            query = (
+                select(*_TASK_COLUMNS)
+                .where(Task.deadline <= horizon, Task.status != Status.DONE)
+                .order_by(Task.deadline, Task.id)
+                .limit(limit)
+            )
+            if self._loaded is None:
+                query = query.where(Task.deadline > self._loaded_until)
+            else:
+                deadline, task_id = self._loaded
+                query = query.where(
+                    or_(
+                        Task.deadline > deadline,
+                        and_(Task.deadline == deadline, Task.id > task_id),
+                    )
+                )
+
+            async with self.session_factory() as session:
+                rows = (await session.execute(query)).all()
+
+            for row in rows:
+                if row.id in self._pending or self._fired.get(row.id) == row.deadline:
+                    continue
+                self._schedule(
+                    DeadlineNotification(
+                        task_id=row.id,
+                        board_id=row.board_id,
+                        title=row.title,
+                        deadline=row.deadline,
+                        assigned_user_id=row.assigned_user_id,
+                    )
+                )
+
+            if len(rows) < limit:
+                self._loaded = None
+                self._loaded_until = horizon
+            else:
+                self._loaded = (rows[-1].deadline, rows[-1].id)
+                self._loaded_until = rows[-1].deadline
+
+    def _pop_due(self) -> list[DeadlineNotification]:
+        due = []
+        now = utcnow()
+        trigger = now + self.lead
+        self._fired = {
+            task_id: deadline
+            for task_id, deadline in self._fired.items()
+            if deadline >= now
+        }
+        while self._heap and len(due) < self.batch_size:
+            deadline, task_id = self._heap[0]
+            if deadline > trigger:
+                break
+            heapq.heappop(self._heap)
+            notification = self._pending.get(task_id)
+            if notification is None or notification.deadline != deadline:
+                continue
+            del self._pending[task_id]
+            self._fired[task_id] = deadline
+            due.append(notification)
+        self._compact()
+        return due
+
+    async def _sleep(self) -> None:
+        timeout = self.poll_interval
+        if self._heap:
+            until_next = self._heap[0][0] - self.lead - utcnow()
+            timeout = max(0.0, min(timeout, until_next.total_seconds()))
+        if self._stopping:
+            return
+        self._wakeup.clear()
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def _claim(self) -> bool:
+        if self.lock is None:
+            return True
+        if not self.lock.held:
+            if not self.lock.acquire():
+                return False
+            logger.info("Deadline scheduler is running in this worker")
+            self._reset()
+        return True
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                if not self._claim():
+                    await self._sleep()
+                    continue
+                if self.lock is not None:
+                    await self._sync()
+                await self._reload()
+                await self._refill()
+                while batch := self._pop_due():
+                    if self.lock is not None:
+                        batch = await self._confirm(batch)
+                    if batch:
+                        await self.sink.send(batch)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.error("Deadline scheduler failed: {}", exc)
+            await self._sleep()
+
+
+def build_sink() -> NotificationSink:
+    if config.notifications.webhookUrl:
+        return WebhookSink(config.notifications.webhookUrl)
+    return LogSink()
+
+
+def create_deadline_scheduler(
+    session_factory: Callable[[], AbstractAsyncContextManager[AsyncSession]],
+) -> DeadlineScheduler:
+    settings = config.notifications
+    shared = config.uvicorn.workers > 1
+    scheduler = DeadlineScheduler(
+        session_factory=session_factory,
+        sink=build_sink(),
+        lead=settings.lead,
+        window=settings.window,
+        batch_size=settings.batchSize,
+        max_pending=settings.maxPending,
+        poll_interval=settings.pollInterval,
+        lock=LeaderLock(settings.lockFile) if shared else None,
+    )
+    on_commit(Task)(scheduler.handle_changes)
+    return scheduler
@@ -2,6 +2,7 @@ import sys
 
 from pathlib import Path
 
+import httpx
 import pytest_asyncio
 
 from faker import Faker
@@ -10,8 +11,13 @@ ROOT = Path(__file__).resolve().parent.parent / "src"
 sys.path.insert(0, str(ROOT))
 
 
+from api import api_router  # noqa: E402
+from core.app import create_app  # noqa: E402
 from database.model import CoreModel  # noqa: E402
-from database.session import SessionManager  # noqa: E402
+from database.session import (  # noqa: E402
+    SessionManager,
+    session_manager as app_session_manager,
+)
 
 
 @pytest_asyncio.fixture(scope="session")
@@ -33,3 +39,47 @@ async def create_database(session_manager: SessionManager):
 @pytest_asyncio.fixture
 async def fake():
     return Faker("ru_RU")
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def app(session_manager):
+    app = create_app()
+    app.include_router(api_router)
+    app.dependency_overrides[app_session_manager.session_scope] = (
+        session_manager.session_scope
+    )
+    app.dependency_overrides[app_session_manager.read_session_scope] = (
+        session_manager.read_session_scope
+    )
+    app.dependency_overrides[app_session_manager.primary_read_session_scope] = (
+        session_manager.primary_read_session_scope
+    )
+    app.dependency_overrides[app_session_manager.read_session_factory] = lambda: (
+        session_manager.read_session
+    )
+    return app
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def client(app):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="https://test") as c:
+        yield c
+
+
+@pytest_asyncio.fixture
+async def sign_in(fake):
+    async def sign_in(client: httpx.AsyncClient) -> dict:
+        password = fake.password()
+        name = f"{fake.user_name()}{fake.random_number(digits=6)}"
+        await client.post(
+            "/api/v1/auth/register",
+            json={"name": name, "email": fake.email(), "password": password},
+        )
+        token = await client.post(
+            "/api/v1/auth/token", data={"username": name, "password": password}
+        )
+        client.headers["Authorization"] = f"Bearer {token.json()['access_token']}"
+        return token.json()
+
+    return sign_in
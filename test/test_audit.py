@@ -0,0 +1,123 @@
+import gzip
+import os
+import time
+
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+
+from database.events import Change
+from database.model import Board, Task
+from services.audit import AuditLog
+
+HOUR = datetime(2030, 1, 1, 12, tzinfo=timezone.utc).timestamp()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def audit(tmp_path):
+    audit = AuditLog(
+        directory=tmp_path / "audit",
+        capacity=100,
+        flush_interval=3600.0,
+        segment_span=timedelta(hours=1),
+        compress_level=6,
+    )
+    audit.start()
+    yield audit
+    await audit.stop()
+
+
+def record_at(monkeypatch, audit: AuditLog, ts: float, *changes: Change) -> None:
+    monkeypatch.setattr(time, "time", lambda: ts)
+    audit.handle_changes(list(changes))
+
+
+def task_change(board_id, title: str) -> Change:
+    values = {"id": str(uuid4()), "board_id": str(board_id), "title": title}
+    return Change("insert", Task, values)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_each_flush_appends_a_gzip_member(audit, monkeypatch):
+    board = uuid4()
+    record_at(monkeypatch, audit, HOUR + 1, task_change(board, "first"))
+    await audit.flush()
+    record_at(monkeypatch, audit, HOUR + 2, task_change(board, "second"))
+    await audit.flush()
+
+    (segment,) = audit.directory.iterdir()
+    assert segment.name == f"20300101T120000-{os.getpid()}.jsonl.gz"
+    assert segment.read_bytes().count(b"\x1f\x8b\x08") == 2
+    with gzip.open(segment, "rb") as stream:
+        assert len(stream.readlines()) == 2
+
+    records = await audit.query(board_id=board)
+    assert [record["data"]["title"] for record in records] == ["first", "second"]
+    assert not (audit.directory / ".gitignore").exists()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_segments_rotate_with_their_span(audit, monkeypatch):
+    board = uuid4()
+    record_at(monkeypatch, audit, HOUR - 1, task_change(board, "before"))
+    record_at(monkeypatch, audit, HOUR + 1, task_change(board, "after"))
+    await audit.flush()
+
+    assert sorted(path.name[:15] for path in audit.directory.iterdir()) == [
+        "20300101T110000",
+        "20300101T120000",
+    ]
+    since = datetime.fromtimestamp(HOUR, timezone.utc)
+    records = await audit.query(board_id=board, since=since)
+    assert [record["data"]["title"] for record in records] == ["after"]
+    records = await audit.query(board_id=board, until=since)
+    assert [record["data"]["title"] for record in records] == ["before"]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_worker_segments_merge_in_time_order(audit, monkeypatch):
+    board = uuid4()
+    record_at(monkeypatch, audit, HOUR + 1, task_change(board, "mine"))
+    record_at(monkeypatch, audit, HOUR + 3, task_change(board, "mine later"))
+    await audit.flush()
+
+    monkeypatch.setattr(os, "getpid", lambda: 1)
+    record_at(monkeypatch, audit, HOUR + 2, task_change(board, "other worker"))
+    await audit.flush()
+
+    assert len(list(audit.directory.iterdir())) == 2
+    records = await audit.query(board_id=board)
+    assert [record["data"]["title"] for record in records] == [
+        "mine",
+        "other worker",
+        "mine later",
+    ]
+    assert len(await audit.query(board_id=board, limit=2)) == 2
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_query_reads_the_ring_after_the_segments(audit, monkeypatch):
+    board, actor = uuid4(), uuid4()
+    record_at(monkeypatch, audit, HOUR + 1, task_change(board, "flushed"))
+    await audit.flush()
+    record_at(monkeypatch, audit, HOUR + 2, task_change(board, "pending"))
+    record_at(monkeypatch, audit, HOUR + 3, Change("delete", Board, {"id": "other"}))
+
+    records = await audit.query(board_id=board)
+    assert [record["data"]["title"] for record in records] == ["flushed", "pending"]
+    assert await audit.query(user_id=actor) == []
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_full_ring_drops_the_oldest_records(audit, monkeypatch):
+    audit.capacity = 2
+    audit._ring = type(audit._ring)(maxlen=2)
+    board = uuid4()
+    for offset, title in enumerate(("one", "two", "three")):
+        record_at(monkeypatch, audit, HOUR + offset, task_change(board, title))
+    assert audit.dropped == 1
+
+    records = await audit.query(board_id=board)
+    assert [record["data"]["title"] for record in records] == ["two", "three"]
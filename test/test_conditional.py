@@ -0,0 +1,85 @@
+import pytest
+import pytest_asyncio
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def board(client, sign_in):
+    await sign_in(client)
+    response = await client.post("/api/v1/board/", params={"title": "etag"})
+    return f"/api/v1/board/{response.json()['board_id']}"
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_board_revalidates_with_its_etag(client, board):
+    first = await client.get(board)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert first.headers["Cache-Control"] == "private, no-cache"
+
+    for if_none_match in (etag, f"W/{etag}", f'"other", {etag}', "*"):
+        response = await client.get(board, headers={"If-None-Match": if_none_match})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+
+    response = await client.get(board, headers={"If-None-Match": '"other"'})
+    assert response.status_code == 200
+    assert response.json() == first.json()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_board_changes_invalidate_its_etag(client, board):
+    etag = (await client.get(board)).headers["ETag"]
+
+    task = (await client.post(f"{board}/tasks", json={"title": "task"})).json()
+    response = await client.get(board, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+    etag = response.headers["ETag"]
+    await client.delete(f"{board}/tasks/{task['id']}")
+    response = await client.get(board, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_if_modified_since_applies_without_if_none_match(client, board):
+    first = await client.get(board)
+    last_modified = first.headers["Last-Modified"]
+
+    response = await client.get(board, headers={"If-Modified-Since": last_modified})
+    assert response.status_code == 304
+
+    response = await client.get(
+        board,
+        headers={"If-Modified-Since": last_modified, "If-None-Match": '"other"'},
+    )
+    assert response.status_code == 200
+
+    response = await client.get(
+        board, headers={"If-Modified-Since": "Thu, 01 Jan 1970 00:00:00 GMT"}
+    )
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_board_list_revalidates_per_page(client, board):
+    first = await client.get("/api/v1/board/", params={"limit": 1})
+    etag = first.headers["ETag"]
+
+    response = await client.get(
+        "/api/v1/board/", params={"limit": 1}, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+
+    response = await client.get(
+        "/api/v1/board/", params={"limit": 2}, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+
+    await client.post("/api/v1/board/", params={"title": "another"})
+    response = await client.get(
+        "/api/v1/board/", params={"limit": 1}, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
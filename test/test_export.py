@@ -0,0 +1,89 @@
+import asyncio
+
+import orjson
+import pytest
+
+from core.settings import ExportSettings, config
+
+
+async def receive_chunks(app, path: str, headers: dict) -> tuple[dict, list[bytes]]:
+    # httpx's ASGITransport buffers the body, so talk ASGI directly to see
+    # the chunks as the app sends them.
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "https",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+        "server": ("test", 443),
+        "client": ("127.0.0.1", 1234),
+    }
+    start, chunks, done = {}, [], asyncio.Event()
+    requested = False
+
+    async def receive():
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            start.update(message)
+            return
+        if message.get("body"):
+            chunks.append(message["body"])
+        if not message.get("more_body"):
+            done.set()
+
+    await app(scope, receive, send)
+    return start, chunks
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_export_requires_authentication(client):
+    response = await client.get("/api/v1/board/export")
+    assert response.status_code == 403
+
+    response = await client.get(
+        "/api/v1/board/export", headers={"Authorization": "Bearer not-a-token"}
+    )
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_export_streams_own_boards_as_ndjson(app, client, sign_in, monkeypatch):
+    await sign_in(client)
+    await client.post("/api/v1/board/", params={"title": "other"})
+
+    await sign_in(client)
+    board_id = (await client.post("/api/v1/board/", params={"title": "mine"})).json()[
+        "board_id"
+    ]
+    for title in ("a", "b", "c"):
+        await client.post(f"/api/v1/board/{board_id}/tasks", json={"title": title})
+
+    monkeypatch.setattr(config, "export", ExportSettings(chunkSize=2))
+    start, chunks = await receive_chunks(
+        app,
+        "/api/v1/board/export",
+        {"Authorization": client.headers["Authorization"]},
+    )
+
+    assert start["status"] == 200
+    assert (b"content-type", b"application/x-ndjson") in start["headers"]
+    # One chunk each for the board and its member, two for the three tasks.
+    assert len(chunks) == 4
+
+    rows = [orjson.loads(line) for line in b"".join(chunks).splitlines()]
+    assert [row["type"] for row in rows] == ["board", "member", "task", "task", "task"]
+    assert rows[0]["title"] == "mine"
+    assert {row["board_id"] for row in rows[1:]} == {board_id}
+    assert sorted(row["title"] for row in rows[2:]) == ["a", "b", "c"]
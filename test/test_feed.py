@@ -0,0 +1,127 @@
+import asyncio
+
+from uuid import UUID, uuid4
+
+import orjson
+import pytest
+import pytest_asyncio
+
+from core.pubsub import Hub
+from services.feed import board_events, broker, subscribe
+
+
+async def next_event(subscription) -> dict:
+    message = await subscription.get(timeout=1.0)
+    assert message is not None
+    return orjson.loads(message)
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def board_id(client, sign_in):
+    await sign_in(client)
+    response = await client.post("/api/v1/board/", params={"title": "feed"})
+    return response.json()["board_id"]
+
+
+def test_slow_subscriber_loses_oldest_events():
+    hub = Hub()
+    subscription = hub.subscribe(["board"], maxsize=2)
+    for message in (b"1", b"2", b"3"):
+        hub.deliver("board", message)
+
+    assert subscription._queue.get_nowait() == b"2"
+    assert subscription._queue.get_nowait() == b"3"
+    assert subscription.dropped == 1
+
+    subscription.close()
+    assert not hub.has_subscribers("board")
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_committed_task_changes_reach_board_subscribers(client, board_id):
+    with subscribe([UUID(board_id)]) as subscription, subscribe([uuid4()]) as other:
+        url = f"/api/v1/board/{board_id}/tasks"
+        task = (await client.post(url, json={"title": "first"})).json()
+        created = await next_event(subscription)
+        assert created["type"] == "task.created"
+        assert created["id"] == task["id"]
+        assert created["data"]["title"] == "first"
+
+        await client.patch(f"{url}/{task['id']}", json={"title": "second"})
+        updated = await next_event(subscription)
+        assert updated["type"] == "task.updated"
+        assert updated["data"] == {"title": "second"}
+
+        await client.delete(f"{url}/{task['id']}")
+        deleted = await next_event(subscription)
+        assert deleted == {
+            "type": "task.deleted",
+            "board_id": board_id,
+            "id": task["id"],
+        }
+
+        assert await other.get(timeout=0.05) is None
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_removed_member_stops_receiving_the_board():
+    board, user = uuid4(), uuid4()
+    subscription = subscribe([board])
+    events = board_events(subscription, user)
+
+    removed = {"type": "member.removed", "board_id": board, "user_id": user}
+    broker.publish(board, orjson.dumps(removed))
+    assert orjson.loads(await events.__anext__())["type"] == "member.removed"
+    with pytest.raises(StopAsyncIteration):
+        await events.__anext__()
+    assert subscription.topics == set()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_feed_rejects_boards_the_user_is_not_on(client, board_id):
+    response = await client.get("/api/v1/feed", params={"board_id": str(uuid4())})
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_server_sent_events_stream_until_disconnect(app, client, board_id):
+    chunks, disconnected = asyncio.Queue(), asyncio.Event()
+    requested = False
+
+    async def receive():
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.body" and message.get("body"):
+            await chunks.put(message["body"])
+
+    token = client.headers["Authorization"].encode()
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "https",
+        "path": "/api/v1/feed",
+        "raw_path": b"/api/v1/feed",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"authorization", token)],
+        "server": ("test", 443),
+        "client": ("127.0.0.1", 1234),
+    }
+    stream = asyncio.create_task(app(scope, receive, send))
+    try:
+        assert await asyncio.wait_for(chunks.get(), 1.0) == b"retry: 3000\n\n"
+        await client.post(f"/api/v1/board/{board_id}/tasks", json={"title": "t"})
+        chunk = await asyncio.wait_for(chunks.get(), 1.0)
+        assert chunk.startswith(b"data: ") and chunk.endswith(b"\n\n")
+        assert orjson.loads(chunk[6:])["type"] == "task.created"
+    finally:
+        disconnected.set()
+        await asyncio.wait_for(stream, 1.0)
@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from sqlalchemy import func, select, text
+from sqlalchemy.exc import InvalidRequestError, OperationalError, TimeoutError
+
+from core.settings import SQLiteSettings
+from database.instrumentation import _STARTED_KEY, WriteQueuePool
+from database.model import Board, CoreModel
+from database.session import SessionManager
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_failed_statement_is_not_left_timing(session_manager):
+    async with session_manager.engine.connect() as conn:
+        with pytest.raises(OperationalError):
+            await conn.execute(text("SELECT * FROM missing_table"))
+        await conn.rollback()
+        await conn.execute(text("SELECT 1"))
+        raw = await conn.get_raw_connection()
+        assert raw.info[_STARTED_KEY] == []
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def file_manager(tmp_path):
+    manager = SessionManager(
+        f"sqlite+aiosqlite:///{tmp_path}/writes.db",
+        sqlite=SQLiteSettings(),
+        pool_timeout=0.2,
+    )
+    async with manager.engine.begin() as conn:
+        await conn.run_sync(CoreModel.metadata.create_all)
+    yield manager
+    await manager.dispose()
+
+
+async def add_board(manager, title: str) -> None:
+    async with manager.session_local() as session:
+        session.add(Board(title=title))
+        await session.commit()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_concurrent_writers_take_turns(file_manager):
+    assert isinstance(file_manager.engine.sync_engine.pool, WriteQueuePool)
+    await asyncio.gather(*(add_board(file_manager, f"b{n}") for n in range(20)))
+
+    async with file_manager.session_local() as session:
+        assert await session.scalar(select(func.count()).select_from(Board)) == 20
+    assert file_manager.engine.sync_engine.pool.checkedout() == 0
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_write_queue_wait_times_out(file_manager):
+    async with file_manager.session_local() as holder:
+        await holder.execute(select(1))
+        with pytest.raises(TimeoutError):
+            await asyncio.create_task(add_board(file_manager, "late"))
+    await add_board(file_manager, "after")
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_second_writer_in_same_task_fails_fast(file_manager):
+    async with file_manager.session_local() as outer:
+        await outer.execute(select(1))
+        with pytest.raises(InvalidRequestError):
+            await add_board(file_manager, "nested")
+    await add_board(file_manager, "after")
@@ -0,0 +1,130 @@
+import sqlite3
+
+from uuid import UUID
+
+import pytest
+import pytest_asyncio
+
+from alembic.autogenerate import compare_metadata
+from alembic.operations import Operations
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.v1.search.service import task_search_query
+from database.model import Board, CoreModel, Role, Task, User, UserUsingBoard
+from database.schema import (
+    SCHEMA_REVISION,
+    SchemaOutOfDate,
+    alembic_config,
+    check_schema,
+    upgrade_database,
+    upgrade_schema,
+)
+from database.search import include_object, parse_terms, restore_search_triggers
+from database.session import SessionManager
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def empty_database(tmp_path):
+    manager = SessionManager(f"sqlite+aiosqlite:///{tmp_path}/migrations.db")
+    yield manager.engine
+    await manager.dispose()
+
+
+def test_schema_revision_is_head():
+    script = ScriptDirectory.from_config(alembic_config())
+    assert script.get_current_head() == SCHEMA_REVISION
+
+
+def test_upgrade_database_outside_the_app(tmp_path):
+    upgrade_database(f"sqlite+aiosqlite:///{tmp_path}/launcher.db")
+    with sqlite3.connect(tmp_path / "launcher.db") as conn:
+        (revision,) = conn.execute("SELECT version_num FROM alembic_version").fetchone()
+    assert revision == SCHEMA_REVISION
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_check_fails_before_upgrade(empty_database):
+    with pytest.raises(SchemaOutOfDate):
+        await check_schema(empty_database)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_upgrade_matches_models(empty_database):
+    await upgrade_schema(empty_database)
+    await check_schema(empty_database)
+
+    def diff(connection):
+        context = MigrationContext.configure(
+            connection, opts={"include_object": include_object}
+        )
+        return compare_metadata(context, CoreModel.metadata)
+
+    async with empty_database.connect() as conn:
+        assert await conn.run_sync(diff) == []
+
+
+async def seed_board(engine) -> tuple[UUID, UUID]:
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        user = User(name="owner", email="owner@example.com", password_hash="-")
+        board = Board(title="board")
+        session.add_all([user, board])
+        await session.flush()
+        session.add(UserUsingBoard(user_id=user.id, board_id=board.id, role=Role.ADMIN))
+        await session.commit()
+        return user.id, board.id
+
+
+async def add_tasks(engine, board_id: UUID, titles: list[str]) -> None:
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        session.add_all(Task(board_id=board_id, title=title) for title in titles)
+        await session.commit()
+
+
+async def search_titles(engine, user_id: UUID, text: str) -> list[str]:
+    query = task_search_query("sqlite", parse_terms(text), user_id, 10)
+    async with engine.connect() as conn:
+        return sorted(row.title for row in await conn.execute(query))
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_search_index_moves_to_stable_key(empty_database):
+    await upgrade_schema(empty_database, "0002")
+    user_id, board_id = await seed_board(empty_database)
+    await add_tasks(empty_database, board_id, ["alpha one", "beta two"])
+    await upgrade_schema(empty_database)
+
+    assert await search_titles(empty_database, user_id, "alpha") == ["alpha one"]
+    await add_tasks(empty_database, board_id, ["alpha three"])
+    assert await search_titles(empty_database, user_id, "alpha") == [
+        "alpha one",
+        "alpha three",
+    ]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_search_survives_batch_migration(empty_database):
+    await upgrade_schema(empty_database)
+    user_id, board_id = await seed_board(empty_database)
+    await add_tasks(empty_database, board_id, ["gone", "alpha one", "beta two"])
+    async with empty_database.begin() as conn:
+        await conn.execute(Task.__table__.delete().where(Task.title == "gone"))
+
+    def rebuild_task_table(connection):
+        # What a batch_alter_table("task") in a revision does on SQLite,
+        # followed by the step env.py runs after every upgrade to head.
+        operations = Operations(MigrationContext.configure(connection))
+        with operations.batch_alter_table("task", recreate="always"):
+            pass
+        restore_search_triggers(connection)
+
+    async with empty_database.begin() as conn:
+        await conn.run_sync(rebuild_task_table)
+
+    assert await search_titles(empty_database, user_id, "beta") == ["beta two"]
+    await add_tasks(empty_database, board_id, ["beta three"])
+    assert await search_titles(empty_database, user_id, "beta") == [
+        "beta three",
+        "beta two",
+    ]
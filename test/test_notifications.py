@@ -0,0 +1,189 @@
+import asyncio
+
+from datetime import timedelta
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+
+from database.events import Change
+from database.model import Board, Status, Task
+from services.notifications import DeadlineScheduler, LeaderLock, utcnow
+
+
+class RecordingSink:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, batch):
+        self.sent.extend(batch)
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def scheduler(session_manager):
+    scheduler = DeadlineScheduler(
+        session_factory=session_manager.read_session,
+        sink=RecordingSink(),
+        lead=timedelta(minutes=1),
+        window=timedelta(hours=1),
+        batch_size=4,
+        max_pending=3,
+        poll_interval=3600,
+    )
+    scheduler.start()
+    await scheduler._refill()
+    yield scheduler
+    await scheduler.stop()
+
+
+async def add_task(session_manager, **values):
+    async with session_manager.session_local() as session:
+        board = Board(title="board")
+        session.add(board)
+        await session.flush()
+        task = Task(board_id=board.id, title="task", **values)
+        session.add(task)
+        await session.commit()
+        return task.id
+
+
+async def set_task(session_manager, task_id, **values):
+    async with session_manager.session_local() as session:
+        task = await session.get(Task, task_id)
+        if values:
+            for key, value in values.items():
+                setattr(task, key, value)
+        else:
+            await session.delete(task)
+        await session.commit()
+
+
+async def until(predicate):
+    for _ in range(100):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not reached")
+
+
+def upsert(task_id, deadline, op="insert") -> Change:
+    return Change(
+        op,
+        Task,
+        {"id": task_id, "board_id": uuid4(), "title": "task", "deadline": deadline},
+    )
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_pending_tasks_are_capped(scheduler):
+    start = utcnow() + timedelta(minutes=10)
+    ids = [uuid4() for _ in range(5)]
+    scheduler.handle_changes(
+        [upsert(task_id, start + timedelta(minutes=n)) for n, task_id in enumerate(ids)]
+    )
+
+    assert set(scheduler._pending) == set(ids[:3])
+    # The dropped tasks are past the window now, so `_refill` reloads them.
+    assert scheduler._loaded_until == start + timedelta(minutes=2)
+    scheduler.handle_changes([upsert(uuid4(), start + timedelta(minutes=20))])
+    assert set(scheduler._pending) == set(ids[:3])
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_rescheduling_compacts_heap(scheduler):
+    task_id = uuid4()
+    start = utcnow() + timedelta(minutes=10)
+    for n in range(100):
+        scheduler.handle_changes(
+            [upsert(task_id, start + timedelta(seconds=n), op="update")]
+        )
+
+    assert len(scheduler._heap) <= 2 * len(scheduler._pending) + scheduler.batch_size
+    assert scheduler._pending[task_id].deadline == start + timedelta(seconds=99)
+
+    scheduler.handle_changes([upsert(task_id, None, op="delete")])
+    assert scheduler._pending == {}
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_only_lock_holder_schedules(session_manager, tmp_path):
+    holder = LeaderLock(tmp_path / "notifications.lock")
+    assert holder.acquire()
+
+    follower = DeadlineScheduler(
+        session_factory=session_manager.read_session,
+        sink=RecordingSink(),
+        lead=timedelta(minutes=1),
+        window=timedelta(hours=1),
+        batch_size=4,
+        max_pending=3,
+        poll_interval=3600,
+        lock=LeaderLock(tmp_path / "notifications.lock"),
+    )
+    follower.start()
+    try:
+        assert not follower._claim()
+        follower.handle_changes([upsert(uuid4(), utcnow() + timedelta(minutes=5))])
+        assert not follower.leading
+        assert follower._pending == {}
+
+        holder.release()
+        assert follower._claim()
+        assert follower.leading
+    finally:
+        await follower.stop()
+    assert not follower.lock.held
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_reopened_task_is_rescheduled(scheduler, session_manager):
+    deadline = utcnow() + timedelta(minutes=10)
+    task_id = await add_task(session_manager, deadline=deadline, status=Status.DONE)
+    scheduler.handle_changes([Change("update", Task, {"id": task_id})])
+    assert task_id not in scheduler._pending
+
+    # A bulk patch of the status alone carries no deadline.
+    await set_task(session_manager, task_id, status=Status.TODO)
+    scheduler.handle_changes(
+        [Change("update", Task, {"id": task_id, "status": Status.TODO})]
+    )
+    await until(lambda: task_id in scheduler._pending)
+    assert scheduler._pending[task_id].deadline == deadline
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_leader_follows_other_workers_commits(session_manager, tmp_path):
+    leader = DeadlineScheduler(
+        session_factory=session_manager.read_session,
+        sink=RecordingSink(),
+        lead=timedelta(minutes=1),
+        window=timedelta(hours=1),
+        batch_size=2,
+        max_pending=100,
+        poll_interval=3600,
+        lock=LeaderLock(tmp_path / "notifications.lock"),
+    )
+    try:
+        # No runner here: commits of other workers reach the leader through
+        # _sync alone, and the test drives each pass itself.
+        assert leader._claim()
+        await leader._refill()
+        deadline = utcnow() + timedelta(minutes=10)
+        task_ids = [
+            await add_task(session_manager, deadline=deadline + timedelta(seconds=n))
+            for n in range(3)
+        ]
+        await leader._sync()
+        assert set(task_ids) <= set(leader._pending)
+
+        await set_task(session_manager, task_ids[0], status=Status.DONE)
+        await set_task(session_manager, task_ids[1], deadline=deadline)
+        await leader._sync()
+        assert task_ids[0] not in leader._pending
+        assert leader._pending[task_ids[1]].deadline == deadline
+
+        due = [leader._pending[task_ids[2]]]
+        await set_task(session_manager, task_ids[2])
+        assert await leader._confirm(due) == []
+    finally:
+        leader.lock.release()
@@ -0,0 +1,98 @@
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from fastapi import HTTPException
+
+from core.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trips():
+    moment, key = datetime(2026, 1, 2, 3, 4, 5, 678), uuid4()
+    assert decode_cursor(encode_cursor(moment, key), datetime, type(key)) == (
+        moment,
+        key,
+    )
+    assert decode_cursor(encode_cursor(None, key), datetime, type(key)) == (None, key)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "%%%",
+        encode_cursor("not a date", str(uuid4())),
+        encode_cursor("2026-01-02T03:04:05", "not a uuid"),
+        encode_cursor("2026-01-02T03:04:05"),
+    ],
+)
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(HTTPException) as error:
+        decode_cursor(cursor, datetime, type(uuid4()))
+    assert error.value.status_code == 400
+
+
+async def collect_pages(client, url: str, **params) -> list[list[dict]]:
+    pages, cursor = [], None
+    while True:
+        if cursor is not None:
+            params["cursor"] = cursor
+        response = await client.get(url, params=params)
+        assert response.status_code == 200
+        body = response.json()
+        pages.append(body["items"])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_boards_page_without_gaps_or_repeats(client, sign_in):
+    await sign_in(client)
+    created = [
+        (await client.post("/api/v1/board/", params={"title": "same"})).json()[
+            "board_id"
+        ]
+        for _ in range(5)
+    ]
+
+    pages = await collect_pages(client, "/api/v1/board/", limit=2)
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert [board["id"] for page in pages for board in page] == created
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_tasks_page_by_deadline_with_nulls_last(client, sign_in):
+    await sign_in(client)
+    board_id = (await client.post("/api/v1/board/", params={"title": "b"})).json()[
+        "board_id"
+    ]
+    url = f"/api/v1/board/{board_id}/tasks"
+    for title, deadline in [
+        ("none-1", None),
+        ("late", "2030-01-03T00:00:00"),
+        ("none-2", None),
+        ("early", "2030-01-01T00:00:00"),
+        ("middle", "2030-01-02T00:00:00"),
+    ]:
+        await client.post(url, json={"title": title, "deadline": deadline})
+
+    pages = await collect_pages(client, url, limit=2)
+    titles = [task["title"] for page in pages for task in page]
+    assert titles[:3] == ["early", "middle", "late"]
+    assert sorted(titles[3:]) == ["none-1", "none-2"]
+
+    pages = await collect_pages(client, url, limit=2, order="desc")
+    assert [task["title"] for page in pages for task in page] == titles[::-1]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_bad_cursor_is_a_client_error(client, sign_in):
+    await sign_in(client)
+    board_id = (await client.post("/api/v1/board/", params={"title": "b"})).json()[
+        "board_id"
+    ]
+    for url in ("/api/v1/board/", f"/api/v1/board/{board_id}/tasks"):
+        response = await client.get(url, params={"cursor": "garbage"})
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid pagination cursor"
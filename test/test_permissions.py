@@ -0,0 +1,71 @@
+import pytest
+import pytest_asyncio
+
+from sqlalchemy import event
+
+from api.v1.board.permissions import lookup_role, role_index
+from database.model import Board, Role, User, UserUsingBoard
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def membership(session_manager, fake):
+    role_index.clear()
+    async with session_manager.session_local() as session:
+        user = User(name=fake.user_name(), email=fake.email(), password_hash="-")
+        board = Board(title=fake.word())
+        session.add_all([user, board])
+        await session.flush()
+        session.add(UserUsingBoard(user_id=user.id, board_id=board.id, role=Role.ADMIN))
+        await session.commit()
+        return user.id, board.id
+
+
+@pytest.fixture
+def statements(session_manager):
+    executed = []
+
+    def count(*args):
+        executed.append(args[2])
+
+    event.listen(session_manager.engine.sync_engine, "before_cursor_execute", count)
+    yield executed
+    event.remove(session_manager.engine.sync_engine, "before_cursor_execute", count)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_warm_lookup_runs_no_query(session_manager, membership, statements):
+    user_id, board_id = membership
+    async with session_manager.session_local() as session:
+        assert await lookup_role(user_id, board_id, session) == Role.ADMIN
+        assert await lookup_role(user_id, board_id, session) == Role.ADMIN
+    assert len(statements) == 1
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_membership_changes_invalidate(session_manager, membership):
+    user_id, board_id = membership
+    async with session_manager.session_local() as session:
+        assert await lookup_role(user_id, board_id, session) == Role.ADMIN
+
+        link = await session.get(UserUsingBoard, (user_id, board_id))
+        link.role = Role.USER
+        await session.commit()
+        assert await lookup_role(user_id, board_id, session) == Role.USER
+
+        await session.delete(link)
+        await session.commit()
+        assert await lookup_role(user_id, board_id, session) is None
+
+        session.add(UserUsingBoard(user_id=user_id, board_id=board_id, role=Role.ADMIN))
+        await session.commit()
+        assert await lookup_role(user_id, board_id, session) == Role.ADMIN
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_board_delete_drops_cascaded_roles(session_manager, membership):
+    user_id, board_id = membership
+    async with session_manager.session_local() as session:
+        assert await lookup_role(user_id, board_id, session) == Role.ADMIN
+        await session.delete(await session.get(Board, board_id))
+        await session.commit()
+    assert (user_id, board_id) not in role_index
@@ -0,0 +1,112 @@
+import httpx
+import pytest
+import pytest_asyncio
+
+from fastapi import Depends, FastAPI
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.profiler import (
+    QueryBudgetExceeded,
+    QueryProfilerMiddleware,
+    query_budget,
+    query_profiler,
+    statement_shape,
+)
+from database.model import Board
+
+
+@pytest.fixture
+def strict_profiler(monkeypatch):
+    monkeypatch.setattr(query_profiler, "enabled", True)
+    monkeypatch.setattr(query_profiler, "strict", True)
+    monkeypatch.setattr(query_profiler, "routes", {})
+    return query_profiler
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def toy_client(session_manager, strict_profiler):
+    app = FastAPI()
+    app.add_middleware(QueryProfilerMiddleware, profiler=strict_profiler)
+
+    @app.get("/queries/{count}", dependencies=[query_budget(2)])
+    async def run_queries(
+        count: int,
+        session: AsyncSession = Depends(session_manager.read_session_scope),
+    ):
+        for _ in range(count):
+            await session.execute(select(Board.id).limit(1))
+        return {"count": count}
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="https://test") as c:
+        yield c
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def api_client(app, strict_profiler):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="https://test") as c:
+        yield c
+
+
+def test_statement_shape_folds_in_lists():
+    short = "SELECT id FROM task\n WHERE board_id IN (?, ?)"
+    long = "SELECT id FROM task WHERE board_id IN (?, ?, ?, ?)"
+    assert statement_shape(short) == statement_shape(long)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_route_within_budget(toy_client):
+    response = await toy_client.get("/queries/2")
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_route_over_budget_fails(toy_client):
+    with pytest.raises(QueryBudgetExceeded):
+        await toy_client.get("/queries/3")
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_repeated_statements_are_flagged(toy_client, strict_profiler):
+    strict_profiler.strict = False
+    await toy_client.get("/queries/6")
+    summary = strict_profiler.routes["GET /queries/{count}"]
+    assert summary.over_budget == 1
+    assert list(summary.repeated.values()) == [6]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_board_reads_stay_within_budget(api_client, fake):
+    password = fake.password()
+    name = fake.user_name()
+    await api_client.post(
+        "/api/v1/auth/register",
+        json={"name": name, "email": fake.email(), "password": password},
+    )
+    token = await api_client.post(
+        "/api/v1/auth/token", data={"username": name, "password": password}
+    )
+    headers = {"Authorization": f"Bearer {token.json()['access_token']}"}
+
+    board_ids = []
+    for index in range(3):
+        response = await api_client.post(
+            "/api/v1/board/", params={"title": f"board {index}"}, headers=headers
+        )
+        board_ids.append(response.json()["board_id"])
+        await api_client.post(
+            f"/api/v1/board/{board_ids[-1]}/tasks/bulk",
+            json={"items": [{"title": f"task {n}"} for n in range(10)]},
+            headers=headers,
+        )
+
+    assert (await api_client.get("/api/v1/board/", headers=headers)).is_success
+    for board_id in board_ids:
+        response = await api_client.get(f"/api/v1/board/{board_id}", headers=headers)
+        assert response.is_success
+        response = await api_client.get(
+            f"/api/v1/board/{board_id}/tasks", headers=headers
+        )
+        assert response.is_success
@@ -0,0 +1,24 @@
+import time
+
+from core.response_cache import CachedResponse, MemoryResponseCache
+
+
+def test_entries_expire(monkeypatch):
+    cache = MemoryResponseCache(max_bytes=1024, max_entry_bytes=1024, ttl=5.0)
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    cache.set("key", CachedResponse(b"body"), ["tag"], cache.generation)
+    assert cache.get("key") == CachedResponse(b"body")
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + 5.0)
+    assert cache.get("key") is None
+    assert cache.stats()["bytes"] == 0
+    assert len(cache) == 0
+
+
+def test_invalidation_between_read_and_set_is_not_cached():
+    cache = MemoryResponseCache(max_bytes=1024, max_entry_bytes=1024, ttl=5.0)
+    generation = cache.generation
+    cache.invalidate(["tag"])
+    cache.set("key", CachedResponse(b"body"), ["tag"], generation)
+    assert cache.get("key") is None
@@ -0,0 +1,108 @@
+import pytest
+import pytest_asyncio
+
+from sqlalchemy import update
+
+from api.v1.search.service import task_search_query
+from database.model import Board, Role, Task, User, UserUsingBoard
+from database.search import RANK_DIGITS, parse_terms
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def boards(session_manager, fake):
+    async with session_manager.session_local() as session:
+        owner = User(name=fake.user_name(), email=fake.email(), password_hash="-")
+        stranger = User(name=fake.user_name(), email=fake.email(), password_hash="-")
+        mine, theirs = Board(title="mine"), Board(title="theirs")
+        session.add_all([owner, stranger, mine, theirs])
+        await session.flush()
+        session.add_all(
+            [
+                UserUsingBoard(user_id=owner.id, board_id=mine.id, role=Role.ADMIN),
+                UserUsingBoard(
+                    user_id=stranger.id, board_id=theirs.id, role=Role.ADMIN
+                ),
+                Task(board_id=mine.id, title="Deploy release", description="notes"),
+                Task(board_id=mine.id, title="Write notes", description="deploy docs"),
+                Task(board_id=mine.id, title="Починить деплой", description=None),
+                Task(board_id=theirs.id, title="Deploy secret", description=None),
+            ]
+        )
+        await session.commit()
+        return owner.id, mine.id
+
+
+async def search(session, user_id, text, limit=10, after=None):
+    query = task_search_query("sqlite", parse_terms(text), user_id, limit, after=after)
+    return (await session.execute(query)).all()
+
+
+def test_parse_terms_drops_query_syntax():
+    assert parse_terms('deploy* OR "x" -y NEAR(') == [
+        ("deploy", True),
+        ("OR", False),
+        ("x", False),
+        ("y", False),
+        ("NEAR", False),
+    ]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_ranked_within_member_boards(session_manager, boards):
+    user_id, _ = boards
+    async with session_manager.session_local() as session:
+        rows = await search(session, user_id, "deploy")
+    assert [row.title for row in rows] == ["Deploy release", "Write notes"]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_prefix_terms(session_manager, boards):
+    user_id, _ = boards
+    async with session_manager.session_local() as session:
+        assert [row.title for row in await search(session, user_id, "депл*")] == [
+            "Починить деплой"
+        ]
+        assert await search(session, user_id, "депл") == []
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_keyset_pages(session_manager, boards):
+    user_id, _ = boards
+    async with session_manager.session_local() as session:
+        (first,) = await search(session, user_id, "deploy", limit=1)
+        rest = await search(session, user_id, "deploy", after=(first.rank, first.id))
+    assert [row.title for row in rest] == ["Write notes"]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_cursor_ranks_survive_a_round_trip(session_manager, boards):
+    user_id, _ = boards
+    async with session_manager.session_local() as session:
+        ranked = await search(session, user_id, "deploy notes*")
+        assert all(row.rank == round(row.rank, RANK_DIGITS) for row in ranked)
+
+        paged, after = [], None
+        while page := await search(session, user_id, "deploy notes*", 1, after):
+            (row,) = page
+            paged.append(row.id)
+            after = (float(repr(row.rank)), row.id)
+    assert paged == [row.id for row in ranked]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_index_follows_updates_and_deletes(session_manager, boards):
+    user_id, board_id = boards
+    async with session_manager.session_local() as session:
+        await session.execute(
+            update(Task)
+            .where(Task.board_id == board_id, Task.title == "Write notes")
+            .values(description="changelog")
+        )
+        await session.commit()
+        assert [row.title for row in await search(session, user_id, "deploy")] == [
+            "Deploy release"
+        ]
+
+        await session.execute(Task.__table__.delete().where(Task.board_id == board_id))
+        await session.commit()
+        assert await search(session, user_id, "deploy") == []
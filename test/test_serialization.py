@@ -0,0 +1,84 @@
+from datetime import date, datetime, time
+
+import httpx
+import orjson
+import pytest
+
+from fastapi import APIRouter, FastAPI, status
+from fastapi.routing import APIRoute
+from sqlalchemy import select
+
+from api import api_router
+from api.v1.board.service import TASK_COLUMNS
+from api.v1.task.endpoint import serialize_task_detail
+from core.serialization import JSONRoute, dumps
+from database.model import Board, Task
+
+MOMENT = datetime(2026, 1, 2, 3, 4, 5, 678)
+
+
+def test_dumps_formats_dates_and_times():
+    assert orjson.loads(dumps([MOMENT, MOMENT.date(), MOMENT.time()])) == [
+        "2026-01-02 03:04:05",
+        "2026-01-02",
+        "03:04:05",
+    ]
+
+
+def test_every_api_route_renders_through_json_route():
+    routes = [route for route in api_router.routes if isinstance(route, APIRoute)]
+    assert routes
+    assert all(isinstance(route, JSONRoute) for route in routes)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_plain_return_values_skip_jsonable_encoder():
+    router = APIRouter(route_class=JSONRoute)
+
+    @router.post("/created", status_code=status.HTTP_201_CREATED)
+    async def created():
+        return {"at": MOMENT, "day": date(2026, 1, 2), "time": time(3, 4)}
+
+    @router.get("/sync")
+    def sync():
+        return [MOMENT]
+
+    @router.delete("/gone", status_code=status.HTTP_204_NO_CONTENT)
+    async def gone():
+        return None
+
+    app = FastAPI()
+    app.include_router(router)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="https://test") as c:
+        response = await c.post("/created")
+        assert response.status_code == 201
+        assert response.json() == {
+            "at": "2026-01-02 03:04:05",
+            "day": "2026-01-02",
+            "time": "03:04:00",
+        }
+        assert (await c.get("/sync")).json() == ["2026-01-02 03:04:05"]
+        response = await c.delete("/gone")
+        assert response.status_code == 204
+        assert response.content == b""
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_task_rows_are_read_by_column_name(session_manager):
+    async with session_manager.session_local() as session:
+        board = Board(title="board")
+        session.add(board)
+        await session.flush()
+        task = Task(board_id=board.id, title="task", deadline=MOMENT)
+        session.add(task)
+        await session.commit()
+
+        row = (
+            await session.execute(
+                select(Task.board_id, *reversed(TASK_COLUMNS)).where(Task.id == task.id)
+            )
+        ).one()
+
+    assert serialize_task_detail(row) == serialize_task_detail(task)
+    assert serialize_task_detail(row)["title"] == "task"
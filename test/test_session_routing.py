@@ -0,0 +1,98 @@
+from contextlib import asynccontextmanager
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+
+from sqlalchemy import select
+
+from database.model import Board, CoreModel
+from database.session import SessionManager, current_user_id
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def replicas(tmp_path):
+    managers = []
+
+    async def build(strategy: str = "round_robin", readers: int = 2):
+        names = ["writer", *(f"reader{i}" for i in range(readers))]
+        urls = [f"sqlite+aiosqlite:///{tmp_path}/{name}.db" for name in names]
+        for name, url in zip(names, urls):
+            seed = SessionManager(url)
+            async with seed.engine.begin() as conn:
+                await conn.run_sync(CoreModel.metadata.create_all)
+            async with seed.session_local() as session:
+                session.add(Board(title=name))
+                await session.commit()
+            await seed.dispose()
+
+        manager = SessionManager(urls[0], urls[1:], reader_strategy=strategy)
+        managers.append(manager)
+        return manager
+
+    yield build
+    for manager in managers:
+        await manager.dispose()
+
+
+async def served_by(session) -> str:
+    return await session.scalar(select(Board.title).limit(1))
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_round_robin_rotates_readers(replicas):
+    manager = await replicas("round_robin")
+    served = []
+    for _ in range(4):
+        async with manager.read_session() as session:
+            served.append(await served_by(session))
+    assert served == ["reader0", "reader1", "reader0", "reader1"]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_least_busy_avoids_reader_in_use(replicas):
+    manager = await replicas("least_busy")
+    async with manager.read_session() as first:
+        assert await served_by(first) == "reader0"
+        async with manager.read_session() as second:
+            assert await served_by(second) == "reader1"
+    async with manager.read_session() as session:
+        assert await served_by(session) == "reader0"
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_writer_reads_own_writes(replicas):
+    manager = await replicas()
+    writer, other = uuid4(), uuid4()
+
+    token = current_user_id.set(writer)
+    try:
+        async with asynccontextmanager(manager.session_scope)() as session:
+            session.add(Board(title="new"))
+
+        async with manager.read_session() as session:
+            assert await served_by(session) == "writer"
+    finally:
+        current_user_id.reset(token)
+
+    token = current_user_id.set(other)
+    try:
+        async with manager.read_session() as session:
+            assert await served_by(session) != "writer"
+    finally:
+        current_user_id.reset(token)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_without_readers_reads_use_writer(replicas):
+    manager = await replicas(readers=0)
+    async with manager.read_session() as session:
+        assert await served_by(session) == "writer"
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_primary_read_session_skips_replicas(replicas):
+    manager = await replicas("round_robin")
+    for _ in range(2):
+        async with asynccontextmanager(manager.primary_read_session_scope)() as session:
+            assert await served_by(session) == "writer"
@@ -0,0 +1,63 @@
+import itertools
+
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from api.v1.task.service import TaskFilters, task_list_query
+from database.model import Priority, Status
+from database.session import SessionManager
+
+FILTER_VALUES = {
+    "status": Status.IN_PROGRESS,
+    "priority": Priority.HIGH,
+    "deadline_from": datetime(2025, 1, 1),
+    "deadline_to": datetime(2025, 2, 1),
+}
+COMBINATIONS = [
+    dict(combination)
+    for size in range(len(FILTER_VALUES) + 1)
+    for combination in itertools.combinations(FILTER_VALUES.items(), size)
+]
+
+
+def expected_indexes(filters: dict) -> set[str]:
+    indexes = set()
+    if "status" in filters:
+        indexes.add("ix_task_board_id_status_deadline")
+    if "priority" in filters:
+        indexes.add("ix_task_board_id_priority_deadline")
+    return indexes or {"ix_task_board_id_deadline"}
+
+
+async def query_plan(session_manager: SessionManager, query) -> list[str]:
+    async with session_manager.engine.connect() as conn:
+        compiled = query.compile(
+            dialect=conn.dialect, compile_kwargs={"literal_binds": True}
+        )
+        result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}")
+        return [row.detail for row in result]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.parametrize("order", ["asc", "desc"])
+@pytest.mark.parametrize(
+    "filters", COMBINATIONS, ids=lambda f: "+".join(f) or "board_only"
+)
+async def test_task_filters_use_index(session_manager, filters, order):
+    query = task_list_query(
+        uuid4(),
+        TaskFilters(**{**dict.fromkeys(FILTER_VALUES), **filters, "order": order}),
+        limit=51,
+        after=(datetime(2025, 1, 15), uuid4()),
+    )
+
+    plan = await query_plan(session_manager, query)
+
+    assert not any(step.startswith("SCAN task") for step in plan), plan
+    assert any(
+        step.startswith(f"SEARCH task USING INDEX {index} ")
+        for step in plan
+        for index in expected_indexes(filters)
+    ), plan
@@ -0,0 +1,102 @@
+import pytest
+import pytest_asyncio
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def board(client, sign_in):
+    await sign_in(client)
+    response = await client.post("/api/v1/board/", params={"title": "tasks"})
+    return f"/api/v1/board/{response.json()['board_id']}/tasks"
+
+
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.parametrize("field", ["title", "priority", "status"])
+async def test_patch_rejects_null_for_required_fields(client, board, field):
+    task = (await client.post(board, json={"title": "task"})).json()
+
+    response = await client.patch(f"{board}/{task['id']}", json={field: None})
+    assert response.status_code == 400
+
+    unchanged = (await client.get(board)).json()["items"]
+    assert unchanged == [task]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_bulk_create_reports_each_item(client, board, fake):
+    outsider = fake.uuid4()
+    response = await client.post(
+        f"{board}/bulk",
+        json={"items": [{"title": "a"}, {"title": "b", "assigned_user_id": outsider}]},
+    )
+    results = response.json()["results"]
+    assert [result["status"] for result in results] == ["created", "invalid"]
+    assert len((await client.get(board)).json()["items"]) == 1
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_bulk_patch_reports_each_item(client, board, fake):
+    created = await client.post(
+        f"{board}/bulk", json={"items": [{"title": "a"}, {"title": "b"}]}
+    )
+    first, second = (result["id"] for result in created.json()["results"])
+
+    response = await client.patch(
+        f"{board}/bulk",
+        json={
+            "items": [
+                {"id": first, "status": "done"},
+                {"id": first, "title": "again"},
+                {"id": second, "priority": None},
+                {"id": second, "status": None},
+                {"id": second},
+                {"id": fake.uuid4(), "title": "missing"},
+            ]
+        },
+    )
+    assert response.status_code == 200
+    assert [result["status"] for result in response.json()["results"]] == [
+        "updated",
+        "invalid",
+        "invalid",
+        "invalid",
+        "unchanged",
+        "not_found",
+    ]
+
+    tasks = {task["id"]: task for task in (await client.get(board)).json()["items"]}
+    assert tasks[first]["status"] == "done"
+    assert tasks[second]["priority"] == "medium"
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_bulk_delete_reports_duplicates(client, board, fake):
+    created = await client.post(f"{board}/bulk", json={"items": [{"title": "a"}]})
+    (task_id,) = (result["id"] for result in created.json()["results"])
+
+    response = await client.post(
+        f"{board}/bulk/delete", json={"ids": [task_id, task_id, fake.uuid4()]}
+    )
+    assert [result["status"] for result in response.json()["results"]] == [
+        "deleted",
+        "invalid",
+        "not_found",
+    ]
+    assert (await client.get(board)).json()["items"] == []
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_deadline_filters_compare_in_utc(client, board):
+    task = (
+        await client.post(
+            board, json={"title": "task", "deadline": "2030-01-01T10:00:00+03:00"}
+        )
+    ).json()
+    assert task["deadline"] == "2030-01-01 07:00:00"
+
+    async def listed(**params):
+        return (await client.get(board, params=params)).json()["items"]
+
+    assert await listed(deadline_from="2030-01-01T08:00:00+03:00") == [task]
+    assert await listed(deadline_to="2030-01-01T10:30:00+03:00") == [task]
+    assert await listed(deadline_from="2030-01-01T07:30:00Z") == []
+    assert await listed(deadline_to="2030-01-01T10:00:00+03:00") == []
@@ -0,0 +1,55 @@
+import time
+
+from datetime import timedelta
+
+import jwt
+import pytest
+
+from api.v1.auth.utils import decode_jwt, encode_jwt, token_cache
+
+
+@pytest.fixture
+def decodes(monkeypatch):
+    token_cache.clear()
+    calls = []
+    original = jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls.append(kwargs.get("jwt"))
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(jwt, "decode", counting_decode)
+    return calls
+
+
+def test_verified_payload_is_reused(decodes):
+    token = encode_jwt({"sub": "user"}, timedelta(minutes=5))
+
+    payload = decode_jwt(token)
+    payload["sub"] = "changed"
+    assert decode_jwt(token)["sub"] == "user"
+    assert decodes == [token]
+
+
+def test_cached_payload_expires_with_the_token(decodes, monkeypatch):
+    token = encode_jwt({"sub": "user"}, timedelta(seconds=30))
+    decode_jwt(token)
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 30)
+    decode_jwt(token)
+    assert decodes == [token, token]
+
+
+def test_rejected_tokens_are_not_cached(decodes):
+    expired = encode_jwt({"sub": "user"}, timedelta(seconds=-1))
+    with pytest.raises(jwt.ExpiredSignatureError):
+        decode_jwt(expired)
+
+    header, payload, signature = encode_jwt(
+        {"sub": "user"}, timedelta(minutes=5)
+    ).split(".")
+    forged = ".".join((header, payload, signature[::-1]))
+    with pytest.raises(jwt.InvalidTokenError):
+        decode_jwt(forged)
+    assert len(token_cache) == 0
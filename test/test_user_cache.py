@@ -0,0 +1,55 @@
+import time
+
+from uuid import UUID
+
+import jwt
+import pytest
+
+from api.v1.users.cache import user_cache
+from core.cache import TTLCache
+from database.model import User
+
+
+def test_entries_expire_and_least_recently_used_is_evicted(monkeypatch):
+    cache = TTLCache(maxsize=2, ttl=5.0)
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert "b" not in cache
+    assert cache.get("a") == 1
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + 5.0)
+    assert cache.get("a") is None
+    assert cache.stats()["hits"] == 2
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_user_is_cached_until_it_changes(client, sign_in, session_manager):
+    token = await sign_in(client)
+    user_id = UUID(
+        jwt.decode(token["access_token"], options={"verify_signature": False})["sub"]
+    )
+
+    assert (await client.get("/api/v1/board/")).status_code == 200
+    assert user_cache.get(user_id).id == user_id
+    hits = user_cache.hits
+    assert (await client.get("/api/v1/board/")).status_code == 200
+    assert user_cache.hits > hits
+
+    async with session_manager.session_local() as session:
+        user = await session.get(User, user_id)
+        user.email = "changed@example.com"
+        await session.commit()
+    assert user_id not in user_cache
+
+    assert (await client.get("/api/v1/board/")).status_code == 200
+    assert user_cache.get(user_id).email == "changed@example.com"
+
+    async with session_manager.session_local() as session:
+        await session.delete(await session.get(User, user_id))
+        await session.commit()
+    response = await client.get("/api/v1/board/")
+    assert response.status_code == 401